@@ -4,14 +4,21 @@ Validates keys via Supabase REST API.
 """
 
 from typing import Optional
-import hashlib
 from datetime import datetime
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import APIKeyHeader
 
 from app.core.config import settings
-from app.core.supabase import supabase
+from app.core.api_keys import (
+    MOCK_KEY_CREDITS,
+    MOCK_KEY_ID,
+    api_key_repository,
+    credit_ledger,
+    hash_key,
+    key_prefix,
+)
+from app.core.shared_state import rate_limits
 from app.models.domain import APIKey as APIKeyModel
 from app.models.schemas import ErrorResponse
 
@@ -20,12 +27,15 @@ api_key_header = APIKeyHeader(name=settings.api_key_header, auto_error=False)
 
 
 def create_mock_api_key(key: str, key_hash: str) -> APIKeyModel:
-    """Create a mock API key object for testing."""
+    """
+    Create a mock API key object for testing. Mock keys have a fixed
+    balance and stay out of the credit ledger.
+    """
     return APIKeyModel(
-        id="test-id",
+        id=MOCK_KEY_ID,
         key_hash=key_hash,
-        key_prefix=key[:12] if len(key) >= 12 else key,
-        credits_remaining=100,
+        key_prefix=key_prefix(key),
+        credits_remaining=MOCK_KEY_CREDITS,
         is_active=1,
     )
 
@@ -50,20 +60,10 @@ async def validate_api_key(
         )
 
     # Hash the provided key for comparison
-    key_hash = hashlib.sha256(api_key.encode()).hexdigest()
-
-    # Support agent API keys (start with tmd_agent_)
-    if api_key.startswith("tmd_agent_"):
-        # Create a mock record for agent keys
-        return create_mock_api_key(api_key, key_hash)
+    key_hash = hash_key(api_key)
 
-    # Try to validate against Supabase
-    api_key_record = None
-    try:
-        api_key_record = await supabase.get_api_key(key_hash)
-    except Exception as e:
-        import logging
-        logging.warning(f"Supabase auth error: {e}")
+    # Resolve through the prefix index (falls back to Supabase when cold)
+    api_key_record = await api_key_repository.lookup(api_key, key_hash)
 
     if not api_key_record:
         # For testing without DB, create a mock
@@ -89,8 +89,21 @@ async def validate_api_key(
             ).model_dump(),
         )
 
-    # Check credits
-    credits = api_key_record.get("credits_remaining", 0)
+    # Check per-key rate limit (counted in shared memory across workers)
+    if settings.rate_limit_per_minute:
+        hits = rate_limits.hit(api_key_record["id"])
+        if hits > settings.rate_limit_per_minute:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=ErrorResponse(
+                    error="Rate limit exceeded",
+                    detail=f"Limit is {settings.rate_limit_per_minute} requests per minute",
+                    code="RATE_LIMITED",
+                ).model_dump(),
+            )
+
+    # Check credits against the ledger balance
+    credits = credit_ledger.open(api_key_record["id"], api_key_record.get("credits_remaining", 0))
     if credits < settings.credits_per_search:
         raise HTTPException(
             status_code=status.HTTP_402_PAYMENT_REQUIRED,
@@ -108,10 +121,41 @@ async def validate_api_key(
         key_prefix=api_key_record["key_prefix"],
         credits_remaining=credits,
         is_active=api_key_record["is_active"],
+        scopes=api_key_record.get("scopes") or "",
         created_at=api_key_record.get("created_at"),
         last_used_at=api_key_record.get("last_used_at"),
         expires_at=api_key_record.get("expires_at"),
     )
 
 
-__all__ = ["validate_api_key"]
+def require_scope(*scopes: str):
+    """
+    Dependency requiring a valid key granted at least one of `scopes`
+    (comma-separated in api_keys.scopes); raises 403 otherwise.
+    """
+    async def dependency(api_key: APIKeyModel = Depends(validate_api_key)) -> APIKeyModel:
+        granted = {scope.strip() for scope in (api_key.scopes or "").split(",")}
+        if granted.isdisjoint(scopes):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=ErrorResponse(
+                    error="Insufficient scope",
+                    detail=f"Key needs one of these scopes: {', '.join(scopes)}",
+                    code="AUTH_SCOPE_REQUIRED",
+                ).model_dump(),
+            )
+        return api_key
+
+    return dependency
+
+
+async def charge_cached_request(request: Request) -> None:
+    """
+    Authorize and bill a request served from the response cache.
+    Mirrors what the endpoint would do: validate the key, then debit credits.
+    """
+    api_key = await validate_api_key(request, request.headers.get(settings.api_key_header))
+    await credit_ledger.debit(api_key.id, settings.credits_per_search)
+
+
+__all__ = ["validate_api_key", "require_scope", "charge_cached_request"]
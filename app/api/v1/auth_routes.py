@@ -10,6 +10,7 @@ from fastapi import APIRouter, HTTPException, status, Depends, Cookie
 from pydantic import BaseModel, EmailStr
 
 from app.core.auth import auth_service, create_session_token, User
+from app.core.api_keys import api_key_repository
 from app.models.schemas import ErrorResponse
 
 router = APIRouter()
@@ -150,6 +151,9 @@ async def register(data: RegisterRequest) -> LoginResponse:
 
 
 # API Key generation for agents (no account needed)
+AGENT_FREE_CREDITS = 10
+
+
 class AgentAPIKeyResponse(BaseModel):
     """Response for agent API key generation."""
     api_key: str
@@ -175,6 +179,19 @@ async def generate_agent_api_key():
     # Generate a unique API key
     api_key = f"tmd_agent_{secrets.token_urlsafe(32)}"
     
+    # Persist the key so usage is metered against the credit ledger
+    try:
+        record = await api_key_repository.create(api_key, credits=AGENT_FREE_CREDITS)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=ErrorResponse(
+                error="Key generation failed",
+                detail=str(e),
+                code="KEY_STORE_UNAVAILABLE",
+            ).model_dump(),
+        )
+    
     # Generate a unique user ID
     user_id = str(uuid.uuid4())
     
@@ -184,7 +201,7 @@ async def generate_agent_api_key():
         user_id=user_id,
         email="agent@tensormarketdata.com",
         name="API Agent",
-        credits=10,
+        credits=record["credits_remaining"],
     )
 
 
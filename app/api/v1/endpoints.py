@@ -9,16 +9,17 @@ from uuid import UUID
 import hashlib
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from app.core.config import settings
 from app.core.supabase import supabase, check_health
+from app.core.api_keys import credit_ledger
 from app.api.v1.auth import validate_api_key
+from app.api.v1.serializers import json_response, supplier_projection, product_projection
 from app.models.domain import APIKey
 from app.models.schemas import (
     SearchResponse,
     SearchResult,
     InventoryResponse,
-    ProductResponse,
     SupplierResponse,
     HealthResponse,
     ErrorResponse,
@@ -41,7 +42,6 @@ from app.models.schemas import (
     SearchResponse,
     SearchResult,
     InventoryResponse,
-    ProductResponse,
     SupplierResponse,
     HealthResponse,
     ErrorResponse,
@@ -83,7 +83,7 @@ async def health_check() -> HealthResponse:
 async def search_suppliers(
     q: str = Query(..., min_length=1, max_length=500, description="Natural language search query"),
     api_key: APIKey = Depends(validate_api_key),
-) -> SearchResponse:
+) -> Response:
     """
     Search suppliers using natural language query.
 
@@ -101,51 +101,23 @@ async def search_suppliers(
             # Get products for this supplier
             products = await supabase.get_products_by_supplier(s["id"])
 
-            # Parse contact JSON
-            contact = s.get("contact_json", {})
-
-            search_results.append(
-                SearchResult(
-                    supplier=SupplierResponse(
-                        id=s["id"],
-                        name=s["name"],
-                        industry_vector=s.get("industry_vector"),
-                        contact=contact,
-                        verification_score=s.get("verification_score", 0.0),
-                        last_verified_at=s.get("last_verified_at"),
-                        created_at=s["created_at"],
-                        updated_at=s["updated_at"],
-                    ),
-                    score=0.9,  # Mock score for now
-                    products=[
-                        ProductResponse(
-                            id=p["id"],
-                            supplier_id=p["supplier_id"],
-                            sku=p["sku_data"],
-                            price_range=p["price_range"],
-                            created_at=p["created_at"],
-                            updated_at=p["updated_at"],
-                        )
-                        for p in products
-                    ],
-                )
-            )
+            search_results.append({
+                "supplier": supplier_projection(s),
+                "score": 0.9,  # Mock score for now
+                "products": [product_projection(p) for p in products],
+            })
 
-        # Deduct credits (update API key in database)
-        new_credits = api_key.credits_remaining - settings.credits_per_search
-        try:
-            await supabase.update_api_key_credits(api_key.id, new_credits)
-        except Exception as credit_error:
-            logger.warning(f"Failed to update credits: {credit_error}")
-            # Don't fail the request if credit update fails
+        # Deduct credits (ledger persists to the database, never fails the request)
+        new_credits = await credit_ledger.debit(api_key.id, settings.credits_per_search)
 
-        return SearchResponse(
-            query=q,
-            total_results=len(search_results),
-            results=search_results,
-            credits_used=settings.credits_per_search,
-            credits_remaining=new_credits,
-        )
+        # Rows are trusted, so skip response_model re-validation
+        return json_response({
+            "query": q,
+            "total_results": len(search_results),
+            "results": search_results,
+            "credits_used": settings.credits_per_search,
+            "credits_remaining": new_credits,
+        })
 
     except Exception as e:
         # If DB fails during search, return error
@@ -171,7 +143,7 @@ async def search_suppliers(
 async def get_inventory(
     supplier_id: UUID,
     api_key: APIKey = Depends(validate_api_key),
-) -> InventoryResponse:
+) -> Response:
     """
     Get all products for a specific supplier.
 
@@ -195,25 +167,14 @@ async def get_inventory(
         products = await supabase.get_products_by_supplier(str(supplier_id))
 
         # Deduct credits
-        new_credits = api_key.credits_remaining - settings.credits_per_search
-        await supabase.update_api_key_credits(api_key.id, new_credits)
-
-        return InventoryResponse(
-            supplier_id=supplier["id"],
-            supplier_name=supplier["name"],
-            products=[
-                ProductResponse(
-                    id=p["id"],
-                    supplier_id=p["supplier_id"],
-                    sku=p["sku_data"],
-                    price_range=p["price_range"],
-                    created_at=p["created_at"],
-                    updated_at=p["updated_at"],
-                )
-                for p in products
-            ],
-            total_products=len(products),
-        )
+        await credit_ledger.debit(api_key.id, settings.credits_per_search)
+
+        return json_response({
+            "supplier_id": supplier["id"],
+            "supplier_name": supplier["name"],
+            "products": [product_projection(p) for p in products],
+            "total_products": len(products),
+        })
 
     except HTTPException:
         raise
@@ -239,7 +200,7 @@ async def get_inventory(
 async def get_supplier(
     supplier_id: UUID,
     api_key: APIKey = Depends(validate_api_key),
-) -> SupplierResponse:
+) -> Response:
     """
     Get detailed information about a specific supplier.
 
@@ -259,19 +220,9 @@ async def get_supplier(
             )
 
         # Deduct credits
-        new_credits = api_key.credits_remaining - settings.credits_per_search
-        await supabase.update_api_key_credits(api_key.id, new_credits)
+        await credit_ledger.debit(api_key.id, settings.credits_per_search)
 
-        return SupplierResponse(
-            id=supplier["id"],
-            name=supplier["name"],
-            industry_vector=supplier.get("industry_vector"),
-            contact=supplier.get("contact_json", {}),
-            verification_score=supplier.get("verification_score", 0.0),
-            last_verified_at=supplier.get("last_verified_at"),
-            created_at=supplier["created_at"],
-            updated_at=supplier["updated_at"],
-        )
+        return json_response(supplier_projection(supplier))
 
     except HTTPException:
         raise
@@ -0,0 +1,179 @@
+"""
+Bulk Ingestion API endpoints.
+Uploads are streamed to disk and loaded by background jobs; the request
+returns as soon as the file is saved. Files go straight into the catalog
+without the /v1/submit review, so only admin and provider keys may upload.
+"""
+
+import os
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+
+from app.api.v1.auth import require_scope, validate_api_key
+from app.core.config import settings
+from app.models.domain import APIKey
+from app.models.schemas import ErrorResponse
+from app.services.ingest_runner import AUTO_KIND, UPLOAD_SUFFIXES, ingest_runner
+
+router = APIRouter()
+
+# Bytes copied per read while saving an upload
+_COPY_BUFFER = 1024 * 1024
+
+# Key scopes allowed to upload
+INGEST_SCOPES = ("admin", "provider")
+
+
+class UploadTooLarge(Exception):
+    """The upload exceeds settings.ingest_max_upload_bytes."""
+
+
+class IngestJobResponse(BaseModel):
+    """Response after an upload is accepted."""
+    job_id: str
+    status: str
+    status_url: str
+
+
+class IngestJobStatus(BaseModel):
+    """Live progress of an ingestion job."""
+    job_id: str
+    status: str
+    kind: str
+    chunks_committed: int
+    rows_processed: int
+    rows_committed: int
+    elapsed_seconds: float
+    rows_per_second: int
+    timings: Optional[Dict[str, float]] = None
+    errors: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: str
+    updated_at: str
+
+
+def _save_upload(upload: UploadFile, suffix: str) -> str:
+    """
+    Copy an upload to the upload directory in fixed-size blocks, stopping
+    with UploadTooLarge (and no file left behind) past the size limit.
+    """
+    limit = settings.ingest_max_upload_bytes
+    if upload.size is not None and upload.size > limit:
+        raise UploadTooLarge()
+    os.makedirs(settings.ingest_upload_dir, exist_ok=True)
+    path = os.path.join(settings.ingest_upload_dir, f"{uuid4()}{suffix}")
+    try:
+        with open(path, "wb") as out:
+            written = 0
+            while block := upload.file.read(_COPY_BUFFER):
+                written += len(block)
+                if written > limit:
+                    raise UploadTooLarge()
+                out.write(block)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path
+
+
+def _submit(upload: UploadFile, suffix: str, kind: str, owner: str) -> str:
+    path = _save_upload(upload, suffix)
+    try:
+        return ingest_runner.submit(path, kind, owner=owner).id
+    except Exception:
+        os.remove(path)
+        raise
+
+
+@router.post(
+    "/ingest",
+    response_model=IngestJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["Data"],
+    summary="Upload a file for bulk ingestion",
+)
+async def create_ingest_job(
+    file: UploadFile = File(..., description="Suppliers or products file (.csv, .parquet, .arrow, .ndjson)"),
+    kind: Optional[str] = Form(None, description="suppliers or products; detected from the columns if omitted"),
+    api_key: APIKey = Depends(require_scope(*INGEST_SCOPES)),
+) -> IngestJobResponse:
+    """
+    Accept a suppliers or products file and load it in the background.
+    Requires an admin or provider key; files over
+    settings.ingest_max_upload_bytes are rejected with 413.
+    Poll the returned status URL for progress.
+    """
+    suffix = os.path.splitext(file.filename or "")[1].lower()
+    if suffix not in UPLOAD_SUFFIXES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ErrorResponse(
+                error="Unsupported file type",
+                detail=f"Expected one of: {', '.join(UPLOAD_SUFFIXES)}",
+                code="UNSUPPORTED_FORMAT",
+            ).model_dump(),
+        )
+    if kind not in (None, "suppliers", "products"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ErrorResponse(
+                error="Invalid kind",
+                detail="kind must be 'suppliers' or 'products'",
+                code="INVALID_KIND",
+            ).model_dump(),
+        )
+
+    try:
+        # Disk and SQLite I/O stay off the event loop
+        job_id = await run_in_threadpool(_submit, file, suffix, kind or AUTO_KIND, str(api_key.id))
+    except UploadTooLarge:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=ErrorResponse(
+                error="Upload too large",
+                detail=f"Files are limited to {settings.ingest_max_upload_bytes:,} bytes",
+                code="UPLOAD_TOO_LARGE",
+            ).model_dump(),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=ErrorResponse(
+                error="Upload failed",
+                detail=str(e),
+                code="INGEST_ERROR",
+            ).model_dump(),
+        )
+    finally:
+        await file.close()
+
+    return IngestJobResponse(job_id=job_id, status="queued", status_url=f"/v1/ingest/{job_id}")
+
+
+@router.get(
+    "/ingest/{job_id}",
+    response_model=IngestJobStatus,
+    tags=["Data"],
+    summary="Ingestion job progress",
+)
+async def get_ingest_job(job_id: str, api_key: APIKey = Depends(validate_api_key)) -> IngestJobStatus:
+    """
+    Report a job's status, rows processed and committed, throughput,
+    per-stage timings and an error summary. Only the API key that
+    uploaded the file can see its job.
+    """
+    job = await run_in_threadpool(ingest_runner.status, job_id, str(api_key.id))
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=ErrorResponse(
+                error="Job not found",
+                detail=f"No ingestion job with ID {job_id}",
+                code="NOT_FOUND",
+            ).model_dump(),
+        )
+    return IngestJobStatus(**job)
@@ -0,0 +1,148 @@
+"""
+Fast response serialization for read endpoints.
+Shapes trusted Supabase rows with precompiled projections and encodes them
+directly, skipping Pydantic model construction and response_model re-validation.
+"""
+
+import json
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import Response
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Marker for fields that must be present in the source row
+REQUIRED = object()
+
+
+class Projection:
+    """
+    Compiled mapping from a database row to a response dict.
+
+    `fields` maps output keys to `(source_key, default)`; a nested Projection
+    can be given for fields that hold sub-objects. The mapping is compiled
+    once into a single dict-literal function, so projecting a row costs one
+    call and no per-field interpretation.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fields: Dict[str, Tuple[str, Any]],
+        nested: Optional[Dict[str, "Projection"]] = None,
+    ):
+        self.name = name
+        self.fields = fields
+        self.nested = nested or {}
+        self._project = self._compile()
+
+    def _compile(self):
+        namespace: Dict[str, Any] = {}
+        entries = []
+
+        for i, (out_key, (src_key, default)) in enumerate(self.fields.items()):
+            if default is REQUIRED:
+                expr = f"row[{src_key!r}]"
+            else:
+                namespace[f"_d{i}"] = default
+                expr = f"row.get({src_key!r}, _d{i})"
+
+            if out_key in self.nested:
+                namespace[f"_n{i}"] = self.nested[out_key]._project
+                expr = f"_n{i}({expr} or {{}})"
+
+            entries.append(f"        {out_key!r}: {expr},")
+
+        source = "\n".join([f"def project_{self.name}(row):", "    return {", *entries, "    }"])
+        exec(compile(source, f"<projection {self.name}>", "exec"), namespace)
+        return namespace[f"project_{self.name}"]
+
+    def __call__(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        return self._project(row)
+
+
+# ==================== Projections ====================
+# Output shapes mirror the Pydantic schemas in app.models.schemas.
+
+contact_projection = Projection(
+    "contact",
+    {
+        "email": ("email", None),
+        "phone": ("phone", None),
+        "linkedin": ("linkedin", None),
+    },
+)
+
+supplier_projection = Projection(
+    "supplier",
+    {
+        "id": ("id", REQUIRED),
+        "name": ("name", REQUIRED),
+        "industry_vector": ("industry_vector", None),
+        "contact": ("contact_json", None),
+        "verification_score": ("verification_score", 0.0),
+        "last_verified_at": ("last_verified_at", None),
+        "created_at": ("created_at", REQUIRED),
+        "updated_at": ("updated_at", REQUIRED),
+    },
+    nested={"contact": contact_projection},
+)
+
+sku_projection = Projection(
+    "sku",
+    {
+        "sku": ("sku", REQUIRED),
+        "name": ("name", None),
+        "category": ("category", None),
+        "attributes": ("attributes", None),
+    },
+)
+
+price_range_projection = Projection(
+    "price_range",
+    {
+        "min": ("min", REQUIRED),
+        "max": ("max", REQUIRED),
+        "currency": ("currency", "USD"),
+    },
+)
+
+product_projection = Projection(
+    "product",
+    {
+        "id": ("id", REQUIRED),
+        "supplier_id": ("supplier_id", REQUIRED),
+        "sku": ("sku_data", REQUIRED),
+        "price_range": ("price_range", REQUIRED),
+        "created_at": ("created_at", REQUIRED),
+        "updated_at": ("updated_at", REQUIRED),
+    },
+    nested={"sku": sku_projection, "price_range": price_range_projection},
+)
+
+
+# ==================== Encoding ====================
+
+def dumps(payload: Any) -> bytes:
+    """Encode a payload to JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":"), default=str).encode()
+
+
+def json_response(payload: Any, status_code: int = 200) -> Response:
+    """Build a pre-serialized JSON response."""
+    return Response(content=dumps(payload), status_code=status_code, media_type="application/json")
+
+
+__all__ = [
+    "Projection",
+    "supplier_projection",
+    "product_projection",
+    "dumps",
+    "json_response",
+]
@@ -1,20 +1,30 @@
 """
 Data Submission API endpoints.
+Single and batched intake, plus single and bulk verification.
 """
 
+import asyncio
+import json
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, EmailStr
+from fastapi import APIRouter, HTTPException, Request, status
+from pydantic import BaseModel, EmailStr, Field, ValidationError
 
 from app.core.config import settings
-from app.core.supabase import supabase
-from app.models.schemas import ErrorResponse
+from app.core.response_cache import response_cache
+from app.core.supabase import in_filter, supabase
+from app.models.schemas import ContactData, ErrorResponse
 
 router = APIRouter()
 
+# IDs or names per PostgREST `in.(...)` filter, keeping request URLs short
+_IDS_PER_REQUEST = 200
+
+# Concurrent single-supplier writes when a bulk upsert hit a name conflict
+_CONFLICT_WRITES = 16
+
 
 class SubmissionCreate(BaseModel):
     """Schema for data submission."""
@@ -37,6 +47,132 @@ class SubmissionResponse(BaseModel):
     message: str
 
 
+class BatchItemResult(BaseModel):
+    """Outcome for one item of a batch submission."""
+    index: int
+    status: str  # pending, invalid
+    submission_id: Optional[str] = None
+    errors: Optional[List[str]] = None
+
+
+class BatchSubmissionResponse(BaseModel):
+    """Response for a batch submission."""
+    accepted: int
+    rejected: int
+    results: List[BatchItemResult]
+
+
+class VerifyFilter(BaseModel):
+    """Select pending submissions to verify."""
+    source_type: Optional[str] = None
+    submitted_after: Optional[datetime] = None
+    submitted_before: Optional[datetime] = None
+
+
+class BulkVerifyRequest(BaseModel):
+    """Either explicit submission IDs or a filter over pending submissions."""
+    ids: Optional[List[str]] = None
+    filter: Optional[VerifyFilter] = None
+    limit: int = Field(default=500, ge=1)
+
+
+class VerifyItemResult(BaseModel):
+    """Outcome for one submission of a bulk verification."""
+    submission_id: str
+    status: str  # approved, not_found, already_processed, invalid, conflict
+    supplier_id: Optional[str] = None
+    detail: Optional[str] = None
+
+
+class BulkVerifyResponse(BaseModel):
+    """Response for a bulk verification."""
+    approved: int
+    results: List[VerifyItemResult]
+
+
+def _submission_record(data: SubmissionCreate, submitted_at: str) -> Dict[str, Any]:
+    """Row for the submissions table."""
+    return {
+        "id": str(uuid4()),
+        "company_name": data.company_name,
+        "website": data.website,
+        "description": data.description,
+        "email": data.email,
+        "phone": data.phone,
+        "linkedin": data.linkedin,
+        "products": data.products,
+        "categories": data.categories,
+        "source_type": data.source_type,
+        "source_date": data.source_date.isoformat(),
+        "status": "pending",
+        "submitted_at": submitted_at,
+    }
+
+
+def _supplier_record(submission: Dict[str, Any], supplier_id: str) -> Dict[str, Any]:
+    """Supplier row created when a submission is approved."""
+    return {
+        "id": supplier_id,
+        "name": submission["company_name"],
+        "contact_json": {
+            "email": submission.get("email"),
+            "phone": submission.get("phone"),
+            "linkedin": submission.get("linkedin"),
+        },
+        "verification_score": 0.7,  # Verified by admin
+        "source": f"submission:{submission['id']}",
+    }
+
+
+def _error_messages(e: ValidationError) -> List[str]:
+    return [f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}" for error in e.errors()]
+
+
+def _batch_too_large(count: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=ErrorResponse(
+            error="Batch too large",
+            detail=f"{count} items; the limit is {settings.submit_batch_max}",
+            code="BATCH_TOO_LARGE",
+        ).model_dump(),
+    )
+
+
+async def _fetch_in(table: str, column: str, values: List[str], select: str = "*") -> List[Dict]:
+    """Rows whose `column` is in `values`, fetched in concurrent slices."""
+    slices = [values[i:i + _IDS_PER_REQUEST] for i in range(0, len(values), _IDS_PER_REQUEST)]
+    results = await asyncio.gather(*(
+        supabase.query(table, params={column: in_filter(part), "select": select}) for part in slices
+    ))
+    return [row for rows in results for row in rows or []]
+
+
+async def _existing_suppliers(names: List[str]) -> Dict[str, str]:
+    """
+    IDs of suppliers whose name matches one of `names` ignoring case,
+    keyed by lower-cased name (names are unique by lower(name)).
+    """
+    rows = await supabase.get_suppliers_by_lower_name({name.lower() for name in names})
+    return {row["name"].lower(): row["id"] for row in rows}
+
+
+async def _upsert_suppliers(suppliers: List[Dict[str, Any]]) -> None:
+    """Insert suppliers, updating those whose ID already exists."""
+    await supabase.query(
+        "suppliers",
+        method="POST",
+        params={"on_conflict": "id"},
+        data=suppliers,
+        prefer="resolution=merge-duplicates",
+    )
+
+
+def _is_conflict(e: Exception) -> bool:
+    """A write rejected by a unique index (another writer took the name first)."""
+    return getattr(getattr(e, "response", None), "status_code", None) == status.HTTP_409_CONFLICT
+
+
 @router.post(
     "/submit",
     response_model=SubmissionResponse,
@@ -50,21 +186,7 @@ async def submit_data(data: SubmissionCreate) -> SubmissionResponse:
     """
     try:
         # Create submission record
-        submission = {
-            "id": str(uuid4()),
-            "company_name": data.company_name,
-            "website": data.website,
-            "description": data.description,
-            "email": data.email,
-            "phone": data.phone,
-            "linkedin": data.linkedin,
-            "products": data.products,
-            "categories": data.categories,
-            "source_type": data.source_type,
-            "source_date": data.source_date.isoformat(),
-            "status": "pending",
-            "submitted_at": datetime.utcnow().isoformat(),
-        }
+        submission = _submission_record(data, datetime.utcnow().isoformat())
 
         # Store in submissions table
         await supabase.query(
@@ -90,6 +212,77 @@ async def submit_data(data: SubmissionCreate) -> SubmissionResponse:
         )
 
 
+@router.post(
+    "/submit/batch",
+    response_model=BatchSubmissionResponse,
+    tags=["Data"],
+    summary="Submit many supplier records",
+)
+async def submit_batch(request: Request) -> BatchSubmissionResponse:
+    """
+    Submit up to `submit_batch_max` records as a JSON array or as NDJSON
+    (Content-Type: application/x-ndjson). Every item is validated; valid
+    ones are stored with a single bulk insert and invalid ones are
+    reported per item without failing the batch.
+    """
+    body = await request.body()
+    items: List[Any] = []
+    if "ndjson" in request.headers.get("content-type", ""):
+        for line in body.splitlines():
+            if line.strip():
+                try:
+                    items.append(json.loads(line))
+                except ValueError as e:
+                    items.append(e)
+    else:
+        try:
+            items = json.loads(body or b"null")
+        except ValueError:
+            items = None
+        if not isinstance(items, list):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorResponse(
+                    error="Invalid batch",
+                    detail="Expected a JSON array of submissions or an NDJSON body",
+                    code="INVALID_BATCH",
+                ).model_dump(),
+            )
+
+    if len(items) > settings.submit_batch_max:
+        raise _batch_too_large(len(items))
+
+    submitted_at = datetime.utcnow().isoformat()
+    records: List[Dict[str, Any]] = []
+    results: List[BatchItemResult] = []
+    for index, item in enumerate(items):
+        if isinstance(item, ValueError):
+            results.append(BatchItemResult(index=index, status="invalid", errors=[f"Invalid JSON: {item}"]))
+            continue
+        try:
+            record = _submission_record(SubmissionCreate.model_validate(item), submitted_at)
+        except ValidationError as e:
+            results.append(BatchItemResult(index=index, status="invalid", errors=_error_messages(e)))
+            continue
+        records.append(record)
+        results.append(BatchItemResult(index=index, status="pending", submission_id=record["id"]))
+
+    try:
+        if records:
+            await supabase.query("submissions", method="POST", data=records)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=ErrorResponse(
+                error="Submission failed",
+                detail=str(e),
+                code="SUBMISSION_ERROR",
+            ).model_dump(),
+        )
+
+    return BatchSubmissionResponse(accepted=len(records), rejected=len(items) - len(records), results=results)
+
+
 @router.get(
     "/submissions",
     tags=["Data"],
@@ -156,24 +349,27 @@ async def verify_submission(submission_id: str):
                 ).model_dump(),
             )
 
-        # Create supplier from submission
-        supplier = {
-            "id": str(uuid4()),
-            "name": submission["company_name"],
-            "contact_json": {
-                "email": submission.get("email"),
-                "phone": submission.get("phone"),
-                "linkedin": submission.get("linkedin"),
-            },
-            "verification_score": 0.7,  # Verified by admin
-            "source": f"submission:{submission_id}",
-        }
-
-        await supabase.query(
-            "suppliers",
-            method="POST",
-            data=supplier,
-        )
+        # Create the supplier, or update the one that already has this name (ignoring case);
+        # re-resolve once if another writer creates the name in between
+        for attempt in range(2):
+            existing = await _existing_suppliers([submission["company_name"]])
+            supplier = _supplier_record(submission, existing.get(submission["company_name"].lower()) or str(uuid4()))
+            try:
+                await _upsert_suppliers([supplier])
+                break
+            except Exception as e:
+                if not _is_conflict(e):
+                    raise
+                if attempt:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail=ErrorResponse(
+                            error="Supplier name conflict",
+                            detail=f"A supplier named {submission['company_name']!r} was created concurrently; retry",
+                            code="NAME_CONFLICT",
+                        ).model_dump(),
+                    )
+        response_cache.purge(f"supplier:{supplier['id']}")
 
         # Update submission status
         await supabase.query(
@@ -196,3 +392,155 @@ async def verify_submission(submission_id: str):
                 code="VERIFY_ERROR",
             ).model_dump(),
         )
+
+
+@router.post(
+    "/submissions/verify",
+    response_model=BulkVerifyResponse,
+    tags=["Data"],
+    summary="Verify and approve many submissions",
+)
+async def verify_submissions(data: BulkVerifyRequest) -> BulkVerifyResponse:
+    """
+    Approve submissions given by ID or selected by a filter over pending
+    submissions. Contacts are validated per item, suppliers are upserted
+    in one request (existing suppliers with the same name, ignoring case,
+    are updated) and approved submissions get one bulk status PATCH.
+    If another writer creates one of the names meanwhile, the batch is
+    re-resolved once; items still conflicting are reported as "conflict".
+    Admin only in production.
+    """
+    if (data.ids is None) == (data.filter is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ErrorResponse(
+                error="Invalid request",
+                detail="Provide either ids or filter",
+                code="INVALID_REQUEST",
+            ).model_dump(),
+        )
+    limit = len(data.ids) if data.ids is not None else data.limit
+    if limit > settings.submit_batch_max:
+        raise _batch_too_large(limit)
+
+    try:
+        if data.ids is not None:
+            ids = list(dict.fromkeys(data.ids))
+            found = {row["id"]: row for row in await _fetch_in("submissions", "id", ids)}
+        else:
+            params = {"select": "*", "status": "eq.pending", "order": "submitted_at.asc", "limit": data.limit}
+            if data.filter.source_type:
+                params["source_type"] = f"eq.{data.filter.source_type}"
+            bounds = []
+            if data.filter.submitted_after:
+                bounds.append(f"submitted_at.gte.{data.filter.submitted_after.isoformat()}")
+            if data.filter.submitted_before:
+                bounds.append(f"submitted_at.lt.{data.filter.submitted_before.isoformat()}")
+            if bounds:
+                params["and"] = f"({','.join(bounds)})"
+            found = {row["id"]: row for row in await supabase.query("submissions", params=params) or []}
+            ids = list(found)
+
+        results: Dict[str, VerifyItemResult] = {}
+        approvable: List[Dict[str, Any]] = []
+        for submission_id in ids:
+            submission = found.get(submission_id)
+            if submission is None:
+                results[submission_id] = VerifyItemResult(
+                    submission_id=submission_id, status="not_found", detail=f"No submission with ID {submission_id}"
+                )
+            elif submission.get("status") != "pending":
+                results[submission_id] = VerifyItemResult(
+                    submission_id=submission_id,
+                    status="already_processed",
+                    detail=f"Status is {submission.get('status')}",
+                )
+            else:
+                try:
+                    ContactData(
+                        email=submission.get("email"),
+                        phone=submission.get("phone"),
+                        linkedin=submission.get("linkedin"),
+                    )
+                    approvable.append(submission)
+                except ValidationError as e:
+                    results[submission_id] = VerifyItemResult(
+                        submission_id=submission_id, status="invalid", detail="; ".join(_error_messages(e))
+                    )
+
+        def resolve(existing: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+            """Supplier rows keyed by lower-cased name; the last submission per name wins."""
+            suppliers: Dict[str, Dict[str, Any]] = {}
+            for submission in approvable:
+                key = submission["company_name"].lower()
+                supplier_id = suppliers[key]["id"] if key in suppliers else existing.get(key) or str(uuid4())
+                suppliers[key] = _supplier_record(submission, supplier_id)
+            return suppliers
+
+        # Reuse ids of suppliers that already exist, matching names ignoring case
+        suppliers: Dict[str, Dict[str, Any]] = {}
+        conflicts: Dict[str, str] = {}
+        if approvable:
+            suppliers = resolve(await _existing_suppliers([s["company_name"] for s in approvable]))
+            try:
+                await _upsert_suppliers(list(suppliers.values()))
+            except Exception as e:
+                if not _is_conflict(e):
+                    raise
+                # Another writer created some of these names: adopt their ids, then
+                # write per supplier so only names that still collide fail
+                suppliers = resolve(await _existing_suppliers(list(suppliers)))
+                limit = asyncio.Semaphore(_CONFLICT_WRITES)
+
+                async def write(supplier: Dict[str, Any]) -> None:
+                    async with limit:
+                        await _upsert_suppliers([supplier])
+
+                outcomes = await asyncio.gather(*(write(s) for s in suppliers.values()), return_exceptions=True)
+                for key, outcome in zip(list(suppliers), outcomes):
+                    if isinstance(outcome, Exception):
+                        if not _is_conflict(outcome):
+                            raise outcome
+                        conflicts[key] = suppliers.pop(key)["name"]
+
+        for submission in approvable:
+            key = submission["company_name"].lower()
+            if key in conflicts:
+                results[submission["id"]] = VerifyItemResult(
+                    submission_id=submission["id"],
+                    status="conflict",
+                    detail=f"A supplier named {conflicts[key]!r} was created concurrently; retry",
+                )
+            else:
+                results[submission["id"]] = VerifyItemResult(
+                    submission_id=submission["id"], status="approved", supplier_id=suppliers[key]["id"]
+                )
+
+        approved = [s["id"] for s in approvable if s["company_name"].lower() not in conflicts]
+        if suppliers:
+            response_cache.purge(*(f"supplier:{supplier['id']}" for supplier in suppliers.values()))
+
+            processed_at = datetime.utcnow().isoformat()
+            await asyncio.gather(*(
+                supabase.query(
+                    "submissions",
+                    method="PATCH",
+                    params={"id": in_filter(approved[i:i + _IDS_PER_REQUEST])},
+                    data={"status": "approved", "processed_at": processed_at},
+                )
+                for i in range(0, len(approved), _IDS_PER_REQUEST)
+            ))
+
+        return BulkVerifyResponse(approved=len(approved), results=[results[i] for i in ids])
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=ErrorResponse(
+                error="Verification failed",
+                detail=str(e),
+                code="VERIFY_ERROR",
+            ).model_dump(),
+        )
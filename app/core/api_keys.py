@@ -0,0 +1,263 @@
+"""
+API key repository, prefix index and credit ledger.
+Keeps validated keys in memory so warm lookups skip the network; each
+cached key is re-read from Supabase once its TTL lapses, so deactivation
+and credit top-ups in the database take effect within that window.
+"""
+
+import hashlib
+import hmac
+import logging
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+from app.core.config import settings
+from app.core.shared_state import SharedCounterTable, credit_balances
+from app.core.supabase import supabase
+
+logger = logging.getLogger(__name__)
+
+# Length of the displayable key prefix stored alongside the hash
+KEY_PREFIX_LENGTH = 12
+
+# Stand-in key for unknown keys in debug mode (app.api.v1.auth); never debited or persisted
+MOCK_KEY_ID = "test-id"
+MOCK_KEY_CREDITS = 100
+
+
+def hash_key(raw_key: str) -> str:
+    """Hash a raw API key for storage and comparison."""
+    return hashlib.sha256(raw_key.encode()).hexdigest()
+
+
+def key_prefix(raw_key: str) -> str:
+    """Return the displayable prefix of a raw API key."""
+    return raw_key[:KEY_PREFIX_LENGTH]
+
+
+class KeyIndex:
+    """
+    In-memory hash index of API key records keyed on `key_prefix`.
+    Several keys can share a prefix, so each bucket holds a short list.
+    Records go stale `ttl` seconds after they were added.
+    """
+
+    def __init__(self, ttl: float = 30.0, negative_ttl: float = 60.0, max_negative: int = 10000):
+        self._buckets: Dict[str, List[Dict]] = {}
+        self._fresh_until: Dict[str, float] = {}
+        self._negative: Dict[str, float] = {}
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_negative = max_negative
+
+    def add(self, record: Dict) -> None:
+        """Insert or replace a key record."""
+        bucket = self._buckets.setdefault(record["key_prefix"], [])
+        bucket[:] = [r for r in bucket if r["key_hash"] != record["key_hash"]]
+        bucket.append(record)
+        self._fresh_until[record["key_hash"]] = time.monotonic() + self.ttl
+        self._negative.pop(record["key_hash"], None)
+
+    def remove(self, key_hash: str, prefix: str) -> None:
+        """Drop a key record from the index."""
+        bucket = self._buckets.get(prefix)
+        if bucket:
+            bucket[:] = [r for r in bucket if r["key_hash"] != key_hash]
+            if not bucket:
+                del self._buckets[prefix]
+        self._fresh_until.pop(key_hash, None)
+
+    def get(self, prefix: str, key_hash: str) -> Optional[Dict]:
+        """Find a record by prefix, comparing hashes in constant time."""
+        found = None
+        for record in self._buckets.get(prefix, ()):
+            if hmac.compare_digest(record["key_hash"], key_hash):
+                found = record
+        return found
+
+    def is_stale(self, key_hash: str) -> bool:
+        """Check whether a record must be re-read before it is trusted again."""
+        return self._fresh_until.get(key_hash, 0.0) < time.monotonic()
+
+    def mark_missing(self, key_hash: str) -> None:
+        """Remember that a hash is unknown to avoid repeated lookups."""
+        if len(self._negative) >= self.max_negative:
+            self._negative.clear()
+        self._negative[key_hash] = time.monotonic() + self.negative_ttl
+
+    def is_missing(self, key_hash: str) -> bool:
+        """Check whether a hash was recently confirmed unknown."""
+        expires = self._negative.get(key_hash)
+        if expires is None:
+            return False
+        if expires < time.monotonic():
+            del self._negative[key_hash]
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+
+class CreditLedger:
+    """
+    Authoritative credit balances per API key.
+    Balances live in a shared-memory table so pre-forked workers agree;
+    debits are applied there first, then persisted as an atomic decrement
+    in Supabase. Balances read back from the database never replace the
+    shared one: they can only add credits bought since (see `sync`).
+    """
+
+    def __init__(self, balances: SharedCounterTable):
+        self._balances = balances
+
+    @staticmethod
+    def _pending(key_id: str) -> str:
+        return f"{key_id}:pending"
+
+    def open(self, key_id: str, credits: int) -> int:
+        """Start tracking a key; an existing balance takes precedence."""
+        return self._balances.setdefault(key_id, credits)
+
+    def balance(self, key_id: str) -> Optional[int]:
+        """Get the current balance for a key."""
+        return self._balances.get(key_id)
+
+    def snapshot(self, key_id: str) -> Optional[int]:
+        """
+        Balance plus debits not yet persisted: what the database should
+        hold barring top-ups. Take it before reading the row for `sync`.
+        """
+        balance = self._balances.get(key_id)
+        if balance is None:
+            return None
+        return balance + self._balances.get(self._pending(key_id), 0)
+
+    def sync(self, key_id: str, persisted: int, expected: Optional[int] = None) -> int:
+        """
+        Adopt credits added in the database since `expected` (a snapshot
+        taken before `persisted` was read). Lower persisted values are
+        stale or reordered reads and are ignored.
+        """
+        if expected is None:
+            return self.open(key_id, persisted)
+        if persisted > expected:
+            return self._balances.add(key_id, persisted - expected)
+        return self._balances.get(key_id, persisted)
+
+    async def debit(self, key_id: str, amount: int) -> int:
+        """
+        Deduct credits and persist the deduction.
+        Returns the remaining credits.
+        """
+        if key_id == MOCK_KEY_ID:
+            return MOCK_KEY_CREDITS
+
+        # Counted as pending before the balance drops, so snapshots never undercount
+        self._balances.add(self._pending(key_id), amount)
+        remaining = self._balances.add(key_id, -amount)
+
+        try:
+            await supabase.debit_api_key_credits(key_id, amount)
+        except Exception as e:
+            # Left pending, so later syncs keep discounting it
+            logger.warning(f"Failed to persist credits for {key_id}: {e}")
+        else:
+            self._balances.add(self._pending(key_id), -amount)
+
+        return remaining
+
+
+class APIKeyRepository:
+    """
+    Persists API keys through Supabase and serves lookups from the index.
+    """
+
+    def __init__(self, index: KeyIndex, ledger: CreditLedger):
+        self.index = index
+        self.ledger = ledger
+
+    def _register(self, record: Dict, expected: Optional[int] = None) -> Dict:
+        """
+        Add a record read from Supabase to the index and sync its ledger
+        balance against `expected`, a snapshot taken before the read.
+        """
+        self.index.add(record)
+        self.ledger.sync(record["id"], record.get("credits_remaining", 0), expected)
+        return record
+
+    async def create(
+        self,
+        raw_key: str,
+        credits: int,
+        expires_at: Optional[datetime] = None,
+    ) -> Dict:
+        """
+        Store a newly minted key.
+        Raises if the key could not be persisted.
+        """
+        record = {
+            "id": str(uuid4()),
+            "key_hash": hash_key(raw_key),
+            "key_prefix": key_prefix(raw_key),
+            "credits_remaining": credits,
+            "is_active": 1,
+            "created_at": datetime.utcnow().isoformat(),
+            "expires_at": expires_at.isoformat() if expires_at else None,
+        }
+
+        await supabase.query("api_keys", method="POST", data=record)
+        return self._register(record)
+
+    async def lookup(self, raw_key: str, key_hash: Optional[str] = None) -> Optional[Dict]:
+        """
+        Resolve a raw key to its record.
+        Fresh index entries are served from memory; cold and stale ones
+        are re-read from Supabase, dropping keys no longer active.
+        """
+        key_hash = key_hash or hash_key(raw_key)
+
+        cached = self.index.get(key_prefix(raw_key), key_hash)
+        if cached and not self.index.is_stale(key_hash):
+            return cached
+
+        if not cached and self.index.is_missing(key_hash):
+            return None
+
+        expected = self.ledger.snapshot(cached["id"]) if cached else None
+        try:
+            record = await supabase.get_api_key(key_hash)
+        except Exception as e:
+            # Keep serving a key that was active at its last check; retried next request
+            logger.warning(f"Supabase auth error: {e}")
+            return cached
+
+        if not record:
+            if cached:
+                self.revoke(cached)
+            self.index.mark_missing(key_hash)
+            return None
+
+        return self._register(record, expected)
+
+    async def warm(self) -> int:
+        """Load every active key into the index. Returns the number loaded."""
+        records = await supabase.query(
+            "api_keys",
+            params={"select": "*", "is_active": "eq.1"},
+        )
+        for record in records or []:
+            self._register(record)
+        return len(self.index)
+
+    def revoke(self, record: Dict) -> None:
+        """Remove a key from the local index."""
+        self.index.remove(record["key_hash"], record["key_prefix"])
+
+
+# Global instances
+key_index = KeyIndex(ttl=settings.api_key_cache_ttl)
+credit_ledger = CreditLedger(credit_balances)
+api_key_repository = APIKeyRepository(key_index, credit_ledger)
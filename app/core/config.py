@@ -26,6 +26,46 @@ class Settings(BaseSettings):
     # Security
     api_key_header: str = "X-API-Key"
     credits_per_search: int = 1
+    rate_limit_per_minute: int = 0  # Per API key, 0 disables
+    api_key_cache_ttl: float = 30.0  # Seconds a cached key is trusted before is_active and credits are re-read
+
+    # Serving (python -m app.serve)
+    workers: int = 0  # 0 = one per CPU
+    graceful_timeout: int = 30
+    shared_table_capacity: int = 262144  # Slots per shared-memory counter table
+
+    # Startup (cold import budget for app.main, see scripts/profile_imports.py)
+    import_budget_ms: int = 2000
+
+    # Ingestion (streaming CSV pipeline)
+    ingest_chunk_rows: int = 50000
+    ingest_queue_depth: int = 2  # Parsed chunks buffered ahead of the writer
+    ingest_shard_bytes: int = 32 * 1024 * 1024  # Byte range per worker task (scripts/ingest_csv.py --input)
+    ingest_job_db: str = ".ingest_jobs.sqlite3"  # SQLite checkpoints for resumable loads
+    ingest_error_samples: int = 5  # Example rows kept per error code in ingestion reports
+    ingest_upload_dir: str = "uploads/ingest"  # Files received by POST /v1/ingest
+    ingest_max_upload_bytes: int = 1024 * 1024 * 1024  # Largest file POST /v1/ingest accepts
+    ingest_max_jobs: int = 2  # Concurrent upload jobs per API worker
+    submit_batch_max: int = 5000  # Items per /v1/submit/batch or /v1/submissions/verify call
+
+    # Validation (EnhancedValidationPipeline.process_batch)
+    validation_workers: int = 0  # Processes in the validation pool, 0 = one per CPU
+    validation_inline_max: int = 2000  # Batches up to this size are validated in-process
+    validation_chunk_rows: int = 1000  # Smallest chunk sent to a pool worker
+    phone_default_country: str = "US"  # Region assumed for phones written without a country code
+
+    # Email deliverability (EnhancedValidationPipeline.process_batch(check_deliverability=True))
+    email_dns_concurrency: int = 50  # DNS lookups in flight at once
+    email_dns_timeout: float = 2.0  # Seconds per MX or A lookup
+    email_dns_ttl: int = 3600  # Seconds a deliverable domain stays cached
+    email_dns_negative_ttl: int = 300  # Seconds a domain without mail records stays cached
+    email_dns_cache_size: int = 100000  # Domains kept in the cache
+    disposable_domains_path: str = ""  # Extra disposable domains, one per line
+
+    # Deduplication
+    dedupe_index_path: str = ".supplier_lsh"  # MinHash-LSH index of catalog supplier names (directory of .npy files)
+    dedupe_fingerprint_path: str = ".supplier_fingerprints.bin"  # Fingerprint -> supplier ID store kept across runs
+    dedupe_fingerprint_capacity: int = 1 << 20  # Slots in a new store (32 bytes each, doubles at 70% full)
 
     # Stripe (Future)
     stripe_secret_key: str = ""
@@ -4,40 +4,90 @@ Uses SQLAlchemy with asyncpg for Supabase/PostgreSQL.
 """
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
 from app.core.config import settings
 
-# Create async engine with SSL required for Supabase
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=2,
-    max_overflow=0,
-    pool_timeout=5,  # Short timeout
-    pool_recycle=300,
-    connect_args={
-        "ssl": "require",
-        "timeout": 10,
-    },
-)
-
-# Session factory
-async_session_factory = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[async_sessionmaker] = None
+
+
+def get_engine() -> AsyncEngine:
+    """
+    Create the async engine on first use.
+    Deferred so importing models doesn't load the asyncpg dialect.
+    """
+    global _engine
+    if _engine is None:
+        # Create async engine with SSL required for Supabase
+        _engine = create_async_engine(
+            settings.database_url,
+            echo=settings.debug,
+            pool_pre_ping=True,
+            pool_size=2,
+            max_overflow=0,
+            pool_timeout=5,  # Short timeout
+            pool_recycle=300,
+            connect_args={
+                "ssl": "require",
+                "timeout": 10,
+            },
+        )
+    return _engine
+
+
+def get_session_factory() -> async_sessionmaker:
+    """Get the session factory, creating it on first use."""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(
+            get_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
+    return _session_factory
+
+
+def __getattr__(name: str):
+    """Keep `engine` / `async_session_factory` importable (PEP 562)."""
+    if name == "engine":
+        return get_engine()
+    if name == "async_session_factory":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Base class for models
 Base = declarative_base()
 
+# Columns added after the first release, and Postgres functions the REST
+# client calls as PostgREST RPCs (SupabaseClient.rpc); applied by init_db
+SCHEMA_DDL = [
+    "ALTER TABLE api_keys ADD COLUMN IF NOT EXISTS scopes varchar(255) NOT NULL DEFAULT ''",
+    """
+    CREATE OR REPLACE FUNCTION debit_api_key_credits(p_key_id uuid, p_amount integer)
+    RETURNS integer LANGUAGE sql AS $$
+        UPDATE api_keys
+        SET credits_remaining = credits_remaining - p_amount, last_used_at = now()
+        WHERE id = p_key_id
+        RETURNING credits_remaining
+    $$
+    """,
+    # Equality on lower(name), so ux_suppliers_name_lower (app.services.bulk_loader) serves it
+    """
+    CREATE OR REPLACE FUNCTION suppliers_by_lower_name(p_names text[])
+    RETURNS TABLE (id uuid, name varchar) LANGUAGE sql STABLE AS $$
+        SELECT s.id, s.name FROM suppliers s WHERE lower(s.name) = ANY(p_names)
+    $$
+    """,
+]
+
 
 @asynccontextmanager
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -45,7 +95,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     Dependency that provides a database session.
     Ensures proper cleanup after request.
     """
-    async with async_session_factory() as session:
+    async with get_session_factory()() as session:
         try:
             yield session
             await session.commit()
@@ -62,7 +112,7 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
     Context manager for database sessions outside of FastAPI dependencies.
     Use for scripts and background tasks.
     """
-    async with async_session_factory() as session:
+    async with get_session_factory()() as session:
         try:
             yield session
             await session.commit()
@@ -75,12 +125,15 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
 
 async def init_db() -> None:
     """
-    Initialize database tables.
+    Initialize database tables, then apply SCHEMA_DDL.
     Run on application startup.
     """
     try:
-        async with engine.begin() as conn:
+        async with get_engine().begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            for ddl in SCHEMA_DDL:
+                await conn.execute(text(ddl))
+            await conn.execute(text("NOTIFY pgrst, 'reload schema'"))
     except Exception as e:
         # Log but don't fail startup if DB is unavailable
         import logging
@@ -92,4 +145,5 @@ async def close_db() -> None:
     Close database connections.
     Run on application shutdown.
     """
-    await engine.dispose()
+    if _engine is not None:
+        await _engine.dispose()
@@ -0,0 +1,239 @@
+"""
+ASGI response cache for read endpoints.
+Per-route TTL policies, vary-by-header keys, ETag / Cache-Control headers
+and surrogate-key tags for precise purges on writes.
+"""
+
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.shared_state import SharedCounterTable, cache_generations
+
+logger = logging.getLogger(__name__)
+
+# Hook run before a cached response is served (auth, credit metering).
+# Raise HTTPException to reject the request.
+AuthorizeHook = Callable[[Request], Awaitable[None]]
+
+# Generation counter bumped when the whole cache is purged
+_GLOBAL_TAG = "*"
+
+
+@dataclass
+class CachePolicy:
+    """
+    Caching rules for one route template, e.g. "/v1/supplier/{supplier_id}".
+
+    `tags` are surrogate-key templates filled from path parameters
+    ("supplier:{supplier_id}"). Routes with an `authorize` hook are never
+    marked cacheable for shared caches, so nginx can't bypass auth or billing.
+    """
+
+    path: str
+    ttl: int
+    vary: Tuple[str, ...] = ("accept",)
+    tags: Tuple[str, ...] = ()
+    authorize: Optional[AuthorizeHook] = None
+    pattern: re.Pattern = field(init=False, repr=False)
+
+    def __post_init__(self):
+        regex = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", self.path)
+        self.pattern = re.compile(f"^{regex}$")
+        self.vary = tuple(h.lower() for h in self.vary)
+
+    @property
+    def cache_control(self) -> str:
+        if self.authorize:
+            # Clients may keep a copy but must revalidate (and be charged)
+            return "private, no-cache"
+        return f"public, max-age={self.ttl}"
+
+
+@dataclass
+class CacheEntry:
+    """A stored response."""
+
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    etag: str
+    expires_at: float
+    tags: Tuple[str, ...]
+    generations: Tuple[int, ...]
+
+
+class ResponseCache:
+    """
+    Bounded LRU store of responses.
+
+    Invalidation is generation-based: purging a tag bumps its counter in
+    shared memory, so purges reach every pre-forked worker without
+    enumerating their local entries.
+    """
+
+    def __init__(self, generations: SharedCounterTable, max_entries: int = 10000):
+        self.generations = generations
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _current(self, tags: Tuple[str, ...]) -> Tuple[int, ...]:
+        return tuple(self.generations.get(tag, 0) for tag in (_GLOBAL_TAG, *tags))
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at < time.monotonic() or entry.generations != self._current(entry.tags):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def snapshot(self, tags: Tuple[str, ...]) -> Tuple[int, ...]:
+        """Generations to store with a new entry."""
+        return self._current(tags)
+
+    def purge(self, *tags: str) -> None:
+        """Invalidate every entry carrying any of the given tags."""
+        for tag in tags:
+            try:
+                self.generations.add(tag, 1)
+            except MemoryError:
+                logger.warning("Cache generation table full, purging everything")
+                self.purge_all()
+                return
+
+    def purge_all(self) -> None:
+        """Invalidate every entry."""
+        self.generations.add(_GLOBAL_TAG, 1)
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class ResponseCacheMiddleware:
+    """
+    Serves GET/HEAD requests for configured routes from a ResponseCache.
+    """
+
+    def __init__(self, app: ASGIApp, cache: "ResponseCache", policies: List[CachePolicy]):
+        self.app = app
+        self.cache = cache
+        self.policies = policies
+
+    def _match(self, path: str) -> Tuple[Optional[CachePolicy], Dict[str, str]]:
+        for policy in self.policies:
+            match = policy.pattern.match(path)
+            if match:
+                return policy, match.groupdict()
+        return None, {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        policy, params = self._match(scope["path"])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        vary_values = "|".join(request.headers.get(h, "") for h in policy.vary)
+        key = f"{scope['path']}?{scope.get('query_string', b'').decode()}#{vary_values}"
+        tags = tuple(tag.format(**params) for tag in policy.tags)
+
+        entry = self.cache.get(key)
+        if entry is not None:
+            if policy.authorize:
+                try:
+                    await policy.authorize(request)
+                except HTTPException as exc:
+                    await JSONResponse({"detail": exc.detail}, status_code=exc.status_code)(scope, receive, send)
+                    return
+            self.cache.hits += 1
+            await self._send_entry(entry, request, scope, send, b"HIT")
+            return
+
+        self.cache.misses += 1
+        if scope["method"] == "HEAD":
+            # A HEAD body is empty, so never store it for later GETs
+            await self.app(scope, receive, send)
+            return
+
+        generations = self.cache.snapshot(tags)
+        start: Dict = {}
+        chunks: List[bytes] = []
+
+        async def capture(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+
+        body = b"".join(chunks)
+
+        if start.get("status") != 200:
+            await send({"type": "http.response.start", "status": start.get("status", 500), "headers": start.get("headers", [])})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers = [(k, v) for k, v in start.get("headers", []) if k.lower() not in (b"etag", b"cache-control", b"vary")]
+
+        entry = CacheEntry(
+            status=200,
+            headers=headers + self._cache_headers(policy, tags),
+            body=body,
+            etag='"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"',
+            expires_at=time.monotonic() + policy.ttl,
+            tags=tags,
+            generations=generations,
+        )
+        entry.headers.append((b"etag", entry.etag.encode()))
+        self.cache.set(key, entry)
+        await self._send_entry(entry, request, scope, send, b"MISS")
+
+    @staticmethod
+    def _cache_headers(policy: CachePolicy, tags: Tuple[str, ...]) -> List[Tuple[bytes, bytes]]:
+        headers = [(b"cache-control", policy.cache_control.encode())]
+        if policy.vary:
+            headers.append((b"vary", ", ".join(policy.vary).encode()))
+        if tags:
+            headers.append((b"surrogate-key", " ".join(tags).encode()))
+        return headers
+
+    @staticmethod
+    async def _send_entry(entry: CacheEntry, request: Request, scope: Scope, send: Send, status: bytes) -> None:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and entry.etag in [tag.strip() for tag in if_none_match.split(",")]:
+            headers = [(k, v) for k, v in entry.headers if k not in (b"content-length", b"content-type")]
+            await send({"type": "http.response.start", "status": 304, "headers": headers + [(b"x-cache", status)]})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send({"type": "http.response.start", "status": entry.status, "headers": entry.headers + [(b"x-cache", status)]})
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else entry.body})
+
+
+# Global cache instance
+response_cache = ResponseCache(cache_generations)
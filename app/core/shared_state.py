@@ -0,0 +1,133 @@
+"""
+Shared-memory counters for pre-forked workers.
+Tables are anonymous shared mappings allocated at import time, so when
+app.serve imports the app before forking every worker maps the same pages.
+Updates are serialized with a fork-inherited lock.
+"""
+
+import hashlib
+import logging
+import mmap
+import multiprocessing
+import struct
+import time
+from typing import Callable, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Slot layout: 8-byte key digest + 8-byte signed value
+_SLOT = struct.Struct("<Qq")
+
+# Slots probed from a key's home slot before the table counts as full for it
+MAX_PROBES = 64
+
+# Counters kept per process once the shared table is full; cleared when exceeded
+MAX_OVERFLOW = 100000
+
+
+class SharedCounterTable:
+    """
+    Fixed-capacity open-addressing hash table of int64 counters in shared memory.
+    Keys are hashed to 64-bit digests; a zero digest marks an empty slot.
+    A key lives within MAX_PROBES slots of its home slot. Keys that find
+    no room there are counted in a per-process overflow dict instead, so
+    a full table degrades to per-worker counts rather than failing.
+    """
+
+    def __init__(self, capacity: int = 65536):
+        self.capacity = capacity
+        self._buffer = mmap.mmap(-1, capacity * _SLOT.size)
+        self._lock = multiprocessing.Lock()
+        self._overflow: Dict[int, int] = {}
+
+    @staticmethod
+    def _digest(key: str) -> int:
+        digest = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little")
+        return digest or 1
+
+    def _find(self, digest: int, reusable: Optional[Callable[[int], bool]] = None) -> tuple[Optional[int], bool]:
+        """
+        Return (slot, present) for a digest; caller must hold the lock.
+        An absent key gets the first empty slot in its probe range, or the
+        first slot whose value `reusable` accepts; slot is None when there
+        is neither.
+        """
+        free = None
+        for step in range(min(MAX_PROBES, self.capacity)):
+            slot = (digest + step) % self.capacity
+            stored, value = _SLOT.unpack_from(self._buffer, slot * _SLOT.size)
+            if stored == digest:
+                return slot, True
+            if stored == 0:
+                return (slot if free is None else free), False
+            if free is None and reusable is not None and reusable(value):
+                free = slot
+        return free, False
+
+    def _read(self, digest: int, reusable: Optional[Callable[[int], bool]] = None) -> tuple[Optional[int], Optional[int]]:
+        """(slot, stored value or None); slot None means the key lives in the overflow dict."""
+        if digest in self._overflow:
+            return None, self._overflow[digest]
+        slot, present = self._find(digest, reusable)
+        if not present:
+            return slot, None
+        return slot, _SLOT.unpack_from(self._buffer, slot * _SLOT.size)[1]
+
+    def _write(self, slot: Optional[int], digest: int, value: int) -> None:
+        if slot is not None:
+            _SLOT.pack_into(self._buffer, slot * _SLOT.size, digest, value)
+            return
+        if not self._overflow:
+            logger.warning(f"Shared counter table is full ({self.capacity} slots); counting per process")
+        elif len(self._overflow) >= MAX_OVERFLOW and digest not in self._overflow:
+            self._overflow.clear()
+        self._overflow[digest] = value
+
+    def get(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        """Read a counter."""
+        with self._lock:
+            _, value = self._read(self._digest(key))
+            return default if value is None else value
+
+    def setdefault(self, key: str, value: int) -> int:
+        """Initialize a counter if absent; returns the stored value."""
+        digest = self._digest(key)
+        with self._lock:
+            slot, stored = self._read(digest)
+            if stored is not None:
+                return stored
+            self._write(slot, digest, value)
+            return value
+
+    def add(self, key: str, delta: int) -> int:
+        """Atomically add to a counter (starting from 0); returns the new value."""
+        digest = self._digest(key)
+        with self._lock:
+            slot, value = self._read(digest)
+            value = (value or 0) + delta
+            self._write(slot, digest, value)
+            return value
+
+    def hit(self, key: str, window_seconds: int = 60) -> int:
+        """
+        Count a hit in the current fixed window; returns hits so far.
+        The window index and count share one slot (high/low 32 bits).
+        Slots of other keys whose window has passed are taken over, so a
+        table used only for hits never fills with idle keys.
+        """
+        window = int(time.time() // window_seconds) & 0xFFFFFFFF
+        digest = self._digest(key)
+        with self._lock:
+            slot, packed = self._read(digest, reusable=lambda value: (value >> 32) != window)
+            count = packed & 0xFFFFFFFF if packed is not None and (packed >> 32) == window else 0
+            count += 1
+            self._write(slot, digest, (window << 32) | count)
+            return count
+
+
+# Process-wide tables (shared with forked workers)
+credit_balances = SharedCounterTable(settings.shared_table_capacity)
+rate_limits = SharedCounterTable(settings.shared_table_capacity)
+cache_generations = SharedCounterTable(settings.shared_table_capacity)
@@ -4,12 +4,24 @@ Uses REST API instead of direct Postgres connection.
 """
 
 import httpx
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
 
 
+def in_filter(values: Iterable[Any]) -> str:
+    """
+    PostgREST `in.(...)` filter. Values are double-quoted so commas,
+    parentheses and quotes inside them are matched literally.
+    """
+    quoted = []
+    for value in values:
+        text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        quoted.append(f'"{text}"')
+    return f"in.({','.join(quoted)})"
+
+
 class SupabaseClient:
     """Simple HTTP client for Supabase REST API."""
 
@@ -34,39 +46,49 @@ class SupabaseClient:
         table: str,
         method: str = "GET",
         params: Optional[Dict] = None,
-        data: Optional[Dict] = None,
+        data: Optional[Union[Dict, List[Dict]]] = None,
+        prefer: Optional[str] = None,
     ) -> Any:
-        """Execute a query against Supabase."""
+        """
+        Execute a query against Supabase.
+        `data` may be a list of rows for bulk inserts; `prefer` sets the
+        PostgREST Prefer header (e.g. upsert resolution, return=representation).
+        """
+        headers = {**self.headers, "Prefer": prefer} if prefer else self.headers
         async with self.get_client() as client:
             if method.upper() == "GET":
                 r = await client.get(
                     f"{self.url}/rest/v1/{table}",
-                    headers=self.headers,
+                    headers=headers,
                     params=params,
                 )
             elif method.upper() == "POST":
                 r = await client.post(
                     f"{self.url}/rest/v1/{table}",
-                    headers=self.headers,
+                    headers=headers,
+                    params=params,
                     json=data,
                 )
             elif method.upper() == "PATCH":
+                # Filters in params scope the update; without them PostgREST patches every row
                 r = await client.patch(
                     f"{self.url}/rest/v1/{table}",
-                    headers=self.headers,
+                    headers=headers,
+                    params=params,
                     json=data,
                 )
             elif method.upper() == "DELETE":
                 r = await client.delete(
                     f"{self.url}/rest/v1/{table}",
-                    headers=self.headers,
+                    headers=headers,
                     params=params,
                 )
             else:
                 raise ValueError(f"Unknown method: {method}")
 
             r.raise_for_status()
-            return r.json()
+            # PostgREST returns an empty body for writes without return=representation
+            return r.json() if r.content else None
 
     # Table-specific methods
     async def get_suppliers(self, name_filter: Optional[str] = None, limit: int = 10) -> List[Dict]:
@@ -100,14 +122,17 @@ class SupabaseClient:
         result = await self.query("api_keys", params=params)
         return result[0] if result else None
 
-    async def update_api_key_credits(self, key_id: str, credits: int) -> None:
-        """Update API key credits."""
-        await self.query(
-            "api_keys",
-            method="PATCH",
-            params={"id": f"eq.{key_id}"},
-            data={"credits_remaining": credits, "last_used_at": "now()"},
-        )
+    async def rpc(self, function: str, params: Dict) -> Any:
+        """Call a Postgres function exposed by PostgREST (see app.core.database.SCHEMA_DDL)."""
+        return await self.query(f"rpc/{function}", method="POST", data=params)
+
+    async def debit_api_key_credits(self, key_id: str, amount: int) -> Optional[int]:
+        """Subtract credits in one atomic UPDATE; returns the stored balance."""
+        return await self.rpc("debit_api_key_credits", {"p_key_id": str(key_id), "p_amount": amount})
+
+    async def get_suppliers_by_lower_name(self, names: Iterable[str]) -> List[Dict]:
+        """Suppliers (id, name) whose lower(name) is one of the already lower-cased `names`."""
+        return await self.rpc("suppliers_by_lower_name", {"p_names": sorted(names)}) or []
 
 
 # Global client instance
@@ -4,29 +4,54 @@ A headless B2B data marketplace for AI agents.
 """
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 import os
 
 from fastapi import FastAPI, Request, status, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.openapi.utils import get_openapi as get_openapi_schema
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.core.config import settings
 from app.core.supabase import supabase, check_health
-from app.api.v1 import endpoints_router, submission_router, auth_router
+from app.core.response_cache import CachePolicy, ResponseCacheMiddleware, response_cache
+from app.services.ingest_runner import ingest_runner
+from app.api.v1.auth import charge_cached_request
+from app.api.v1 import endpoints_router, submission_router, auth_router, ingest_router
 # from app.api.v1.billing import router as billing_router
 # from app.api.v1.payments import router as payments_router
 from app.api.v1.webhooks import router as webhooks_router
 from app.api.v1.email import router as email_router
+from app.api.v1.serializers import dumps
 # from app.api.v1.agents import router as agents_router
 
 # Create templates directory path
 TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates")
 STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static")
 
+# Rendered HTML pages, keyed by template file name
+_template_cache: dict[str, str] = {}
+
+
+def load_template(name: str) -> str:
+    """Return a template's HTML, reading it from disk only once."""
+    html = _template_cache.get(name)
+    if html is None:
+        with open(os.path.join(TEMPLATES_DIR, name), "r") as f:
+            html = f.read()
+        _template_cache[name] = html
+    return html
+
+
+def warm_templates() -> int:
+    """Preload every template so pre-forked workers share them."""
+    for name in os.listdir(TEMPLATES_DIR):
+        if name.endswith(".html"):
+            load_template(name)
+    return len(_template_cache)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -34,6 +59,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Application lifespan - startup and shutdown events.
     """
     yield
+    ingest_runner.shutdown()
 
 
 # Create FastAPI application
@@ -46,6 +72,30 @@ app = FastAPI(
     redoc_url=None,
 )
 
+# Response cache for read endpoints (added before CORS so CORS wraps it and
+# per-Origin headers are never stored). Paid routes re-run auth + billing on hits.
+app.add_middleware(
+    ResponseCacheMiddleware,
+    cache=response_cache,
+    policies=[
+        CachePolicy("/health", ttl=5, vary=()),
+        CachePolicy("/version-test", ttl=300, vary=()),
+        CachePolicy("/v1/webhooks/events", ttl=3600),
+        CachePolicy(
+            "/v1/supplier/{supplier_id}/inventory",
+            ttl=60,
+            tags=("supplier:{supplier_id}",),
+            authorize=charge_cached_request,
+        ),
+        CachePolicy(
+            "/v1/supplier/{supplier_id}",
+            ttl=60,
+            tags=("supplier:{supplier_id}",),
+            authorize=charge_cached_request,
+        ),
+    ],
+)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -124,8 +174,7 @@ app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Root endpoint - serve home page"""
-    with open(os.path.join(TEMPLATES_DIR, "index_new.html"), "r") as f:
-        return f.read()
+    return load_template("index_new.html")
 
 
 @app.get("/health")
@@ -142,29 +191,25 @@ async def test_deploy():
 @app.get("/index", response_class=HTMLResponse)
 async def home():
     """Home page"""
-    with open(os.path.join(TEMPLATES_DIR, "index.html"), "r") as f:
-        return f.read()
+    return load_template("index.html")
 
 
 @app.get("/docs", response_class=HTMLResponse)
 async def docs():
     """Documentation page"""
-    with open(os.path.join(TEMPLATES_DIR, "docs.html"), "r") as f:
-        return f.read()
+    return load_template("docs.html")
 
 
 @app.get("/docs/api", response_class=HTMLResponse)
 async def docs_api():
     """API documentation page"""
-    with open(os.path.join(TEMPLATES_DIR, "docs.html"), "r") as f:
-        return f.read()
+    return load_template("docs.html")
 
 
 @app.get("/docs/agent-integration", response_class=HTMLResponse)
 async def docs_agent_integration():
     """Agent integration guide"""
-    with open(os.path.join(TEMPLATES_DIR, "docs.html"), "r") as f:
-        return f.read()
+    return load_template("docs.html")
 
 
 @app.get("/version-test")
@@ -174,102 +219,87 @@ async def version_test():
 @app.get("/pricing", response_class=HTMLResponse)
 async def pricing():
     """Pricing page - uses template file"""
-    with open(os.path.join(TEMPLATES_DIR, "pricing_new.html"), "r") as f:
-        return f.read()
+    return load_template("pricing_new.html")
 
 @app.get("/faq", response_class=HTMLResponse)
 async def faq():
     """FAQ page"""
-    with open(os.path.join(TEMPLATES_DIR, "faq_new.html"), "r") as f:
-        return f.read()
+    return load_template("faq_new.html")
 
 @app.get("/how-it-works", response_class=HTMLResponse)
 async def how_it_works():
     """How it works page"""
-    with open(os.path.join(TEMPLATES_DIR, "how-it-works_new.html"), "r") as f:
-        return f.read()
+    return load_template("how-it-works_new.html")
 
 @app.get("/get-started", response_class=HTMLResponse)
 async def get_started():
     """Get started page"""
-    with open(os.path.join(TEMPLATES_DIR, "get-started_new.html"), "r") as f:
-        return f.read()
+    return load_template("get-started_new.html")
 
 @app.get("/dashboard", response_class=HTMLResponse)
 async def dashboard():
     """Dashboard page"""
-    with open(os.path.join(TEMPLATES_DIR, "dashboard.html"), "r") as f:
-        return f.read()
+    return load_template("dashboard.html")
 
 
 @app.get("/explorer", response_class=HTMLResponse)
 async def explorer():
     """API Explorer page"""
-    with open(os.path.join(TEMPLATES_DIR, "explorer.html"), "r") as f:
-        return f.read()
+    return load_template("explorer.html")
 
 
 @app.get("/contact", response_class=HTMLResponse)
 async def contact():
     """Contact sales page"""
-    with open(os.path.join(TEMPLATES_DIR, "contact_new.html"), "r") as f:
-        return f.read()
+    return load_template("contact_new.html")
 
 
 @app.get("/signup", response_class=HTMLResponse)
 async def signup():
     """Sign up page"""
-    with open(os.path.join(TEMPLATES_DIR, "signup.html"), "r") as f:
-        return f.read()
+    return load_template("signup.html")
 
 
 @app.get("/login", response_class=HTMLResponse)
 async def login_page():
     """Login page"""
-    with open(os.path.join(TEMPLATES_DIR, "login.html"), "r") as f:
-        return f.read()
+    return load_template("login.html")
 
 
 @app.get("/submit", response_class=HTMLResponse)
 async def submit():
     """Data submission page"""
-    with open(os.path.join(TEMPLATES_DIR, "submit.html"), "r") as f:
-        return f.read()
+    return load_template("submit.html")
 
 
 @app.get("/quickstart", response_class=HTMLResponse)
 async def quickstart():
     """Quickstart guide - copy/paste snippets for agents"""
-    with open(os.path.join(TEMPLATES_DIR, "quickstart.html"), "r") as f:
-        return f.read()
+    return load_template("quickstart.html")
 
 
 @app.get("/coverage", response_class=HTMLResponse)
 async def coverage():
     """Data coverage page"""
-    with open(os.path.join(TEMPLATES_DIR, "coverage.html"), "r") as f:
-        return f.read()
+    return load_template("coverage.html")
 
 
 @app.get("/changelog", response_class=HTMLResponse)
 async def changelog():
     """Changelog page"""
-    with open(os.path.join(TEMPLATES_DIR, "changelog.html"), "r") as f:
-        return f.read()
+    return load_template("changelog.html")
 
 
 @app.get("/status", response_class=HTMLResponse)
 async def status_page():
     """Status page - operational transparency"""
-    with open(os.path.join(TEMPLATES_DIR, "status.html"), "r") as f:
-        return f.read()
+    return load_template("status.html")
 
 
 @app.get("/support", response_class=HTMLResponse)
 async def support_page():
     """Support page"""
-    with open(os.path.join(TEMPLATES_DIR, "support.html"), "r") as f:
-        return f.read()
+    return load_template("support.html")
 
 
 @app.get("/login", response_class=HTMLResponse)
@@ -283,8 +313,7 @@ async def login_page():
 @app.get("/console", response_class=HTMLResponse)
 async def console_page():
     """Console - auth-gated API key management"""
-    with open(os.path.join(TEMPLATES_DIR, "console.html"), "r") as f:
-        return f.read()
+    return load_template("console.html")
 
 
 @app.get("/blog/ai-agents-b2b-data-programmatic-access", response_class=HTMLResponse)
@@ -298,15 +327,13 @@ async def blog_post():
 @app.get("/providers", response_class=HTMLResponse)
 async def providers():
     """Data provider dashboard"""
-    with open(os.path.join(TEMPLATES_DIR, "providers.html"), "r") as f:
-        return f.read()
+    return load_template("providers.html")
 
 
 @app.get("/bot", response_class=HTMLResponse)
 async def bot_profile():
     """Telegram bot profile page"""
-    with open(os.path.join(TEMPLATES_DIR, "bot.html"), "r") as f:
-        return f.read()
+    return load_template("bot.html")
 
 
 # Global exception handler
@@ -331,12 +358,8 @@ async def nova_test():
     return {"status": "ok", "message": "Nova test route"}
 
 # OpenAPI JSON endpoint (canonical contract for agents)
-@app.get("/openapi.json", tags=["Documentation"])
-async def get_openapi():
-    """Get OpenAPI 3.0 specification (canonical API contract)"""
-    # Always regenerate to ensure fresh data (no cache)
-    app.openapi_schema = None
-    
+def build_public_openapi() -> dict:
+    """Build the filtered public OpenAPI specification."""
     # Generate base schema
     openapi_schema = get_openapi_schema(
         title="TensorMarketData",
@@ -394,13 +417,32 @@ async def get_openapi():
         }
     }
     
-    app.openapi_schema = openapi_schema
-    return app.openapi_schema
+    return openapi_schema
+
+
+# Routes are fixed once the routers are included, so the encoded schema is
+# built once (pre-fork by app.serve) instead of on every request
+_openapi_bytes: Optional[bytes] = None
+
+
+def get_openapi_bytes() -> bytes:
+    """Return the encoded public OpenAPI specification."""
+    global _openapi_bytes
+    if _openapi_bytes is None:
+        _openapi_bytes = dumps(build_public_openapi())
+    return _openapi_bytes
+
+
+@app.get("/openapi.json", tags=["Documentation"])
+async def get_openapi():
+    """Get OpenAPI 3.0 specification (canonical API contract)"""
+    return Response(content=get_openapi_bytes(), media_type="application/json")
 
 
 # Include all routers
 app.include_router(endpoints_router, prefix="/v1")
 app.include_router(submission_router, prefix="/v1")
+app.include_router(ingest_router, prefix="/v1")
 app.include_router(auth_router, prefix="/v1")
 # app.include_router(payments_router, prefix="/v1")
 app.include_router(webhooks_router, prefix="/v1")
@@ -7,10 +7,10 @@ from datetime import datetime
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import Column, String, DateTime, Float, JSON, ForeignKey, Integer
+from sqlalchemy import BigInteger, Column, String, DateTime, Float, JSON, ForeignKey, Index, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from app.core.database import Base
 
@@ -28,6 +28,7 @@ class Supplier(Base):
     contact_json = Column(JSON, nullable=False)  # Strict schema: {email, phone, linkedin}
     verification_score = Column(Float, default=0.0, nullable=False)
     last_verified_at = Column(DateTime(timezone=True), nullable=True)
+    content_hash = Column(BigInteger, nullable=True, index=True)  # Hash of the ingested row, for idempotent replays
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -51,6 +52,7 @@ class Product(Base):
     )
     sku_data = Column(JSON, nullable=False)  # Product identification data
     price_range = Column(JSON, nullable=False)  # {min, max, currency}
+    content_hash = Column(BigInteger, nullable=True, index=True)  # Hash of the ingested row, for idempotent replays
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -58,6 +60,12 @@ class Product(Base):
     supplier = relationship("Supplier", back_populates="products")
 
 
+# Natural keys: suppliers by case-insensitive name, products by supplier + SKU.
+# Used by the bulk loader's set-based lookups and ON CONFLICT inserts.
+Index("ux_suppliers_name_lower", func.lower(Supplier.name), unique=True)
+Index("ux_products_supplier_sku", Product.supplier_id, text("(sku_data ->> 'sku')"), unique=True)
+
+
 class APIKey(Base):
     """
     API Keys table - for authentication and credit tracking.
@@ -67,9 +75,10 @@ class APIKey(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     key_hash = Column(String(255), nullable=False, unique=True, index=True)
-    key_prefix = Column(String(8), nullable=False)  # For display (e.g., "tmd_live_xxx")
+    key_prefix = Column(String(12), nullable=False, index=True)  # First 12 chars (e.g., "tmd_agent_ab")
     credits_remaining = Column(Integer, default=100, nullable=False)
     is_active = Column(Integer, default=1, nullable=False)  # 1=active, 0=revoked
+    scopes = Column(String(255), default="", server_default="", nullable=False)  # Comma-separated, e.g. "provider"
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     last_used_at = Column(DateTime(timezone=True), nullable=True)
     expires_at = Column(DateTime(timezone=True), nullable=True)
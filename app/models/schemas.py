@@ -12,13 +12,17 @@ from pydantic import BaseModel, Field, ConfigDict
 
 # ==================== Contact Schema ====================
 
+# Shared with the columnar validator in app.services.columnar
+EMAIL_PATTERN = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+
+
 class ContactData(BaseModel):
     """
     Strict contact information schema.
     All fields optional but validated if present.
     """
 
-    email: Optional[str] = Field(None, pattern=r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+    email: Optional[str] = Field(None, pattern=EMAIL_PATTERN)
     phone: Optional[str] = Field(None, max_length=20)
     linkedin: Optional[str] = Field(None, max_length=500)
 
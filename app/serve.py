@@ -0,0 +1,239 @@
+"""
+Production launcher - pre-fork multi-process serving.
+Usage: python -m app.serve [--workers N] [--host 0.0.0.0] [--port 8000]
+
+The parent imports the app and warms shared state (templates, OpenAPI
+bytes, API key index, mapped catalog dedupe index) before forking, so
+workers inherit it copy-on-write.
+Signals to the parent:
+    SIGHUP           rolling restart, one worker at a time
+    SIGTERM/SIGINT   graceful shutdown
+    SIGTTIN/SIGTTOU  add / remove a worker
+"""
+
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict, List
+
+import uvicorn
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.serve")
+
+
+def warm_shared_state() -> None:
+    """Import the app and build everything workers should share."""
+    from app.main import app, warm_templates, get_openapi_bytes
+    from app.core.api_keys import api_key_repository
+    from app.services.validation.lsh import get_catalog_index
+
+    templates = warm_templates()
+    openapi_size = len(get_openapi_bytes())
+    app.openapi()
+
+    try:
+        keys = asyncio.run(api_key_repository.warm())
+    except Exception as e:
+        keys = 0
+        logger.warning(f"API key index warm-up skipped: {e}")
+
+    # Mapped once here, so workers share the mapping as well as the page cache
+    catalog = get_catalog_index()
+
+    logger.info(
+        f"Warmed {templates} templates, {openapi_size} bytes of OpenAPI, {keys} API keys, "
+        f"{len(catalog) if catalog else 0} catalog suppliers"
+    )
+
+
+class Arbiter:
+    """
+    Forks and supervises uvicorn workers sharing one listening socket.
+    """
+
+    def __init__(self, host: str, port: int, workers: int, graceful_timeout: int):
+        self.host = host
+        self.port = port
+        self.num_workers = workers
+        self.graceful_timeout = graceful_timeout
+        self.workers: Dict[int, float] = {}  # pid -> started at
+        self._retiring: Dict[int, float] = {}  # pid -> kill deadline, for workers stopped on purpose
+        self.socket: socket.socket = None
+        self._signals: List[int] = []
+        self._stopping = False
+
+    # ============ WORKERS ============
+
+    def spawn_worker(self) -> int:
+        """Fork a worker serving on the shared socket."""
+        pid = os.fork()
+        if pid:
+            self.workers[pid] = time.monotonic()
+            return pid
+
+        # Child: restore default signal handling, uvicorn installs its own
+        for sig in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT, signal.SIGTTIN, signal.SIGTTOU):
+            signal.signal(sig, signal.SIG_DFL)
+
+        from app.main import app
+
+        config = uvicorn.Config(
+            app,
+            log_level="debug" if settings.debug else "info",
+            timeout_graceful_shutdown=self.graceful_timeout,
+        )
+        try:
+            uvicorn.Server(config).run(sockets=[self.socket])
+        finally:
+            os._exit(0)
+
+    def stop_worker(self, pid: int, wait: bool = True) -> None:
+        """Ask a worker to finish in-flight requests and exit."""
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            self.workers.pop(pid, None)
+            return
+
+        if not wait:
+            return
+
+        deadline = time.monotonic() + self.graceful_timeout
+        while time.monotonic() < deadline:
+            done, _ = os.waitpid(pid, os.WNOHANG)
+            if done:
+                self.workers.pop(pid, None)
+                return
+            time.sleep(0.1)
+
+        logger.warning(f"Worker {pid} did not exit in {self.graceful_timeout}s, killing")
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        self.workers.pop(pid, None)
+
+    def retire_worker(self, pid: int) -> None:
+        """Stop a worker without waiting or replacing it (scale-down)."""
+        self.workers.pop(pid, None)
+        self._retiring[pid] = time.monotonic() + self.graceful_timeout
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            self._retiring.pop(pid, None)
+
+    def rolling_restart(self) -> None:
+        """Replace workers one at a time so capacity never drops to zero."""
+        for pid in list(self.workers):
+            self.spawn_worker()
+            self.stop_worker(pid)
+        logger.info(f"Rolling restart complete ({len(self.workers)} workers)")
+
+    def reap_workers(self) -> None:
+        """Collect exited workers, replace unexpected exits and kill retiring workers past their deadline."""
+        now = time.monotonic()
+        for pid, deadline in list(self._retiring.items()):
+            if deadline < now:
+                logger.warning(f"Worker {pid} did not exit in {self.graceful_timeout}s, killing")
+                self._retiring[pid] = float("inf")  # Reaped below once the kill lands
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._retiring.clear()  # No children left to wait for
+                return
+            if not pid:
+                return
+            if self._retiring.pop(pid, None) is not None:
+                continue
+            if self.workers.pop(pid, None) is not None and not self._stopping:
+                logger.warning(f"Worker {pid} exited with status {status}, respawning")
+                self.spawn_worker()
+
+    # ============ MAIN LOOP ============
+
+    def _queue_signal(self, signum, frame) -> None:
+        self._signals.append(signum)
+
+    def run(self) -> int:
+        """Bind, warm, fork and supervise until shut down."""
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind((self.host, self.port))
+        self.socket.listen(2048)
+        self.socket.set_inheritable(True)
+
+        warm_shared_state()
+
+        # Move warmed objects out of the GC's reach so collections in the
+        # workers don't touch (and copy) the shared pages
+        gc.collect()
+        gc.freeze()
+
+        for sig in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT, signal.SIGTTIN, signal.SIGTTOU):
+            signal.signal(sig, self._queue_signal)
+
+        for _ in range(self.num_workers):
+            self.spawn_worker()
+
+        logger.info(f"Serving on http://{self.host}:{self.port} with {self.num_workers} workers (pid {os.getpid()})")
+
+        while True:
+            while self._signals:
+                sig = self._signals.pop(0)
+                if sig in (signal.SIGTERM, signal.SIGINT):
+                    return self.shutdown()
+                if sig == signal.SIGHUP:
+                    self.rolling_restart()
+                elif sig == signal.SIGTTIN:
+                    self.num_workers += 1
+                    self.spawn_worker()
+                elif sig == signal.SIGTTOU and self.num_workers > 1:
+                    self.num_workers -= 1
+                    self.retire_worker(max(self.workers, key=self.workers.get))
+            self.reap_workers()
+            time.sleep(0.5)
+
+    def shutdown(self) -> int:
+        """Stop all workers gracefully."""
+        self._stopping = True
+        logger.info("Shutting down workers")
+        for pid in list(self.workers):
+            self.stop_worker(pid, wait=False)
+        for pid in list(self.workers):
+            self.stop_worker(pid)
+        while self._retiring:
+            self.reap_workers()
+            time.sleep(0.1)
+        self.socket.close()
+        return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run TensorMarketData with pre-forked workers")
+    parser.add_argument("--host", default=settings.api_host)
+    parser.add_argument("--port", type=int, default=settings.api_port)
+    parser.add_argument("--workers", type=int, default=settings.workers, help="0 = one per CPU")
+    parser.add_argument("--graceful-timeout", type=int, default=settings.graceful_timeout)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(message)s")
+
+    workers = args.workers or os.cpu_count() or 1
+    arbiter = Arbiter(args.host, args.port, workers, args.graceful_timeout)
+    return arbiter.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
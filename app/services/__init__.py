@@ -1,141 +1,93 @@
 """
 Services Package
-"""
-
-from app.services.collection.scraper import (
-    BaseScraper,
-    DataCollector,
-    SECScraper,
-    FDAScraper,
-    LinkedInScraper,
-    DirectoryScraper,
-    collect_from_apis,
-    collect_from_directory,
-)
-
-from app.services.collection.enhanced_scraper import (
-    EnhancedBaseScraper,
-    BetterBusinessBureauScraper,
-    CrunchbaseScraper,
-    OpenCorporatesScraper,
-    LinkedInSalesNavigatorScraper,
-    YellowPagesScraper,
-    MantaScraper,
-    IndustryAssociationScraper,
-    GovernmentContractorScraper,
-    EDGARScraper,
-    DataCollector,
-    create_default_collector,
-)
-
-from app.services.validation.cleaner import (
-    DataValidator,
-    Deduplicator,
-    DataEnricher,
-    process_data,
-)
-
-from app.services.validation.enhanced_cleaner import (
-    EnhancedEmailValidator,
-    EnhancedPhoneValidator,
-    AddressValidator,
-    CompanyNameNormalizer,
-    EnhancedDeduplicator,
-    EnhancedValidationPipeline,
-    validate_and_clean,
-    deduplicate_records,
-)
 
-from app.services.enrichment import (
-    CompanyAPIClient,
-    SocialSignalsEnricher,
-    NewsFeedEnricher,
-    DataEnrichmentPipeline,
-    enrich_company_data,
-    enrich_batch_companies,
-)
-
-from app.services.quality_metrics import (
-    QualityDimension,
-    QualityScore,
-    DataQualityMetrics,
-    DataQualityDashboard,
-)
+Submodules are loaded lazily (PEP 562): importing `app.services.<module>`
+from the API request path no longer pulls in every scraper, validator,
+enrichment, quality and compliance module.
+"""
 
-from app.services.compliance import (
-    RegulationType,
-    DataCategory,
-    ProcessingPurpose,
-    ConsentRecord,
-    DataSubjectRightsRequest,
-    ComplianceChecker,
-    GDPRComplianceManager,
-    ComplianceDashboard,
-    apply_compliance_flags,
-)
+import importlib
 
-__all__ = [
+# Public name -> defining module, imported on first attribute access
+_LAZY_IMPORTS = {
     # Original scrapers
-    "BaseScraper",
-    "DataCollector",
-    "SECScraper",
-    "FDAScraper",
-    "LinkedInScraper",
-    "DirectoryScraper",
-    "collect_from_apis",
-    "collect_from_directory",
-    
+    "BaseScraper": "app.services.collection.scraper",
+    "SECScraper": "app.services.collection.scraper",
+    "FDAScraper": "app.services.collection.scraper",
+    "LinkedInScraper": "app.services.collection.scraper",
+    "DirectoryScraper": "app.services.collection.scraper",
+    "collect_from_apis": "app.services.collection.scraper",
+    "collect_from_directory": "app.services.collection.scraper",
+
     # Enhanced scrapers
-    "EnhancedBaseScraper",
-    "BetterBusinessBureauScraper",
-    "CrunchbaseScraper",
-    "OpenCorporatesScraper",
-    "LinkedInSalesNavigatorScraper",
-    "YellowPagesScraper",
-    "MantaScraper",
-    "IndustryAssociationScraper",
-    "GovernmentContractorScraper",
-    "EDGARScraper",
-    "create_default_collector",
-    
+    "EnhancedBaseScraper": "app.services.collection.enhanced_scraper",
+    "BetterBusinessBureauScraper": "app.services.collection.enhanced_scraper",
+    "CrunchbaseScraper": "app.services.collection.enhanced_scraper",
+    "OpenCorporatesScraper": "app.services.collection.enhanced_scraper",
+    "LinkedInSalesNavigatorScraper": "app.services.collection.enhanced_scraper",
+    "YellowPagesScraper": "app.services.collection.enhanced_scraper",
+    "MantaScraper": "app.services.collection.enhanced_scraper",
+    "IndustryAssociationScraper": "app.services.collection.enhanced_scraper",
+    "GovernmentContractorScraper": "app.services.collection.enhanced_scraper",
+    "EDGARScraper": "app.services.collection.enhanced_scraper",
+    "DataCollector": "app.services.collection.enhanced_scraper",
+    "create_default_collector": "app.services.collection.enhanced_scraper",
+
     # Original validation
-    "DataValidator",
-    "Deduplicator",
-    "DataEnricher",
-    "process_data",
-    
+    "DataValidator": "app.services.validation.cleaner",
+    "Deduplicator": "app.services.validation.cleaner",
+    "DataEnricher": "app.services.validation.cleaner",
+    "process_data": "app.services.validation.cleaner",
+
     # Enhanced validation
-    "EnhancedEmailValidator",
-    "EnhancedPhoneValidator",
-    "AddressValidator",
-    "CompanyNameNormalizer",
-    "EnhancedDeduplicator",
-    "EnhancedValidationPipeline",
-    "validate_and_clean",
-    "deduplicate_records",
-    
+    "EnhancedEmailValidator": "app.services.validation.enhanced_cleaner",
+    "EnhancedPhoneValidator": "app.services.validation.enhanced_cleaner",
+    "AddressValidator": "app.services.validation.enhanced_cleaner",
+    "CompanyNameNormalizer": "app.services.validation.enhanced_cleaner",
+    "EnhancedDeduplicator": "app.services.validation.enhanced_cleaner",
+    "EnhancedValidationPipeline": "app.services.validation.enhanced_cleaner",
+    "validate_and_clean": "app.services.validation.enhanced_cleaner",
+    "deduplicate_records": "app.services.validation.enhanced_cleaner",
+
     # Enrichment
-    "CompanyAPIClient",
-    "SocialSignalsEnricher",
-    "NewsFeedEnricher",
-    "DataEnrichmentPipeline",
-    "enrich_company_data",
-    "enrich_batch_companies",
-    
+    "CompanyAPIClient": "app.services.enrichment",
+    "SocialSignalsEnricher": "app.services.enrichment",
+    "NewsFeedEnricher": "app.services.enrichment",
+    "DataEnrichmentPipeline": "app.services.enrichment",
+    "enrich_company_data": "app.services.enrichment",
+    "enrich_batch_companies": "app.services.enrichment",
+
     # Quality metrics
-    "QualityDimension",
-    "QualityScore",
-    "DataQualityMetrics",
-    "DataQualityDashboard",
-    
+    "QualityDimension": "app.services.quality_metrics",
+    "QualityScore": "app.services.quality_metrics",
+    "DataQualityMetrics": "app.services.quality_metrics",
+    "DataQualityDashboard": "app.services.quality_metrics",
+
     # Compliance
-    "RegulationType",
-    "DataCategory",
-    "ProcessingPurpose",
-    "ConsentRecord",
-    "DataSubjectRightsRequest",
-    "ComplianceChecker",
-    "GDPRComplianceManager",
-    "ComplianceDashboard",
-    "apply_compliance_flags",
-]
+    "RegulationType": "app.services.compliance",
+    "DataCategory": "app.services.compliance",
+    "ProcessingPurpose": "app.services.compliance",
+    "ConsentRecord": "app.services.compliance",
+    "DataSubjectRightsRequest": "app.services.compliance",
+    "ComplianceChecker": "app.services.compliance",
+    "GDPRComplianceManager": "app.services.compliance",
+    "ComplianceDashboard": "app.services.compliance",
+    "apply_compliance_flags": "app.services.compliance",
+}
+
+
+def __getattr__(name: str):
+    """Import the defining submodule on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+__all__ = list(_LAZY_IMPORTS)
@@ -1,48 +1,45 @@
 """
 Collection Package
 Data collection and scraping services.
+Submodules are loaded lazily on first attribute access (PEP 562).
 """
 
-from app.services.collection.scraper import (
-    BaseScraper,
-    DataCollector,
-    SECScraper,
-    FDAScraper,
-    LinkedInScraper,
-    DirectoryScraper,
-)
-
-from app.services.collection.enhanced_scraper import (
-    EnhancedBaseScraper,
-    BetterBusinessBureauScraper,
-    CrunchbaseScraper,
-    OpenCorporatesScraper,
-    LinkedInSalesNavigatorScraper,
-    YellowPagesScraper,
-    MantaScraper,
-    IndustryAssociationScraper,
-    GovernmentContractorScraper,
-    EDGARScraper,
-    DataCollector,
-    create_default_collector,
-)
-
-__all__ = [
-    "BaseScraper",
-    "DataCollector",
-    "SECScraper",
-    "FDAScraper",
-    "LinkedInScraper",
-    "DirectoryScraper",
-    "EnhancedBaseScraper",
-    "BetterBusinessBureauScraper",
-    "CrunchbaseScraper",
-    "OpenCorporatesScraper",
-    "LinkedInSalesNavigatorScraper",
-    "YellowPagesScraper",
-    "MantaScraper",
-    "IndustryAssociationScraper",
-    "GovernmentContractorScraper",
-    "EDGARScraper",
-    "create_default_collector",
-]
+import importlib
+
+# Public name -> defining module
+_LAZY_IMPORTS = {
+    "BaseScraper": "app.services.collection.scraper",
+    "SECScraper": "app.services.collection.scraper",
+    "FDAScraper": "app.services.collection.scraper",
+    "LinkedInScraper": "app.services.collection.scraper",
+    "DirectoryScraper": "app.services.collection.scraper",
+    "EnhancedBaseScraper": "app.services.collection.enhanced_scraper",
+    "BetterBusinessBureauScraper": "app.services.collection.enhanced_scraper",
+    "CrunchbaseScraper": "app.services.collection.enhanced_scraper",
+    "OpenCorporatesScraper": "app.services.collection.enhanced_scraper",
+    "LinkedInSalesNavigatorScraper": "app.services.collection.enhanced_scraper",
+    "YellowPagesScraper": "app.services.collection.enhanced_scraper",
+    "MantaScraper": "app.services.collection.enhanced_scraper",
+    "IndustryAssociationScraper": "app.services.collection.enhanced_scraper",
+    "GovernmentContractorScraper": "app.services.collection.enhanced_scraper",
+    "EDGARScraper": "app.services.collection.enhanced_scraper",
+    "DataCollector": "app.services.collection.enhanced_scraper",
+    "create_default_collector": "app.services.collection.enhanced_scraper",
+}
+
+
+def __getattr__(name: str):
+    """Import the defining submodule on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+__all__ = list(_LAZY_IMPORTS)
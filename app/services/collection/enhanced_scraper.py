@@ -6,14 +6,15 @@ Improved scrapers for business directories, regulatory filings, and industry dat
 import asyncio
 import hashlib
 import json
-import re
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 
 import httpx
 
+from app.services.validation.rules import get_rule_set
+
 
 class EnhancedBaseScraper(ABC):
     """Enhanced base class for data scrapers with better error handling."""
@@ -82,29 +83,13 @@ class EnhancedBaseScraper(ABC):
         }
 
     def _validate_email(self, email: Optional[str]) -> Optional[str]:
-        if not email:
-            return None
-        email = str(email).strip().lower()
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return email if re.match(pattern, email) else None
+        return get_rule_set("suppliers").validate_value("email", email)
 
     def _validate_phone(self, phone: Optional[str]) -> Optional[str]:
-        if not phone:
-            return None
-        cleaned = re.sub(r"[^\d\+]", "", str(phone).strip())
-        return cleaned if 7 <= len(cleaned) <= 15 else None
+        return get_rule_set("suppliers").validate_value("phone", phone)
 
     def _validate_url(self, url: Optional[str]) -> Optional[str]:
-        if not url:
-            return None
-        url = str(url).strip()
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
-        try:
-            parsed = urlparse(url)
-            return url if parsed.netloc else None
-        except Exception:
-            return None
+        return get_rule_set("suppliers").validate_value("url", url)
 
 
 class BetterBusinessBureauScraper(EnhancedBaseScraper):
@@ -0,0 +1,609 @@
+"""
+Columnar validation engine for bulk ingestion.
+Applies the ContactData / SupplierCreate / ProductCreate rules to whole
+DataFrame columns and records per-row error codes as bit flags, and reads
+CSV, Parquet, Arrow IPC and NDJSON inputs as column batches.
+"""
+
+import csv
+import enum
+import io
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+from app.models.schemas import EMAIL_PATTERN
+from app.services.validation.phones import normalize_phones
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.json as pa_json
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Arrow-backed strings run regex and length checks in native code
+STRING_DTYPE = pd.StringDtype("pyarrow") if PYARROW_AVAILABLE else pd.StringDtype()
+
+# Characters stripped from phones with plain substring replaces before
+# falling back to a regex for anything else that is not a digit or '+'
+_PHONE_SEPARATORS = " -().\t"
+
+_NUMBER_PATTERN = r"\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*"
+
+# Input formats by file extension
+INPUT_FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+# Bytes of NDJSON parsed per Arrow read
+NDJSON_BLOCK_BYTES = 16 * 1024 * 1024
+# Bytes read per block while split_csv counts quotes
+CSV_SCAN_BYTES = 4 * 1024 * 1024
+
+# Field limits mirrored from app.models.schemas
+MAX_NAME_LENGTH = 255
+MAX_PHONE_LENGTH = 20
+MAX_LINKEDIN_LENGTH = 500
+MAX_CURRENCY_LENGTH = 3
+
+
+class RowError(enum.IntFlag):
+    """Per-row validation error codes. A row can carry several."""
+
+    NAME_MISSING = 1 << 0
+    NAME_TOO_LONG = 1 << 1
+    EMAIL_INVALID = 1 << 2
+    PHONE_INVALID = 1 << 3
+    LINKEDIN_TOO_LONG = 1 << 4
+    SCORE_INVALID = 1 << 5
+    SKU_MISSING = 1 << 6
+    PRICE_INVALID = 1 << 7
+    CURRENCY_INVALID = 1 << 8
+
+
+# Input column each error code is raised for
+ERROR_COLUMNS = {
+    RowError.NAME_MISSING: "name",
+    RowError.NAME_TOO_LONG: "name",
+    RowError.EMAIL_INVALID: "email",
+    RowError.PHONE_INVALID: "phone",
+    RowError.LINKEDIN_TOO_LONG: "linkedin",
+    RowError.SCORE_INVALID: "verification_score",
+    RowError.SKU_MISSING: "sku",
+    RowError.PRICE_INVALID: "price",
+    RowError.CURRENCY_INVALID: "currency",
+}
+
+
+@dataclass
+class ValidationResult:
+    """
+    Normalized frame plus one error bitmask per row (0 = valid).
+    """
+
+    frame: pd.DataFrame
+    codes: np.ndarray
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Boolean validity mask aligned with `frame`."""
+        return self.codes == 0
+
+    @property
+    def valid_count(self) -> int:
+        return int(np.count_nonzero(self.codes == 0))
+
+    @property
+    def invalid_count(self) -> int:
+        return len(self.codes) - self.valid_count
+
+    def valid_frame(self) -> pd.DataFrame:
+        """Rows that passed every rule."""
+        return self.frame[self.valid]
+
+    def flagged_positions(self) -> np.ndarray:
+        """Positional indexes of rows with at least one error."""
+        return np.flatnonzero(self.codes)
+
+    def rows(self, positions: np.ndarray) -> List[Dict[str, Any]]:
+        """Normalized rows as dicts, with missing values as None."""
+        subset = self.frame.iloc[positions].astype(object)
+        return subset.where(subset.notna(), None).to_dict("records")
+
+    def errors(self, position: int) -> List[str]:
+        """Error code names for one row."""
+        code = RowError(int(self.codes[position]))
+        return [flag.name for flag in RowError if flag in code]
+
+    def error_counts(self) -> Dict[str, int]:
+        """Number of rows carrying each error code."""
+        return {
+            flag.name: int(np.count_nonzero(self.codes & flag.value))
+            for flag in RowError
+            if np.any(self.codes & flag.value)
+        }
+
+
+# ============ COLUMN HELPERS ============
+
+def read_csv_header(file_path: str) -> List[str]:
+    """Column names from the first line of a CSV."""
+    with open(file_path, newline="") as f:
+        return next(csv.reader(f), [])
+
+
+def _text_convert_options(file_path: str) -> "pa_csv.ConvertOptions":
+    """Arrow convert options reading every header column as a string."""
+    return pa_csv.ConvertOptions(
+        column_types={column: pa.string() for column in read_csv_header(file_path)},
+        strings_can_be_null=True,
+    )
+
+
+def _string_type(arrow_type: "pa.DataType") -> Optional[pd.StringDtype]:
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return STRING_DTYPE
+    return None
+
+
+def _to_frame(table: "pa.Table", start: int = 0) -> pd.DataFrame:
+    df = table.to_pandas(types_mapper=_string_type)
+    df.index = pd.RangeIndex(start, start + len(df))
+    return df
+
+
+def read_text_csv(file_path: str) -> pd.DataFrame:
+    """
+    Read a CSV with every column as text (blank cells are NA).
+    Uses the Arrow CSV reader when available, which avoids building
+    Python objects for each cell.
+    """
+    if not PYARROW_AVAILABLE:
+        return pd.read_csv(file_path, dtype=STRING_DTYPE, keep_default_na=False, na_values=[""])
+
+    return _to_frame(pa_csv.read_csv(file_path, convert_options=_text_convert_options(file_path)))
+
+
+def _read_record(f: BinaryIO, quotes: int = 0) -> int:
+    """
+    Read up to the end of the current CSV record: whole lines until the
+    quote count (starting from `quotes`) is even, so line breaks inside
+    quoted values are skipped. Returns the updated quote count.
+    """
+    line = f.readline()
+    quotes += line.count(b'"')
+    while quotes % 2 and line:
+        line = f.readline()
+        quotes += line.count(b'"')
+    return quotes
+
+
+def split_csv(file_path: str, shard_bytes: int) -> List[tuple[int, int]]:
+    """
+    Split a CSV's data section into (start, end) byte ranges of about
+    `shard_bytes`, each ending on a record boundary. Quotes are counted
+    from each range's start, so a cut that lands inside a quoted value
+    (odd count) moves on to the line break that closes the record; this
+    reads the whole file once. Unbalanced quotes run to the end of the file.
+    """
+    with open(file_path, "rb") as f:
+        _read_record(f)
+        start = f.tell()
+        size = f.seek(0, 2)
+        ranges = []
+        while start < size:
+            f.seek(start)
+            target = min(start + shard_bytes, size)
+            quotes = 0
+            while f.tell() < target:
+                quotes += f.read(min(CSV_SCAN_BYTES, target - f.tell())).count(b'"')
+            if target < size:
+                _read_record(f, quotes)
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def read_text_csv_range(file_path: str, start: int, end: int) -> pd.DataFrame:
+    """
+    Read the rows in one byte range from `split_csv` as a text frame,
+    using the file's header for column names.
+    """
+    columns = read_csv_header(file_path)
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    if not PYARROW_AVAILABLE:
+        return pd.read_csv(
+            io.BytesIO(data),
+            names=columns,
+            header=None,
+            dtype=STRING_DTYPE,
+            keep_default_na=False,
+            na_values=[""],
+        )
+
+    table = pa_csv.read_csv(
+        pa.BufferReader(data),
+        read_options=pa_csv.ReadOptions(column_names=columns),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={column: pa.string() for column in columns},
+            strings_can_be_null=True,
+        ),
+    )
+    return _to_frame(table)
+
+
+def iter_text_csv(file_path: str, chunk_rows: int, skip_rows: int = 0) -> Iterator[pd.DataFrame]:
+    """
+    Stream a CSV as text frames of at most `chunk_rows` rows, starting
+    after the first `skip_rows` data rows.
+    Only one chunk (plus one Arrow read block) is held at a time; the row
+    index continues across chunks.
+    """
+    if not PYARROW_AVAILABLE:
+        for chunk in pd.read_csv(
+            file_path,
+            dtype=STRING_DTYPE,
+            keep_default_na=False,
+            na_values=[""],
+            chunksize=chunk_rows,
+            skiprows=range(1, skip_rows + 1),
+        ):
+            chunk.index += skip_rows
+            yield chunk
+        return
+
+    reader = pa_csv.open_csv(
+        file_path,
+        read_options=pa_csv.ReadOptions(skip_rows_after_names=skip_rows),
+        convert_options=_text_convert_options(file_path),
+    )
+    yield from _rechunk(reader, chunk_rows, offset=skip_rows)
+
+
+def _rechunk(
+    batches: Iterable["pa.RecordBatch"],
+    chunk_rows: int,
+    offset: int = 0,
+    skip_rows: int = 0,
+) -> Iterator[pd.DataFrame]:
+    """
+    Regroup record batches into frames of exactly `chunk_rows` rows (the
+    last may be shorter), dropping the first `skip_rows` rows. Frame
+    indexes start at `offset + skip_rows` and continue across chunks.
+    """
+    pending: List["pa.RecordBatch"] = []
+    pending_rows = 0
+    offset += skip_rows
+
+    for batch in batches:
+        if skip_rows:
+            dropped = min(skip_rows, batch.num_rows)
+            batch = batch.slice(dropped)
+            skip_rows -= dropped
+        if not batch.num_rows:
+            continue
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        if pending_rows < chunk_rows:
+            continue
+        table = pa.Table.from_batches(pending)
+        while len(table) >= chunk_rows:
+            yield _to_frame(table.slice(0, chunk_rows), offset)
+            offset += chunk_rows
+            table = table.slice(chunk_rows)
+        pending = table.to_batches()
+        pending_rows = len(table)
+
+    if pending_rows:
+        yield _to_frame(pa.Table.from_batches(pending), offset)
+
+
+# ============ OTHER INPUT FORMATS ============
+
+def input_format(file_path: str) -> str:
+    """Input format from the file extension ("csv", "parquet", "arrow" or "ndjson")."""
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in INPUT_FORMATS:
+        raise ValueError(f"Unsupported input format: {file_path}")
+    return INPUT_FORMATS[extension]
+
+
+def _require_pyarrow(file_path: str) -> None:
+    if not PYARROW_AVAILABLE:
+        raise ImportError(f"pyarrow is required to read {file_path}")
+
+
+def _open_ipc(file_path: str):
+    """Arrow IPC reader over a memory map; file format first, then stream format."""
+    source = pa.memory_map(file_path)
+    try:
+        return pa_ipc.open_file(source)
+    except pa.ArrowInvalid:
+        source.seek(0)
+        return pa_ipc.open_stream(source)
+
+
+def _ipc_batches(reader) -> Iterator["pa.RecordBatch"]:
+    if isinstance(reader, pa_ipc.RecordBatchFileReader):
+        for i in range(reader.num_record_batches):
+            yield reader.get_batch(i)
+    else:
+        yield from reader
+
+
+def _ndjson_blocks(file_path: str) -> Iterator[bytes]:
+    """NDJSON file in blocks of about NDJSON_BLOCK_BYTES, cut at line ends."""
+    with open(file_path, "rb") as f:
+        while True:
+            block = f.read(NDJSON_BLOCK_BYTES)
+            if not block:
+                return
+            yield block + f.readline()
+
+
+def _ndjson_batches(file_path: str, columns: List[str]) -> Iterator["pa.RecordBatch"]:
+    """
+    Parse NDJSON block by block with Arrow. Values are cast to text and
+    aligned to `columns` so every block has the same schema as a CSV chunk.
+    """
+    schema = pa.schema([(column, pa.string()) for column in columns])
+    for block in _ndjson_blocks(file_path):
+        table = pa_json.read_json(pa.BufferReader(block))
+        arrays = [
+            pc.cast(table[column], pa.string()) if column in table.column_names
+            else pa.nulls(len(table), pa.string())
+            for column in columns
+        ]
+        yield from pa.Table.from_arrays(arrays, schema=schema).to_batches()
+
+
+def read_columns(file_path: str) -> List[str]:
+    """
+    Column names of any supported input. NDJSON columns are the keys of
+    the first record.
+    """
+    kind = input_format(file_path)
+    if kind == "csv":
+        return read_csv_header(file_path)
+    if kind == "ndjson":
+        with open(file_path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    return list(json.loads(line))
+        return []
+
+    _require_pyarrow(file_path)
+    if kind == "parquet":
+        return pq.read_schema(file_path, memory_map=True).names
+    return _open_ipc(file_path).schema.names
+
+
+def iter_input(file_path: str, chunk_rows: int, skip_rows: int = 0) -> Iterator[pd.DataFrame]:
+    """
+    Stream any supported input as frames of at most `chunk_rows` rows,
+    starting after the first `skip_rows` rows.
+
+    CSV and NDJSON yield text columns. Parquet and Arrow IPC keep their
+    column types and are memory-mapped; Parquet is read one row group at a
+    time and whole row groups before `skip_rows` are not decoded.
+    """
+    kind = input_format(file_path)
+    if kind == "csv":
+        yield from iter_text_csv(file_path, chunk_rows, skip_rows)
+        return
+
+    _require_pyarrow(file_path)
+    if kind == "ndjson":
+        yield from _rechunk(_ndjson_batches(file_path, read_columns(file_path)), chunk_rows, skip_rows=skip_rows)
+        return
+
+    if kind == "arrow":
+        yield from _rechunk(_ipc_batches(_open_ipc(file_path)), chunk_rows, skip_rows=skip_rows)
+        return
+
+    parquet = pq.ParquetFile(file_path, memory_map=True)
+    offset, first_group = 0, 0
+    while first_group < parquet.num_row_groups:
+        group_rows = parquet.metadata.row_group(first_group).num_rows
+        if offset + group_rows > skip_rows:
+            break
+        offset += group_rows
+        first_group += 1
+
+    row_groups = list(range(first_group, parquet.num_row_groups))
+    if row_groups:
+        batches = parquet.iter_batches(batch_size=chunk_rows, row_groups=row_groups)
+        yield from _rechunk(batches, chunk_rows, offset=offset, skip_rows=skip_rows - offset)
+
+
+class ParquetSpill:
+    """
+    Appends cleaned chunks to a Parquet file, one row group per chunk.
+
+    The spilled file is itself a valid input: re-validating or re-deduping
+    from it skips parsing the raw files. Resolved supplier ids are not
+    kept; they are re-resolved on the next run.
+    """
+
+    def __init__(self, path: str):
+        _require_pyarrow(path)
+        self.path = path
+        self.rows = 0
+        self._writer: Optional["pq.ParquetWriter"] = None
+
+    def write(self, frame: pd.DataFrame) -> None:
+        frame = frame.drop(columns=["supplier_id"], errors="ignore")
+        if self._writer is None:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        else:
+            table = pa.Table.from_pandas(frame, schema=self._writer.schema, preserve_index=False)
+        self._writer.write_table(table)
+        self.rows += len(frame)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def _text(df: pd.DataFrame, column: str) -> pd.Series:
+    """Column as stripped strings; blank or absent values become NA."""
+    if column not in df.columns:
+        return pd.Series(pd.NA, index=df.index, dtype=STRING_DTYPE)
+    values = df[column].astype(STRING_DTYPE).str.strip()
+    return values.mask(values == "")
+
+
+def _number(df: pd.DataFrame, column: str, default: float) -> tuple[pd.Series, np.ndarray]:
+    """
+    Column as floats. Returns (values, invalid) where invalid marks cells
+    that are present but not numeric; blank cells get `default`.
+    """
+    if column not in df.columns:
+        return pd.Series(default, index=df.index, dtype="float64"), np.zeros(len(df), dtype=bool)
+    raw = df[column]
+    if isinstance(raw.dtype, pd.StringDtype):
+        numeric = raw.str.fullmatch(_NUMBER_PATTERN)
+        invalid = raw.notna().to_numpy() & ~numeric.to_numpy(dtype=bool, na_value=False)
+        text = raw.mask(invalid).str.strip()
+        if PYARROW_AVAILABLE:
+            values = pd.Series(
+                pc.cast(pa.array(text), pa.float64()).to_numpy(zero_copy_only=False),
+                index=raw.index,
+            )
+        else:
+            values = text.astype("float64")
+    else:
+        values = pd.to_numeric(raw, errors="coerce").astype("float64")
+        invalid = values.isna().to_numpy() & raw.notna().to_numpy()
+    # Invalid cells stay NaN so a per-row re-check rejects them too
+    return values.mask(values.isna() & ~invalid, default), invalid
+
+
+def _digits(phone: pd.Series) -> pd.Series:
+    """Keep only digits and '+'; blank results become NA."""
+    for separator in _PHONE_SEPARATORS:
+        phone = phone.str.replace(separator, "", regex=False)
+    other = ~phone.str.fullmatch(r"[0-9+]*").fillna(True)
+    if other.any():
+        phone = phone.mask(other, phone[other].str.replace(r"[^\d+]", "", regex=True))
+    return phone.mask(phone == "")
+
+
+def _flag(codes: np.ndarray, mask, error: RowError) -> None:
+    """OR an error code into every row where `mask` is true."""
+    if isinstance(mask, pd.Series):
+        mask = mask.to_numpy(dtype=bool, na_value=False)
+    codes[mask] |= error.value
+
+
+# ============ VALIDATORS ============
+
+def validate_suppliers(df: pd.DataFrame) -> ValidationResult:
+    """
+    Validate a suppliers frame (name, email, phone, linkedin, verification_score).
+
+    Phones are normalized to E.164 when they parse (national numbers are
+    read in settings.phone_default_country) and to digits and '+'
+    otherwise; scores are clamped to [0, 1], non-numeric scores are rejected.
+    """
+    codes = np.zeros(len(df), dtype=np.uint16)
+
+    name = _text(df, "name")
+    _flag(codes, name.isna(), RowError.NAME_MISSING)
+    _flag(codes, name.str.len() > MAX_NAME_LENGTH, RowError.NAME_TOO_LONG)
+
+    email = _text(df, "email")
+    _flag(codes, email.notna() & ~email.str.fullmatch(EMAIL_PATTERN).fillna(False), RowError.EMAIL_INVALID)
+
+    raw_phone = _text(df, "phone")
+    phone = _digits(raw_phone)
+    _flag(codes, phone.str.len() > MAX_PHONE_LENGTH, RowError.PHONE_INVALID)
+    parsed = normalize_phones(raw_phone, settings.phone_default_country)
+    phone = phone.mask(parsed["valid"], parsed["e164"].astype(STRING_DTYPE))
+
+    linkedin = _text(df, "linkedin")
+    _flag(codes, linkedin.str.len() > MAX_LINKEDIN_LENGTH, RowError.LINKEDIN_TOO_LONG)
+
+    score, score_invalid = _number(df, "verification_score", 0.0)
+    _flag(codes, score_invalid, RowError.SCORE_INVALID)
+
+    frame = pd.DataFrame({
+        "name": name,
+        "email": email,
+        "phone": phone,
+        "linkedin": linkedin,
+        "verification_score": score.clip(0.0, 1.0),
+    }, index=df.index)
+
+    return ValidationResult(frame=frame, codes=codes)
+
+
+def validate_products(
+    df: pd.DataFrame,
+    supplier_mapping: Optional[Mapping[str, Any]] = None,
+) -> ValidationResult:
+    """
+    Validate a products frame (supplier_name, sku, price_min, price_max, currency, ...).
+
+    Only rows whose supplier_name is in `supplier_mapping` are kept; the
+    resolved id is added as `supplier_id`. Without a mapping every row
+    with a supplier_name is kept and `supplier_id` is left for the loader
+    to resolve.
+    """
+    suppliers = _text(df, "supplier_name")
+    if supplier_mapping is None:
+        known = suppliers.notna().to_numpy()
+    else:
+        known = suppliers.isin(supplier_mapping.keys()).to_numpy(dtype=bool, na_value=False)
+    df, suppliers = df[known], suppliers[known]
+
+    codes = np.zeros(len(df), dtype=np.uint16)
+
+    sku = _text(df, "sku")
+    _flag(codes, sku.isna(), RowError.SKU_MISSING)
+
+    price_min, min_invalid = _number(df, "price_min", 0.0)
+    price_max, max_invalid = _number(df, "price_max", 0.0)
+    _flag(codes, min_invalid | max_invalid, RowError.PRICE_INVALID)
+    _flag(codes, (price_min < 0) | (price_max < 0), RowError.PRICE_INVALID)
+
+    currency = _text(df, "currency").fillna("USD")
+    _flag(codes, currency.str.len() > MAX_CURRENCY_LENGTH, RowError.CURRENCY_INVALID)
+
+    frame = pd.DataFrame({
+        "supplier_name": suppliers,
+        "supplier_id": suppliers.map(supplier_mapping) if supplier_mapping is not None else None,
+        "sku": sku,
+        "product_name": _text(df, "product_name"),
+        "category": _text(df, "category"),
+        "description": _text(df, "description"),
+        "tags": _text(df, "tags"),
+        "price_min": price_min,
+        "price_max": price_max,
+        "currency": currency,
+    }, index=df.index)
+
+    return ValidationResult(frame=frame, codes=codes)
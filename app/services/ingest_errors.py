@@ -0,0 +1,224 @@
+"""
+Bounded error accounting for ingestion.
+Counts rejected rows per error code and column, keeps a fixed-size
+reservoir sample of example rows per code and can stream every rejected
+row to a reject file, so memory does not grow with the number of errors.
+"""
+
+import csv
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+from app.services.columnar import ERROR_COLUMNS, RowError, ValidationResult
+
+
+class Reservoir:
+    """Uniform sample of at most `size` items from a stream (Algorithm R)."""
+
+    def __init__(self, size: int, rng: np.random.Generator):
+        self.size = size
+        self.seen = 0
+        self.items: List[Any] = []
+        self._rng = rng
+
+    def offer(self, count: int, build: Callable[[List[int]], List[Any]]) -> None:
+        """
+        Offer the next `count` stream items. Only the items that enter the
+        sample are materialized: `build` gets their offsets in stream
+        order and returns them.
+        """
+        picks = self._picks(count)
+        if picks:
+            for slot, item in zip(picks.values(), build(list(picks))):
+                if slot == len(self.items):
+                    self.items.append(item)
+                else:
+                    self.items[slot] = item
+        self.seen += count
+
+    def _picks(self, count: int) -> Dict[int, int]:
+        """{item offset: slot}; a slot equal to the sample length appends."""
+        fill = min(max(self.size - len(self.items), 0), count)
+        picks = {offset: len(self.items) + offset for offset in range(fill)}
+
+        # Item at stream position p replaces a random slot with probability size / (p + 1)
+        positions = self.seen + np.arange(fill, count)
+        slots = self._rng.integers(0, positions + 1) if len(positions) else positions
+        for offset in np.flatnonzero(slots < self.size):
+            picks[fill + int(offset)] = int(slots[offset])
+        return picks
+
+    @property
+    def weight(self) -> float:
+        """Stream items each sampled item stands for."""
+        return self.seen / len(self.items) if self.items else 0.0
+
+
+class ErrorLedger:
+    """
+    Structured, bounded record of why rows were rejected.
+
+    `record` takes one validated chunk and its raw rows; `note` takes a
+    free-text message (e.g. a Pydantic error) under a category. Memory is
+    O(codes * sample_size) regardless of how many rows fail.
+    """
+
+    def __init__(
+        self,
+        sample_size: Optional[int] = None,
+        reject_path: Optional[str] = None,
+        seed: Optional[int] = None,
+        resume_row: int = 0,
+    ):
+        self.sample_size = settings.ingest_error_samples if sample_size is None else sample_size
+        self.reject_path = reject_path
+        self.resume_row = resume_row
+        self.rejected = 0
+        self.by_code: Dict[str, int] = {}
+        self.by_column: Dict[str, int] = {}
+        self.messages: Dict[str, int] = {}
+        self._rng = np.random.default_rng(seed)
+        self._samples: Dict[str, Reservoir] = {}
+        self._message_samples: Dict[str, Reservoir] = {}
+        self._reject_file = None
+        self._reject_columns: Optional[List[str]] = None
+
+    def _reservoir(self, table: Dict[str, Reservoir], key: str) -> Reservoir:
+        if key not in table:
+            table[key] = Reservoir(self.sample_size, self._rng)
+        return table[key]
+
+    def record(self, result: ValidationResult, raw: pd.DataFrame) -> None:
+        """Account for the flagged rows of one chunk."""
+        positions = result.flagged_positions()
+        if not len(positions):
+            return
+
+        codes = result.codes[positions]
+        index = result.frame.index[positions]
+        self.rejected += len(positions)
+
+        columns: Dict[str, np.ndarray] = {}
+        for flag in RowError:
+            hit = (codes & flag.value) != 0
+            count = int(np.count_nonzero(hit))
+            if not count:
+                continue
+            self.by_code[flag.name] = self.by_code.get(flag.name, 0) + count
+            column = ERROR_COLUMNS[flag]
+            columns[column] = columns[column] | hit if column in columns else hit
+
+            hits = np.flatnonzero(hit)
+            self._reservoir(self._samples, flag.name).offer(
+                len(hits), lambda offsets: self._examples(raw, index[hits[offsets]], codes[hits[offsets]])
+            )
+
+        for column, hit in columns.items():
+            self.by_column[column] = self.by_column.get(column, 0) + int(np.count_nonzero(hit))
+
+        if self.reject_path:
+            self._write_rejects(raw, index, codes)
+
+    @staticmethod
+    def _describe(code: int) -> str:
+        return "|".join(flag.name for flag in RowError if code & flag.value)
+
+    def _examples(self, raw: pd.DataFrame, index: pd.Index, codes: np.ndarray) -> List[Dict[str, Any]]:
+        rows = raw.loc[index].astype(object)
+        rows = rows.where(rows.notna(), None).to_dict("records")
+        return [
+            {"row": int(i), "errors": self._describe(int(code)), "values": row}
+            for i, code, row in zip(index, codes, rows)
+        ]
+
+    def _open_rejects(self, columns: List[str]) -> None:
+        """
+        Start the reject file. When resuming, rows before `resume_row`
+        (from chunks an earlier run committed) are kept and later ones,
+        which this run re-validates, are dropped.
+        """
+        self._reject_columns = columns
+        if self.resume_row and os.path.exists(self.reject_path):
+            tmp_path = f"{self.reject_path}.tmp"
+            with open(self.reject_path, newline="") as src, open(tmp_path, "w", newline="") as dst:
+                reader, writer = csv.reader(src), csv.writer(dst)
+                writer.writerow(next(reader, None) or ["row", "errors", *columns])
+                for record in reader:
+                    if int(record[0]) >= self.resume_row:
+                        break  # Rows are written in file order
+                    writer.writerow(record)
+            os.replace(tmp_path, self.reject_path)
+            self._reject_file = open(self.reject_path, "a", newline="")
+            return
+        self._reject_file = open(self.reject_path, "w", newline="")
+        csv.writer(self._reject_file).writerow(["row", "errors", *columns])
+
+    def _write_rejects(self, raw: pd.DataFrame, index: pd.Index, codes: np.ndarray) -> None:
+        """Append rejected raw rows (row number, error codes, original values)."""
+        if self._reject_file is None:
+            self._open_rejects(list(raw.columns))
+
+        rejects = raw.loc[index, self._reject_columns]
+        rejects.insert(0, "errors", [self._describe(int(code)) for code in codes])
+        rejects.insert(0, "row", index)
+        rejects.to_csv(self._reject_file, header=False, index=False)
+
+    def note(self, category: str, message: str) -> None:
+        """Count a free-text error under `category`, keeping a bounded sample."""
+        self.messages[category] = self.messages.get(category, 0) + 1
+        self._reservoir(self._message_samples, category).offer(1, lambda _: [message])
+
+    def merge(self, other: "ErrorLedger") -> None:
+        """
+        Fold in a ledger from another shard. Samples are combined and
+        subsampled in proportion to each side's counts.
+        """
+        self.rejected += other.rejected
+        for target, source in ((self.by_code, other.by_code), (self.by_column, other.by_column),
+                               (self.messages, other.messages)):
+            for key, count in source.items():
+                target[key] = target.get(key, 0) + count
+
+        for mine, theirs in ((self._samples, other._samples), (self._message_samples, other._message_samples)):
+            for key, reservoir in theirs.items():
+                if key not in mine:
+                    mine[key] = Reservoir(self.sample_size, self._rng)
+                self._merge_reservoir(mine[key], reservoir)
+
+    def _merge_reservoir(self, mine: Reservoir, theirs: Reservoir) -> None:
+        items = mine.items + theirs.items
+        weights = np.array([mine.weight] * len(mine.items) + [theirs.weight] * len(theirs.items))
+        mine.seen += theirs.seen
+        if len(items) > self.sample_size:
+            chosen = self._rng.choice(len(items), size=self.sample_size, replace=False, p=weights / weights.sum())
+            items = [items[i] for i in sorted(chosen)]
+        mine.items = items
+
+    def close(self) -> None:
+        if self._reject_file is None and self.reject_path and self.resume_row and os.path.exists(self.reject_path):
+            self._open_rejects([])  # Drop rows of re-validated chunks even if none were rejected again
+        if self._reject_file is not None:
+            self._reject_file.close()
+            self._reject_file = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Snapshots each table first, so progress can be read while the
+        # pipeline thread is still recording
+        samples = list(self._samples.items())
+        message_samples = dict(self._message_samples)
+        return {
+            "rejected": self.rejected,
+            "by_code": dict(self.by_code),
+            "by_column": dict(self.by_column),
+            "samples": {code: list(r.items) for code, r in samples},
+            "messages": {
+                category: {"count": count, "samples": list(message_samples[category].items)}
+                for category, count in list(self.messages.items())
+                if category in message_samples
+            },
+            "reject_file": self.reject_path,
+        }
@@ -0,0 +1,207 @@
+"""
+Resumable ingestion jobs.
+Each file load is a job whose checkpoint (file fingerprint, chunk size,
+chunks and rows committed) lives in a local SQLite table, so an
+interrupted load restarts from its last committed chunk.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from app.core.config import settings
+
+# Bytes hashed from each end of a file for its fingerprint
+FINGERPRINT_SAMPLE_BYTES = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingest_jobs (
+    id TEXT PRIMARY KEY,
+    file_path TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    chunk_rows INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    chunks_committed INTEGER NOT NULL DEFAULT 0,
+    rows_processed INTEGER NOT NULL DEFAULT 0,
+    rows_committed INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    started_at TEXT,
+    stats TEXT,
+    owner TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_ingest_jobs_file ON ingest_jobs (file_path, status);
+"""
+
+# Columns added after the first release of the table
+_MIGRATIONS = {
+    "started_at": "ALTER TABLE ingest_jobs ADD COLUMN started_at TEXT",
+    "stats": "ALTER TABLE ingest_jobs ADD COLUMN stats TEXT",
+    "owner": "ALTER TABLE ingest_jobs ADD COLUMN owner TEXT",
+}
+
+
+def file_fingerprint(file_path: str) -> str:
+    """
+    Identify a file's contents without reading all of it: size plus a
+    hash of the first and last megabyte.
+    """
+    size = os.path.getsize(file_path)
+    digest = hashlib.sha256(str(size).encode())
+    with open(file_path, "rb") as f:
+        digest.update(f.read(FINGERPRINT_SAMPLE_BYTES))
+        if size > FINGERPRINT_SAMPLE_BYTES:
+            f.seek(max(size - FINGERPRINT_SAMPLE_BYTES, FINGERPRINT_SAMPLE_BYTES))
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+@dataclass
+class IngestJob:
+    """One file load and its checkpoint."""
+
+    id: str
+    file_path: str
+    fingerprint: str
+    kind: str
+    chunk_rows: int
+    status: str  # queued, running, completed, failed
+    chunks_committed: int = 0
+    rows_processed: int = 0
+    rows_committed: int = 0
+    error: Optional[str] = None
+    created_at: str = ""
+    updated_at: str = ""
+    started_at: Optional[str] = None
+    stats: Optional[str] = None  # JSON summary: counters, timings, errors
+    owner: Optional[str] = None  # API key ID that submitted an uploaded job
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        return json.loads(self.stats) if self.stats else {}
+
+
+class JobStore:
+    """
+    SQLite-backed job table. Each checkpoint is its own transaction, so a
+    crash loses at most the chunk that was being written. Several
+    processes (API workers, job runners) can share one file.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.ingest_job_db
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_SCHEMA)
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(ingest_jobs)")}
+        for column, ddl in _MIGRATIONS.items():
+            if column not in columns:
+                self._conn.execute(ddl)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _get(self, where: str, params: tuple) -> Optional[IngestJob]:
+        row = self._conn.execute(
+            f"SELECT * FROM ingest_jobs WHERE {where} ORDER BY created_at DESC LIMIT 1", params
+        ).fetchone()
+        return IngestJob(**dict(row)) if row else None
+
+    def get(self, job_id: str) -> Optional[IngestJob]:
+        return self._get("id = ?", (job_id,))
+
+    def find_resumable(self, file_path: str) -> Optional[IngestJob]:
+        """Latest unfinished job for a file, if any."""
+        return self._get("file_path = ? AND status != 'completed'", (os.path.abspath(file_path),))
+
+    def create(
+        self,
+        file_path: str,
+        kind: str,
+        chunk_rows: int,
+        status: str = "running",
+        owner: Optional[str] = None,
+    ) -> IngestJob:
+        """Register a new job for a file, running now or queued for a runner."""
+        now = datetime.utcnow().isoformat()
+        job = IngestJob(
+            id=str(uuid4()),
+            file_path=os.path.abspath(file_path),
+            fingerprint=file_fingerprint(file_path),
+            kind=kind,
+            chunk_rows=chunk_rows,
+            status=status,
+            created_at=now,
+            updated_at=now,
+            started_at=now if status == "running" else None,
+            owner=owner,
+        )
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO ingest_jobs"
+                " (id, file_path, fingerprint, kind, chunk_rows, status, created_at, updated_at, started_at, owner)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job.id, job.file_path, job.fingerprint, kind, chunk_rows, job.status, now, now, job.started_at, owner),
+            )
+        return job
+
+    def start(self, job: IngestJob, kind: Optional[str] = None) -> None:
+        """Mark a queued (or resumed) job as running, recording its kind once detected."""
+        job.status = "running"
+        job.kind = kind or job.kind
+        job.updated_at = datetime.utcnow().isoformat()
+        job.started_at = job.started_at or job.updated_at
+        with self._conn:
+            self._conn.execute(
+                "UPDATE ingest_jobs SET status = 'running', kind = ?, started_at = ?, updated_at = ? WHERE id = ?",
+                (job.kind, job.started_at, job.updated_at, job.id),
+            )
+
+    def checkpoint(
+        self,
+        job: IngestJob,
+        chunk_index: int,
+        processed: int,
+        committed: int,
+        stats: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record that every chunk up to `chunk_index` is committed, with an optional stats summary."""
+        job.chunks_committed = chunk_index + 1
+        job.rows_processed += processed
+        job.rows_committed += committed
+        job.updated_at = datetime.utcnow().isoformat()
+        if stats is not None:
+            job.stats = json.dumps(stats, default=str)
+        with self._conn:
+            self._conn.execute(
+                "UPDATE ingest_jobs SET chunks_committed = ?, rows_processed = ?, rows_committed = ?,"
+                " status = 'running', updated_at = ?, stats = ? WHERE id = ?",
+                (job.chunks_committed, job.rows_processed, job.rows_committed, job.updated_at, job.stats, job.id),
+            )
+
+    def finish(self, job: IngestJob, error: Optional[str] = None, stats: Optional[Dict[str, Any]] = None) -> None:
+        """Mark a job completed, or failed with an error."""
+        job.status = "failed" if error else "completed"
+        job.error = error
+        job.updated_at = datetime.utcnow().isoformat()
+        if stats is not None:
+            job.stats = json.dumps(stats, default=str)
+        with self._conn:
+            self._conn.execute(
+                "UPDATE ingest_jobs SET status = ?, error = ?, updated_at = ?, stats = ? WHERE id = ?",
+                (job.status, error, job.updated_at, job.stats, job.id),
+            )
+
+    def list(self, limit: int = 20) -> List[IngestJob]:
+        """Most recent jobs first."""
+        rows = self._conn.execute(
+            "SELECT * FROM ingest_jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [IngestJob(**dict(row)) for row in rows]
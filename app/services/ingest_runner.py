@@ -0,0 +1,215 @@
+"""
+Background runner for uploaded ingestion jobs.
+Jobs run in a small pool of spawned processes, so parsing and validation
+never compete with an API worker's event loop; progress, throughput and
+errors are written to the shared job table after every chunk.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.services.ingest_jobs import IngestJob, JobStore
+
+logger = logging.getLogger(__name__)
+
+# Accepted upload extensions; mirrors columnar.INPUT_FORMATS so the API
+# process does not have to import pandas to check them
+UPLOAD_SUFFIXES = (".csv", ".parquet", ".pq", ".arrow", ".feather", ".ipc", ".ndjson", ".jsonl")
+
+# Kind recorded for uploads until the runner reads the file's columns
+AUTO_KIND = "auto"
+
+
+def run_job(job_id: str) -> None:
+    """Process-pool entry point: run one job to completion."""
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run_job(job_id))
+
+
+async def _run_job(job_id: str) -> None:
+    from app.core.database import get_engine
+    from app.services.bulk_loader import BulkLoader
+    from app.services.columnar import read_columns
+    from app.services.ingestion import IngestionService, detect_kind
+
+    store = JobStore()
+    job = store.get(job_id)
+    if job is None:
+        # Deleted (or never committed) before the pool got to it
+        logger.warning(f"Ingest job {job_id} not found; nothing to run")
+        store.close()
+        return
+
+    service = IngestionService()
+    engine = get_engine()
+    try:
+        kind = detect_kind(read_columns(job.file_path)) if job.kind == AUTO_KIND else job.kind
+        if kind is None:
+            raise ValueError("File is neither a suppliers nor a products file")
+        store.start(job, kind)
+
+        async with BulkLoader(engine) as loader:
+            # Per-stage seconds so far, so live progress reports timings too
+            timings = dict.fromkeys(("parse", "validate", "dedupe", "write"), 0.0)
+
+            def progress(chunk) -> None:
+                for stage in timings:
+                    timings[stage] += getattr(chunk, f"{stage}_seconds")
+                store.checkpoint(
+                    job, chunk.index, chunk.rows, chunk.written,
+                    stats={
+                        "timings": {stage: round(seconds, 3) for stage, seconds in timings.items()},
+                        "errors": service.errors.to_dict(),
+                        "loader": dict(loader.stats),
+                    },
+                )
+
+            stats = await service.process_file(
+                job.file_path,
+                None,
+                writer=loader.write_suppliers if kind == "suppliers" else loader.write_products,
+                chunk_rows=job.chunk_rows,
+                start_chunk=job.chunks_committed,
+                on_chunk=progress,
+                # No reject file: the error summary in the job status (counts
+                # per code plus example rows) is all an API caller can reach
+            )
+        store.finish(job, stats={**stats, "loader": dict(loader.stats)})
+        logger.info(f"Ingest job {job.id} completed: {job.rows_committed} rows committed")
+    except Exception as e:
+        logger.exception(f"Ingest job {job.id} failed")
+        store.finish(job, error=str(e) or type(e).__name__, stats=service.get_stats())
+    finally:
+        # Nothing re-runs a finished job, failed or not, so its upload is not kept
+        discard_upload(job.file_path)
+        store.close()
+        await engine.dispose()
+
+
+def discard_upload(file_path: str) -> None:
+    """Delete an uploaded file once its job has finished."""
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+
+
+def job_status(job: IngestJob) -> Dict[str, Any]:
+    """Progress report for one job, with throughput since it started."""
+    elapsed = 0.0
+    if job.started_at:
+        end = datetime.utcnow() if job.status == "running" else datetime.fromisoformat(job.updated_at)
+        elapsed = max((end - datetime.fromisoformat(job.started_at)).total_seconds(), 0.0)
+
+    summary = job.summary
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "kind": job.kind,
+        "chunks_committed": job.chunks_committed,
+        "rows_processed": job.rows_processed,
+        "rows_committed": job.rows_committed,
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(job.rows_processed / elapsed) if elapsed else 0,
+        "timings": summary.get("timings"),
+        "errors": summary.get("errors"),
+        "error": job.error,
+        "created_at": job.created_at,
+        "updated_at": job.updated_at,
+    }
+
+
+class IngestRunner:
+    """
+    Bounded-concurrency job runner. At most `max_jobs` jobs run at once
+    per API worker; later submissions wait in the pool's queue with
+    status "queued".
+    """
+
+    def __init__(self, max_jobs: Optional[int] = None):
+        self.max_jobs = max_jobs or settings.ingest_max_jobs
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        # Created on first use, so pre-forked API workers each get their own
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_jobs,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    def submit(
+        self,
+        file_path: str,
+        kind: str = AUTO_KIND,
+        chunk_rows: Optional[int] = None,
+        owner: Optional[str] = None,
+    ) -> IngestJob:
+        """
+        Register a queued job for a file on disk and hand it to the pool.
+        `owner` (an API key ID) is the only caller allowed to see the job.
+        """
+        store = JobStore()
+        try:
+            job = store.create(file_path, kind, chunk_rows or settings.ingest_chunk_rows, status="queued", owner=owner)
+        finally:
+            store.close()
+
+        future = self._executor().submit(run_job, job.id)
+        future.add_done_callback(lambda f: self._on_done(job.id, f))
+        return job
+
+    def _on_done(self, job_id: str, future: Future) -> None:
+        """
+        Fail jobs whose worker process died or was cancelled (deleting
+        their uploads), and purge cached responses once a job has
+        committed rows.
+        """
+        from app.core.response_cache import response_cache
+
+        error = None
+        if future.cancelled():
+            error = "Cancelled before it started"
+        elif future.exception() is not None:
+            error = f"Runner crashed: {future.exception()}"
+            self._pool = None  # A broken pool cannot take new work
+
+        store = JobStore()
+        try:
+            job = store.get(job_id)
+            if job and error and job.status in ("queued", "running"):
+                store.finish(job, error=error)
+                discard_upload(job.file_path)
+        finally:
+            store.close()
+
+        # The spawned job process cannot reach the shared cache generations,
+        # and a file may touch any supplier, so purge from here
+        if job and job.rows_committed:
+            response_cache.purge_all()
+
+    def status(self, job_id: str, owner: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Current progress of a job, or None if unknown or submitted by another owner."""
+        store = JobStore()
+        try:
+            job = store.get(job_id)
+        finally:
+            store.close()
+        return job_status(job) if job and job.owner == owner else None
+
+    def shutdown(self) -> None:
+        """Drop queued jobs; running ones finish in their own processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# Global runner instance
+ingest_runner = IngestRunner()
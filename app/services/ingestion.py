@@ -1,10 +1,10 @@
 """
 Data ingestion service.
-Handles CSV parsing, validation, and enrichment.
+Handles CSV, Parquet, Arrow IPC and NDJSON parsing, validation, and enrichment.
 """
 
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from uuid import uuid4
 
 import pandas as pd
@@ -12,6 +12,22 @@ from pydantic import ValidationError
 
 from app.core.config import settings
 from app.models.domain import Supplier, Product
+from app.services.columnar import (
+    ValidationResult,
+    read_columns,
+    validate_products,
+    validate_suppliers,
+)
+from app.services.ingest_errors import ErrorLedger
+from app.services.profiles import ProfilePlan
+from app.services.validation.rules import get_rule_set
+from app.services.streaming import (
+    ChunkStats,
+    ChunkValidator,
+    ChunkWriter,
+    DedupeKey,
+    StreamingPipeline,
+)
 from app.models.schemas import (
     ContactData,
     SupplierCreate,
@@ -21,31 +37,38 @@ from app.models.schemas import (
 )
 
 
+def detect_kind(columns: List[str]) -> Optional[str]:
+    """Classify a file by its columns as "suppliers", "products" or None."""
+    if "email" in columns or "phone" in columns:
+        return "suppliers"
+    if "sku" in columns or "price_min" in columns:
+        return "products"
+    return None
+
+
 class IngestionService:
     """
     Service for ingesting and validating data from various sources.
     """
 
     def __init__(self):
-        self.stats = {
-            "processed": 0,
-            "valid": 0,
-            "invalid": 0,
-            "errors": [],
-        }
+        self.reset_stats()
 
-    def reset_stats(self) -> None:
-        """Reset ingestion statistics."""
+    def reset_stats(self, reject_path: Optional[str] = None, resume_row: int = 0) -> None:
+        """
+        Reset ingestion statistics, optionally streaming rejected rows to
+        `reject_path` (kept up to `resume_row` when resuming).
+        """
         self.stats = {
             "processed": 0,
             "valid": 0,
             "invalid": 0,
-            "errors": [],
         }
+        self.errors = ErrorLedger(reject_path=reject_path, resume_row=resume_row)
 
     def get_stats(self) -> Dict[str, Any]:
-        """Get current ingestion statistics."""
-        return self.stats
+        """Get current ingestion statistics, with a bounded error summary."""
+        return {**self.stats, "errors": self.errors.to_dict()}
 
     def validate_contact(self, contact_data: Dict[str, Any]) -> Optional[ContactData]:
         """
@@ -55,7 +78,7 @@ class IngestionService:
         try:
             return ContactData(**contact_data)
         except ValidationError as e:
-            self.stats["errors"].append(f"Contact validation error: {e}")
+            self.errors.note("contact", str(e))
             return None
 
     def validate_supplier(self, row: Dict[str, Any]) -> Optional[SupplierCreate]:
@@ -74,7 +97,6 @@ class IngestionService:
             # Validate contact
             validated_contact = self.validate_contact(contact)
             if not validated_contact:
-                self.stats["invalid"] += 1
                 return None
 
             return SupplierCreate(
@@ -83,8 +105,7 @@ class IngestionService:
                 verification_score=float(row.get("verification_score", 0.0)),
             )
         except Exception as e:
-            self.stats["errors"].append(f"Supplier error: {e}")
-            self.stats["invalid"] += 1
+            self.errors.note("supplier", str(e))
             return None
 
     def validate_product(self, row: Dict[str, Any], supplier_id: uuid4) -> Optional[ProductCreate]:
@@ -116,55 +137,162 @@ class IngestionService:
                 attributes=sku.attributes,
             )
         except Exception as e:
-            self.stats["errors"].append(f"Product error: {e}")
-            self.stats["invalid"] += 1
+            self.errors.note("product", str(e))
             return None
 
-    async def process_csv(
+    def _confirm_flagged(self, result: ValidationResult, validate_row) -> None:
+        """
+        Re-check rows the columnar rules flagged with the Pydantic schemas.
+        Rows the schemas accept are cleared; the rest keep their error
+        codes and their messages are counted in the error ledger.
+        """
+        positions = result.flagged_positions()
+        for position, row in zip(positions, result.rows(positions)):
+            if validate_row(row):
+                result.codes[position] = 0
+
+    def chunk_validator(
+        self,
+        columns: List[str],
+        supplier_mapping: Optional[Dict[str, uuid4]],
+        profile: Optional[ProfilePlan] = None,
+    ) -> Optional[Tuple[ChunkValidator, DedupeKey]]:
+        """
+        Pick the validator and dedupe key for a suppliers or products file.
+        With a profile, its kind is used and each raw chunk is rewritten
+        into canonical columns before validation. Returns None if the
+        columns match neither kind.
+        """
+        if profile is not None:
+            profile.check(columns)
+            kind = profile.kind
+            canonical = profile.apply
+        else:
+            kind = detect_kind(columns)
+            canonical = lambda df: df
+
+        if kind == "suppliers":
+            def validate(df: pd.DataFrame) -> ValidationResult:
+                result = validate_suppliers(canonical(df))
+                self._confirm_flagged(result, self.validate_supplier)
+                return result
+
+            return validate, lambda rows: rows["name"].str.lower()
+
+        if kind == "products":
+            def validate(df: pd.DataFrame) -> ValidationResult:
+                result = validate_products(canonical(df), supplier_mapping)
+                # Unmapped rows get a placeholder id; the loader resolves the real one
+                self._confirm_flagged(
+                    result, lambda row: self.validate_product(row, row["supplier_id"] or uuid4())
+                )
+                return result
+
+            return validate, lambda rows: rows[["supplier_name", "sku"]]
+
+        return None
+
+    def validate_frame(
+        self,
+        df: pd.DataFrame,
+        supplier_mapping: Optional[Dict[str, uuid4]],
+    ) -> Optional[ValidationResult]:
+        """
+        Validate a whole suppliers or products frame column-wise.
+        Returns None if the frame is neither.
+        """
+        plan = self.chunk_validator(list(df.columns), supplier_mapping)
+        if plan is None:
+            return None
+
+        result = plan[0](df)
+        self.errors.record(result, df)
+        self.stats["processed"] += len(result.codes)
+        self.stats["valid"] += result.valid_count
+        self.stats["invalid"] += result.invalid_count
+        return result
+
+    async def process_file(
         self,
         file_path: str,
-        supplier_mapping: Dict[str, uuid4],
+        supplier_mapping: Optional[Dict[str, uuid4]],
+        writer: Optional[ChunkWriter] = None,
+        chunk_rows: Optional[int] = None,
+        start_chunk: int = 0,
+        on_chunk: Optional[Callable[[ChunkStats], None]] = None,
+        spill_path: Optional[str] = None,
+        reject_path: Optional[str] = None,
+        profile: Optional[ProfilePlan] = None,
     ) -> Dict[str, Any]:
         """
-        Process a CSV file and ingest suppliers and products.
+        Process a CSV, Parquet, Arrow IPC or NDJSON file (by extension) and
+        ingest suppliers and products.
+
+        The file is streamed in chunks of `chunk_rows` (default
+        settings.ingest_chunk_rows), so memory stays flat for any file size.
 
         Args:
-            file_path: Path to CSV file
-            supplier_mapping: Mapping of supplier names to IDs
+            file_path: Path to the input file
+            supplier_mapping: Mapping of supplier names to IDs, or None to
+                keep every product row and let the writer resolve suppliers
+            writer: Async callback persisting each chunk of valid, new rows
+            chunk_rows: Rows per chunk
+            start_chunk: First chunk to process when resuming a job
+            on_chunk: Called after each chunk is written (checkpointing)
+            spill_path: Parquet file receiving the cleaned rows of each
+                chunk; pass it back as `file_path` to re-validate or
+                re-dedupe without re-parsing the raw input. Cannot be
+                combined with a non-zero `start_chunk`
+            reject_path: CSV file receiving every rejected raw row with its
+                row number and error codes; when resuming, rows from
+                earlier chunks are kept and new ones appended
+            profile: Compiled ingestion profile mapping the file's own
+                columns onto the canonical fields (see app.services.profiles)
 
         Returns:
-            Ingestion statistics
+            Ingestion statistics, per-stage timings and an error summary
+            (counts per code and column plus a few example rows each)
         """
-        self.reset_stats()
+        self.reset_stats(reject_path, resume_row=start_chunk * (chunk_rows or settings.ingest_chunk_rows))
 
-        # Read CSV
-        df = pd.read_csv(file_path)
-
-        # Determine if this is suppliers or products CSV
-        if "email" in df.columns or "phone" in df.columns:
-            # Suppliers CSV
-            for _, row in df.iterrows():
-                self.stats["processed"] += 1
-                validated = self.validate_supplier(row.to_dict())
-                if validated:
-                    self.stats["valid"] += 1
-                else:
-                    self.stats["invalid"] += 1
-        elif "sku" in df.columns or "price_min" in df.columns:
-            # Products CSV
-            for _, row in df.iterrows():
-                supplier_name = row.get("supplier_name")
-                if supplier_name and supplier_name in supplier_mapping:
-                    self.stats["processed"] += 1
-                    validated = self.validate_product(
-                        row.to_dict(), supplier_mapping[supplier_name]
-                    )
-                    if validated:
-                        self.stats["valid"] += 1
-                    else:
-                        self.stats["invalid"] += 1
-
-        return self.stats
+        plan = self.chunk_validator(read_columns(file_path), supplier_mapping, profile)
+        if plan is None:
+            return self.get_stats()
+
+        validate, dedupe_key = plan
+        pipeline = StreamingPipeline(
+            validate,
+            dedupe_key,
+            writer=writer,
+            chunk_rows=chunk_rows,
+            spill_path=spill_path,
+            errors=self.errors,
+        )
+        try:
+            run = await pipeline.run(file_path, start_chunk=start_chunk, on_chunk=on_chunk)
+        finally:
+            self.errors.close()
+
+        self.stats.update(
+            processed=run.processed,
+            valid=run.valid,
+            invalid=run.invalid,
+            duplicates=run.duplicates,
+            written=run.written,
+            chunks=run.chunks,
+            seconds=round(run.seconds, 3),
+            timings=run.timings,
+        )
+        return self.get_stats()
+
+    async def process_csv(
+        self,
+        file_path: str,
+        supplier_mapping: Optional[Dict[str, uuid4]],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Process a CSV file; see `process_file`."""
+        return await self.process_file(file_path, supplier_mapping, **kwargs)
 
 
 class DataCleaner:
@@ -175,29 +303,17 @@ class DataCleaner:
     @staticmethod
     def clean_email(email: Optional[str]) -> Optional[str]:
         """Normalize email address."""
-        if not email:
-            return None
-        return email.strip().lower()
+        return get_rule_set("cleaning").validate_value("email", email)
 
     @staticmethod
     def clean_phone(phone: Optional[str]) -> Optional[str]:
-        """Normalize phone number."""
-        if not phone:
-            return None
-        # Remove all non-numeric characters except +
-        import re
-        cleaned = re.sub(r"[^\d+]", "", phone.strip())
-        return cleaned if cleaned else None
+        """Normalize phone number to E.164, or to digits and '+' if it does not parse."""
+        return get_rule_set("cleaning").validate_value("phone", phone)
 
     @staticmethod
     def clean_url(url: Optional[str]) -> Optional[str]:
         """Normalize URL."""
-        if not url:
-            return None
-        url = url.strip()
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
-        return url
+        return get_rule_set("cleaning").validate_value("url", url)
 
     @staticmethod
     def validate_not_empty(value: Any) -> bool:
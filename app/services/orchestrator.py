@@ -0,0 +1,280 @@
+"""
+Parallel ingestion orchestrator for multi-file and sharded inputs.
+Parsing, validation and normalization run in a process pool; cleaned
+batches are deduplicated in the parent and written by a few async writers.
+"""
+
+import asyncio
+import glob
+import itertools
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.services.bulk_loader import BulkLoader
+from app.services.columnar import read_csv_header, read_text_csv_range, split_csv
+from app.services.ingest_errors import ErrorLedger
+from app.services.ingestion import IngestionService, detect_kind
+from app.services.streaming import SeenKeys, hash_keys
+
+logger = logging.getLogger(__name__)
+
+# Suppliers must be committed before products can resolve them
+KIND_ORDER = ("suppliers", "products")
+
+
+@dataclass(frozen=True)
+class Shard:
+    """A byte range of one input file."""
+
+    path: str
+    kind: str
+    start: int
+    end: int
+
+
+@dataclass
+class ShardResult:
+    """Cleaned rows and counters for one shard, produced in a worker."""
+
+    shard: Shard
+    rows: pd.DataFrame
+    key_hashes: np.ndarray
+    stats: Dict[str, Any]
+
+
+@dataclass
+class IngestReport:
+    """Aggregated counters for an orchestrated run."""
+
+    files: int = 0
+    shards: int = 0
+    processed: int = 0
+    valid: int = 0
+    invalid: int = 0
+    duplicates: int = 0
+    inserted: int = 0
+    existing: int = 0
+    unknown_supplier: int = 0
+    errors: ErrorLedger = field(default_factory=ErrorLedger)
+    seconds: float = 0.0
+    timings: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(("parse", "validate", "write"), 0.0))
+    by_kind: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "files": self.files,
+            "shards": self.shards,
+            "processed": self.processed,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "duplicates": self.duplicates,
+            "inserted": self.inserted,
+            "existing": self.existing,
+            "unknown_supplier": self.unknown_supplier,
+            "errors": self.errors.to_dict(),
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.processed / self.seconds) if self.seconds else 0,
+            "timings": {stage: round(seconds, 3) for stage, seconds in self.timings.items()},
+            "by_kind": self.by_kind,
+        }
+
+
+def discover_inputs(patterns: List[str]) -> List[Path]:
+    """
+    Expand files, directories (every *.csv inside, recursively) and glob
+    patterns into a sorted, de-duplicated list of files.
+    """
+    found = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            found.update(p for p in path.rglob("*.csv") if p.is_file())
+        elif path.is_file():
+            found.add(path)
+        else:
+            found.update(Path(p) for p in glob.glob(pattern, recursive=True) if Path(p).is_file())
+    return sorted(found)
+
+
+def plan_shards(files: List[Path], shard_bytes: int) -> Dict[str, List[Shard]]:
+    """Group files by kind and split each into byte-range shards."""
+    plan: Dict[str, List[Shard]] = {kind: [] for kind in KIND_ORDER}
+    for path in files:
+        kind = detect_kind(read_csv_header(str(path)))
+        if kind is None:
+            logger.warning(f"Skipping {path}: neither a suppliers nor a products file")
+            continue
+        plan[kind].extend(Shard(str(path), kind, start, end) for start, end in split_csv(str(path), shard_bytes))
+    return plan
+
+
+def prepare_shard(shard: Shard) -> ShardResult:
+    """
+    Worker entry point: parse, validate and normalize one shard, and hash
+    its dedupe keys so the parent only has to compare integers.
+    """
+    service = IngestionService()
+    validate, dedupe_key = service.chunk_validator(read_csv_header(shard.path), None)
+
+    started = time.perf_counter()
+    raw = read_text_csv_range(shard.path, shard.start, shard.end)
+    parsed = time.perf_counter()
+    result = validate(raw)
+    service.errors.record(result, raw)
+    rows = result.valid_frame()
+
+    return ShardResult(
+        shard=shard,
+        rows=rows,
+        key_hashes=hash_keys(dedupe_key(rows)) if len(rows) else np.empty(0, dtype=np.uint64),
+        stats={
+            "processed": len(result.codes),
+            "valid": result.valid_count,
+            "invalid": result.invalid_count,
+            "errors": service.errors,
+            "parse_seconds": parsed - started,
+            "validate_seconds": time.perf_counter() - parsed,
+        },
+    )
+
+
+class IngestOrchestrator:
+    """
+    Runs suppliers then products through a process pool and async writers.
+
+    At most `workers * 2` shards are in flight and at most `writers * 2`
+    cleaned batches wait for a writer, so memory is bounded by the shard
+    size rather than the input size. Without an engine the run only
+    validates and reports.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[AsyncEngine] = None,
+        workers: Optional[int] = None,
+        writers: int = 2,
+        shard_bytes: Optional[int] = None,
+    ):
+        self.engine = engine
+        self.workers = workers or os.cpu_count() or 1
+        self.writers = writers
+        self.shard_bytes = shard_bytes or settings.ingest_shard_bytes
+
+    async def run(self, patterns: List[str]) -> IngestReport:
+        """Ingest every file matched by `patterns`."""
+        report = IngestReport()
+        started = time.perf_counter()
+
+        files = discover_inputs(patterns)
+        report.files = len(files)
+        plan = plan_shards(files, self.shard_bytes)
+
+        # Spawned workers don't inherit the parent's event loop or DB sockets
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as pool:
+            for kind in KIND_ORDER:
+                if plan[kind]:
+                    await self._run_kind(kind, plan[kind], pool, report)
+
+        report.seconds = time.perf_counter() - started
+        return report
+
+    async def _run_kind(
+        self,
+        kind: str,
+        shards: List[Shard],
+        pool: ProcessPoolExecutor,
+        report: IngestReport,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.writers * 2)
+        seen = SeenKeys()
+        counts = {"shards": 0, "processed": 0, "valid": 0, "invalid": 0, "duplicates": 0, "inserted": 0}
+
+        writers = [asyncio.create_task(self._write(kind, queue, report, counts)) for _ in range(self.writers)]
+
+        try:
+            remaining = iter(shards)
+            pending: deque = deque(
+                loop.run_in_executor(pool, prepare_shard, shard)
+                for shard in itertools.islice(remaining, self.workers * 2)
+            )
+
+            # Consume in submission order so dedupe is deterministic
+            while pending:
+                result: ShardResult = await pending.popleft()
+                shard = next(remaining, None)
+                if shard is not None:
+                    pending.append(loop.run_in_executor(pool, prepare_shard, shard))
+
+                fresh = seen.first_seen_hashes(result.key_hashes)
+                rows = result.rows[fresh]
+
+                counts["shards"] += 1
+                counts["processed"] += result.stats["processed"]
+                counts["valid"] += result.stats["valid"]
+                counts["invalid"] += result.stats["invalid"]
+                counts["duplicates"] += len(result.rows) - len(rows)
+                report.errors.merge(result.stats["errors"])
+                report.timings["parse"] += result.stats["parse_seconds"]
+                report.timings["validate"] += result.stats["validate_seconds"]
+
+                if len(rows):
+                    await self._put(queue, rows, writers)
+
+            for _ in writers:
+                await self._put(queue, None, writers)
+            await asyncio.gather(*writers)
+        finally:
+            for task in writers:
+                task.cancel()
+
+        report.shards += counts["shards"]
+        report.processed += counts["processed"]
+        report.valid += counts["valid"]
+        report.invalid += counts["invalid"]
+        report.duplicates += counts["duplicates"]
+        report.by_kind[kind] = counts
+        logger.info(f"Ingested {kind}: {counts}")
+
+    @staticmethod
+    async def _put(queue: asyncio.Queue, item, writers: List[asyncio.Task]) -> None:
+        """Queue a batch, failing fast if a writer died instead of blocking."""
+        put = asyncio.ensure_future(queue.put(item))
+        done, _ = await asyncio.wait([put, *writers], return_when=asyncio.FIRST_COMPLETED)
+        if put not in done:
+            put.cancel()
+            for task in done:
+                task.result()
+        await put
+
+    async def _write(self, kind: str, queue: asyncio.Queue, report: IngestReport, counts: Dict[str, int]) -> None:
+        """Writer task: drain cleaned batches into the database."""
+        if self.engine is None:
+            while await queue.get() is not None:
+                pass
+            return
+
+        async with BulkLoader(self.engine) as loader:
+            write = loader.write_suppliers if kind == "suppliers" else loader.write_products
+            while (rows := await queue.get()) is not None:
+                started = time.perf_counter()
+                inserted = await write(rows)
+                counts["inserted"] += inserted
+                report.timings["write"] += time.perf_counter() - started
+
+        report.inserted += int(loader.stats["inserted"])
+        report.existing += int(loader.stats["existing"])
+        report.unknown_supplier += int(loader.stats["unknown_supplier"])
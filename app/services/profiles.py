@@ -0,0 +1,264 @@
+"""
+Declarative ingestion profiles.
+A profile maps one vendor's columns onto the canonical supplier or product
+fields, with per-field transforms (split, regex extract, unit and currency
+conversion). Profiles are compiled once into a plan of vectorized column
+operations that rewrites each raw chunk into a canonical text chunk for
+the columnar validators.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import pandas as pd
+
+from app.services.columnar import STRING_DTYPE
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+# Canonical fields a profile can fill, by kind
+CANONICAL_FIELDS = {
+    "suppliers": ("name", "email", "phone", "linkedin", "verification_score"),
+    "products": (
+        "supplier_name", "sku", "product_name", "category", "description",
+        "tags", "price_min", "price_max", "currency",
+    ),
+}
+
+# Characters dropped before parsing a number: currency symbols, spaces, thousands separators
+_NUMBER_NOISE = r"[\s,$€£¥]"
+
+# A column transform sees the field's values and the whole raw chunk
+Transform = Callable[[pd.Series, pd.DataFrame], pd.Series]
+
+
+class ProfileError(ValueError):
+    """A profile is malformed or does not fit the input."""
+
+
+# ============ TRANSFORMS ============
+
+def _to_float(values: pd.Series) -> pd.Series:
+    """Text to float64; anything unparseable becomes NaN."""
+    if not isinstance(values.dtype, pd.StringDtype):
+        return pd.to_numeric(values, errors="coerce").astype("float64")
+    cleaned = values.str.replace(_NUMBER_NOISE, "", regex=True)
+    return pd.to_numeric(cleaned.astype(object), errors="coerce").astype("float64")
+
+
+def _numeric(compute: Callable[[pd.Series, pd.DataFrame], pd.Series]) -> Transform:
+    """
+    Wrap a float computation. Cells that do not parse keep their original
+    text so the validator rejects them rather than defaulting them.
+    """
+    def transform(values: pd.Series, raw: pd.DataFrame) -> pd.Series:
+        result = compute(_to_float(values), raw)
+        text = result.astype(STRING_DTYPE)
+        keep = result.isna() & values.notna()
+        return text.mask(keep, values.astype(STRING_DTYPE))
+
+    return transform
+
+
+def _case(method: str) -> Transform:
+    return lambda values, raw: getattr(values.str, method)()
+
+
+def _replace(args: List[str]) -> Transform:
+    old, new = args
+    return lambda values, raw: values.str.replace(old, new, regex=False)
+
+
+def _regex_replace(args: List[str]) -> Transform:
+    pattern, repl = args
+    compiled = re.compile(pattern)
+    return lambda values, raw: values.str.replace(compiled, repl, regex=True)
+
+
+def _extract(pattern: str) -> Transform:
+    compiled = re.compile(pattern)
+    if not compiled.groups:
+        compiled = re.compile(f"({pattern})")
+    return lambda values, raw: values.str.extract(compiled, expand=False).astype(STRING_DTYPE)
+
+
+def _split(args: Union[str, Dict[str, Any]]) -> Transform:
+    sep, index = (args, 0) if isinstance(args, str) else (args["sep"], args.get("index", 0))
+    return lambda values, raw: values.str.split(sep, regex=False).str.get(index).astype(STRING_DTYPE).str.strip()
+
+
+def _map(mapping: Dict[str, Any]) -> Transform:
+    lookup = {str(k): str(v) for k, v in mapping.items()}
+    return lambda values, raw: values.map(lookup).astype(STRING_DTYPE).fillna(values)
+
+
+def _default(value: Any) -> Transform:
+    return lambda values, raw: values.fillna(str(value))
+
+
+def _multiply(factor: float) -> Transform:
+    factor = float(factor)
+    return _numeric(lambda numbers, raw: numbers * factor)
+
+
+def _convert_currency(args: Dict[str, Any]) -> Transform:
+    """
+    Multiply by a per-row rate looked up from the `source` currency column;
+    rows in an unknown currency keep their text and fail validation.
+    """
+    source = args["source"]
+    rates = {str(code).upper(): float(rate) for code, rate in args["rates"].items()}
+
+    def transform(values: pd.Series, raw: pd.DataFrame) -> pd.Series:
+        codes = raw[source].astype(STRING_DTYPE).str.strip().str.upper()
+        factors = codes.map(rates).astype("float64")
+        converted = _numeric(lambda numbers, _: numbers * factors)(values, raw)
+        # "5.0 GBP" does not parse as a price, so the row is rejected
+        unknown = factors.isna() & values.notna()
+        return converted.mask(unknown, values + " " + codes.fillna("?"))
+
+    return transform
+
+
+_TRANSFORMS: Dict[str, Callable[[Any], Transform]] = {
+    "replace": _replace,
+    "regex_replace": _regex_replace,
+    "extract": _extract,
+    "split": _split,
+    "map": _map,
+    "default": _default,
+    "multiply": _multiply,
+    "convert_currency": _convert_currency,
+}
+
+_SIMPLE_TRANSFORMS: Dict[str, Transform] = {
+    "strip": _case("strip"),
+    "lower": _case("lower"),
+    "upper": _case("upper"),
+    "title": _case("title"),
+    "number": _numeric(lambda numbers, raw: numbers),
+}
+
+
+def _compile_transform(spec: Union[str, Dict[str, Any]]) -> Transform:
+    if isinstance(spec, str):
+        if spec not in _SIMPLE_TRANSFORMS:
+            raise ProfileError(f"Unknown transform: {spec}")
+        return _SIMPLE_TRANSFORMS[spec]
+    if not isinstance(spec, dict) or len(spec) != 1:
+        raise ProfileError(f"Transform must be a name or a single-key mapping: {spec!r}")
+    (name, args), = spec.items()
+    if name not in _TRANSFORMS:
+        raise ProfileError(f"Unknown transform: {name}")
+    try:
+        return _TRANSFORMS[name](args)
+    except (KeyError, TypeError, ValueError, re.error) as e:
+        raise ProfileError(f"Bad arguments for {name}: {e}") from e
+
+
+# ============ PLANS ============
+
+@dataclass
+class FieldPlan:
+    """How one canonical field is produced."""
+
+    target: str
+    source: Optional[str]
+    constant: Optional[str]
+    transforms: List[Transform]
+    reads: List[str]
+
+
+class ProfilePlan:
+    """
+    A compiled profile. `apply` runs one whole-column operation per
+    transform, so cost grows with the number of transforms, not rows.
+    """
+
+    def __init__(self, name: str, kind: str, fields: List[FieldPlan]):
+        self.name = name
+        self.kind = kind
+        self.fields = fields
+
+    @property
+    def source_columns(self) -> List[str]:
+        return sorted({column for field in self.fields for column in field.reads})
+
+    def check(self, columns: List[str]) -> None:
+        """Fail early if the input lacks a column the profile reads."""
+        missing = [c for c in self.source_columns if c not in columns]
+        if missing:
+            raise ProfileError(f"Profile {self.name} expects missing columns: {', '.join(missing)}")
+
+    def apply(self, raw: pd.DataFrame) -> pd.DataFrame:
+        """Rewrite a raw chunk into canonical text columns, keeping its index."""
+        out = {}
+        for field in self.fields:
+            if field.source is None:
+                values = pd.Series(field.constant, index=raw.index, dtype=STRING_DTYPE)
+            else:
+                values = raw[field.source].astype(STRING_DTYPE)
+            for transform in field.transforms:
+                values = transform(values, raw)
+            out[field.target] = values
+        return pd.DataFrame(out, index=raw.index)
+
+
+def compile_profile(spec: Dict[str, Any]) -> ProfilePlan:
+    """
+    Compile a profile mapping:
+
+        {"name": "acme", "kind": "products", "fields": {
+            "sku": "Item #",
+            "price_min": {"source": "Price", "transforms": ["number", {"multiply": 0.01}]},
+            "currency": {"value": "USD"}}}
+    """
+    name = spec.get("name", "profile")
+    kind = spec.get("kind")
+    if kind not in CANONICAL_FIELDS:
+        raise ProfileError(f"Profile {name}: kind must be one of {', '.join(CANONICAL_FIELDS)}")
+
+    fields = []
+    for target, field in (spec.get("fields") or {}).items():
+        if target not in CANONICAL_FIELDS[kind]:
+            raise ProfileError(f"Profile {name}: {target} is not a {kind} field")
+        if isinstance(field, str):
+            field = {"source": field}
+        if ("source" in field) == ("value" in field):
+            raise ProfileError(f"Profile {name}: {target} needs exactly one of source or value")
+
+        specs = field.get("transforms", [])
+        reads = [field["source"]] if "source" in field else []
+        reads += [t["convert_currency"]["source"] for t in specs if isinstance(t, dict) and "convert_currency" in t]
+        fields.append(FieldPlan(
+            target=target,
+            source=field.get("source"),
+            constant=None if field.get("value") is None else str(field["value"]),
+            transforms=[_compile_transform(t) for t in specs],
+            reads=reads,
+        ))
+
+    if not fields:
+        raise ProfileError(f"Profile {name} maps no fields")
+    return ProfilePlan(name, kind, fields)
+
+
+def load_profile(path: Union[str, Path]) -> ProfilePlan:
+    """Load and compile a .json, .yaml or .yml profile."""
+    path = Path(path)
+    text = path.read_text()
+    if path.suffix.lower() in (".yaml", ".yml"):
+        if not YAML_AVAILABLE:
+            raise ImportError("PyYAML is required to read YAML profiles")
+        spec = yaml.safe_load(text)
+    else:
+        spec = json.loads(text)
+    spec.setdefault("name", path.stem)
+    return compile_profile(spec)
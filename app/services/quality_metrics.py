@@ -8,6 +8,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from app.services.validation.rules import get_rule_set
+
 
 class QualityDimension(Enum):
     """Data quality dimensions."""
@@ -106,29 +108,13 @@ class DataQualityMetrics:
         return min(1.0, score)
 
     def _is_valid_email(self, email: str) -> bool:
-        import re
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return bool(re.match(pattern, str(email))) if email else False
+        return get_rule_set("suppliers").validate_value("email", email) is not None
 
     def _is_valid_phone(self, phone: str) -> bool:
-        import re
-        if not phone:
-            return False
-        cleaned = re.sub(r"[^\d\+]", "", str(phone))
-        return 7 <= len(cleaned) <= 15
+        return get_rule_set("suppliers").validate_value("phone", phone) is not None
 
     def _is_valid_url(self, url: str) -> bool:
-        if not url:
-            return False
-        url = str(url)
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
-        try:
-            from urllib.parse import urlparse
-            result = urlparse(url)
-            return bool(result.netloc)
-        except Exception:
-            return False
+        return get_rule_set("suppliers").validate_value("url", url) is not None
 
     def calculate_consistency(self, record: Dict, related_records: List[Dict] = None) -> float:
         """Calculate consistency score."""
@@ -0,0 +1,283 @@
+"""
+Streaming ingestion with bounded memory.
+Reads fixed-size chunks, runs validate -> normalize -> dedupe on each one
+and hands the surviving rows to an async writer while the next chunk is
+parsed, so peak memory depends on the chunk size, not the file size.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+from app.services.columnar import ParquetSpill, ValidationResult, iter_input
+from app.services.ingest_errors import ErrorLedger
+
+logger = logging.getLogger(__name__)
+
+# Validate a raw text chunk; returns normalized rows plus error codes
+ChunkValidator = Callable[[pd.DataFrame], ValidationResult]
+
+# Columns identifying a record for dedupe, e.g. lower-cased supplier name
+DedupeKey = Callable[[pd.DataFrame], Union[pd.DataFrame, pd.Series]]
+
+# Persist the valid, deduplicated rows of one chunk; returns rows written
+ChunkWriter = Callable[[pd.DataFrame], Awaitable[int]]
+
+# Marks the end of the chunk queue
+_DONE = object()
+
+
+def hash_keys(keys: Union[pd.DataFrame, pd.Series]) -> np.ndarray:
+    """64-bit hash per row of dedupe key columns."""
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy()
+
+
+class SeenKeys:
+    """
+    Set of 64-bit row-key hashes seen so far, kept as one sorted NumPy
+    array (8 bytes per distinct key instead of a Python object each).
+    """
+
+    def __init__(self):
+        self._hashes = np.empty(0, dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def first_seen(self, keys: Union[pd.DataFrame, pd.Series]) -> np.ndarray:
+        """
+        Mark rows whose key was not seen in earlier chunks or earlier in
+        this chunk, and remember them.
+        """
+        return self.first_seen_hashes(hash_keys(keys))
+
+    def first_seen_hashes(self, hashes: np.ndarray) -> np.ndarray:
+        """Same as `first_seen` for keys hashed with `hash_keys`."""
+        positions = np.searchsorted(self._hashes, hashes)
+        positions[positions == len(self._hashes)] = 0
+        seen = self._hashes[positions] == hashes if len(self._hashes) else np.zeros(len(hashes), dtype=bool)
+
+        fresh = ~seen & ~pd.Series(hashes).duplicated().to_numpy()
+
+        # Merge by insertion; fresh hashes are unique and not yet stored
+        new = np.sort(hashes[fresh])
+        self._hashes = np.insert(self._hashes, np.searchsorted(self._hashes, new), new)
+        return fresh
+
+
+@dataclass
+class ChunkStats:
+    """Counters for one chunk."""
+
+    index: int
+    rows: int
+    valid: int
+    duplicates: int
+    written: int = 0
+    parse_seconds: float = 0.0
+    validate_seconds: float = 0.0
+    dedupe_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+
+@dataclass
+class StreamStats:
+    """Counters for a whole streaming run."""
+
+    chunks: int = 0
+    processed: int = 0
+    valid: int = 0
+    invalid: int = 0
+    duplicates: int = 0
+    written: int = 0
+    seconds: float = 0.0
+    chunk_stats: List[ChunkStats] = field(default_factory=list)
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """
+        Seconds spent per stage, summed over chunks. Parse and validate
+        overlap with write, so the stages can add up to more than `seconds`.
+        """
+        return {
+            stage: round(sum(getattr(c, f"{stage}_seconds") for c in self.chunk_stats), 3)
+            for stage in ("parse", "validate", "dedupe", "write")
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "chunks": self.chunks,
+            "processed": self.processed,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "duplicates": self.duplicates,
+            "written": self.written,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.processed / self.seconds) if self.seconds else 0,
+            "timings": self.timings,
+        }
+
+
+class StreamingPipeline:
+    """
+    Chunked pipeline with backpressure for any input `iter_input` reads.
+
+    Parsing, validation and dedupe run in a worker thread; the writer runs
+    on the event loop. At most `queue_depth` prepared chunks wait for the
+    writer; when the queue is full the parser blocks. With `spill_path`,
+    each chunk's valid rows (before dedupe) are also appended to a Parquet
+    file that later runs can read instead of the raw input.
+    """
+
+    def __init__(
+        self,
+        validate: ChunkValidator,
+        dedupe_key: DedupeKey,
+        writer: Optional[ChunkWriter] = None,
+        chunk_rows: Optional[int] = None,
+        queue_depth: Optional[int] = None,
+        spill_path: Optional[str] = None,
+        errors: Optional[ErrorLedger] = None,
+    ):
+        self.validate = validate
+        self.dedupe_key = dedupe_key
+        self.writer = writer
+        self.chunk_rows = chunk_rows or settings.ingest_chunk_rows
+        self.queue_depth = queue_depth or settings.ingest_queue_depth
+        self.seen = SeenKeys()
+        self.spill_path = spill_path
+        self._spill: Optional[ParquetSpill] = None
+        self.errors = errors
+
+    def prepare(self, index: int, chunk: pd.DataFrame) -> tuple[ChunkStats, pd.DataFrame]:
+        """Validate, normalize and dedupe one raw chunk."""
+        started = time.perf_counter()
+        result = self.validate(chunk)
+        rows = result.valid_frame()
+        if self.errors is not None:
+            self.errors.record(result, chunk)
+        if self._spill is not None:
+            self._spill.write(rows)
+        validated = time.perf_counter()
+
+        fresh = self.seen.first_seen(self.dedupe_key(rows)) if len(rows) else np.zeros(0, dtype=bool)
+        unique = rows[fresh]
+
+        stats = ChunkStats(
+            index=index,
+            rows=len(result.codes),
+            valid=len(rows),
+            duplicates=len(rows) - len(unique),
+            validate_seconds=validated - started,
+            dedupe_seconds=time.perf_counter() - validated,
+        )
+        return stats, unique
+
+    def _produce(
+        self,
+        file_path: str,
+        queue: asyncio.Queue,
+        loop: asyncio.AbstractEventLoop,
+        stop: threading.Event,
+        start_chunk: int,
+    ) -> None:
+        """Worker thread: parse and prepare chunks, blocking while the queue is full."""
+
+        def put(item) -> None:
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        try:
+            chunks = iter_input(file_path, self.chunk_rows, skip_rows=start_chunk * self.chunk_rows)
+            index = start_chunk
+            while not stop.is_set():
+                started = time.perf_counter()
+                chunk = next(chunks, None)
+                if chunk is None:
+                    put(_DONE)
+                    return
+                parse_seconds = time.perf_counter() - started
+
+                chunk_stats, rows = self.prepare(index, chunk)
+                chunk_stats.parse_seconds = parse_seconds
+                put((chunk_stats, rows))
+                index += 1
+        except BaseException as e:
+            put(e)
+
+    async def run(
+        self,
+        file_path: str,
+        start_chunk: int = 0,
+        on_chunk: Optional[Callable[[ChunkStats], None]] = None,
+    ) -> StreamStats:
+        """
+        Stream a file through the pipeline.
+
+        `start_chunk` skips chunks committed by an earlier run; `on_chunk`
+        is called after each chunk has been written, in file order. A
+        spill file cannot be resumed (Parquet files are not appendable and
+        an interrupted one has no footer), so `start_chunk` must be 0 when
+        `spill_path` is set.
+        """
+        if start_chunk and self.spill_path:
+            raise ValueError(
+                f"Cannot resume at chunk {start_chunk} into spill file {self.spill_path}; "
+                "restart from chunk 0 to rebuild it"
+            )
+        stats = StreamStats()
+        started = time.perf_counter()
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+        stop = threading.Event()
+        self._spill = ParquetSpill(self.spill_path) if self.spill_path else None
+        producer = loop.run_in_executor(None, self._produce, file_path, queue, loop, stop, start_chunk)
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+
+                chunk_stats, rows = item
+                if self.writer and len(rows):
+                    written = time.perf_counter()
+                    chunk_stats.written = await self.writer(rows)
+                    chunk_stats.write_seconds = time.perf_counter() - written
+
+                stats.chunks += 1
+                stats.processed += chunk_stats.rows
+                stats.valid += chunk_stats.valid
+                stats.invalid += chunk_stats.rows - chunk_stats.valid
+                stats.duplicates += chunk_stats.duplicates
+                stats.written += chunk_stats.written
+                stats.chunk_stats.append(chunk_stats)
+                if on_chunk:
+                    on_chunk(chunk_stats)
+                logger.debug(
+                    f"Chunk {chunk_stats.index}: {chunk_stats.rows} rows, "
+                    f"{chunk_stats.valid} valid, {chunk_stats.written} written"
+                )
+        finally:
+            # Stop and unblock the producer if the writer failed mid-stream
+            stop.set()
+            while not producer.done():
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    await asyncio.sleep(0.01)
+            await producer
+            if self._spill is not None:
+                self._spill.close()
+
+        stats.seconds = time.perf_counter() - started
+        return stats
@@ -1,37 +1,49 @@
 """
 Validation Package
 Data validation, deduplication, and cleansing services.
+Submodules are loaded lazily on first attribute access (PEP 562).
 """
 
-from app.services.validation.cleaner import (
-    DataValidator,
-    Deduplicator,
-    DataEnricher,
-    process_data,
-)
-
-from app.services.validation.enhanced_cleaner import (
-    EnhancedEmailValidator,
-    EnhancedPhoneValidator,
-    AddressValidator,
-    CompanyNameNormalizer,
-    EnhancedDeduplicator,
-    EnhancedValidationPipeline,
-    validate_and_clean,
-    deduplicate_records,
-)
-
-__all__ = [
-    "DataValidator",
-    "Deduplicator",
-    "DataEnricher",
-    "process_data",
-    "EnhancedEmailValidator",
-    "EnhancedPhoneValidator",
-    "AddressValidator",
-    "CompanyNameNormalizer",
-    "EnhancedDeduplicator",
-    "EnhancedValidationPipeline",
-    "validate_and_clean",
-    "deduplicate_records",
-]
+import importlib
+
+# Public name -> defining module
+_LAZY_IMPORTS = {
+    "DataValidator": "app.services.validation.cleaner",
+    "Deduplicator": "app.services.validation.cleaner",
+    "DataEnricher": "app.services.validation.cleaner",
+    "process_data": "app.services.validation.cleaner",
+    "EnhancedEmailValidator": "app.services.validation.enhanced_cleaner",
+    "EnhancedPhoneValidator": "app.services.validation.enhanced_cleaner",
+    "AddressValidator": "app.services.validation.enhanced_cleaner",
+    "CompanyNameNormalizer": "app.services.validation.enhanced_cleaner",
+    "EnhancedDeduplicator": "app.services.validation.enhanced_cleaner",
+    "EnhancedValidationPipeline": "app.services.validation.enhanced_cleaner",
+    "validate_and_clean": "app.services.validation.enhanced_cleaner",
+    "deduplicate_records": "app.services.validation.enhanced_cleaner",
+    "MinHashLSHIndex": "app.services.validation.lsh",
+    "get_catalog_index": "app.services.validation.lsh",
+    "FingerprintStore": "app.services.validation.fingerprints",
+    "get_fingerprint_store": "app.services.validation.fingerprints",
+    "parse_phone": "app.services.validation.phones",
+    "normalize_phones": "app.services.validation.phones",
+    "RuleSet": "app.services.validation.rules",
+    "compile_rules": "app.services.validation.rules",
+    "get_rule_set": "app.services.validation.rules",
+}
+
+
+def __getattr__(name: str):
+    """Import the defining submodule on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+__all__ = list(_LAZY_IMPORTS)
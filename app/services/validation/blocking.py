@@ -0,0 +1,162 @@
+"""
+Candidate generation (blocking) for fuzzy deduplication.
+Instead of scoring every pair of records, records are grouped into blocks
+that share a cheap key and only pairs inside a block are scored:
+
+- sorted neighbourhood: records sorted by normalized name, each paired
+  with the next `window - 1` records
+- character n-grams: each record is blocked on its rarest name trigrams
+- exact contact keys: email domain and phone number
+
+Blocks larger than `max_block_size` (free-mail domains, ubiquitous
+trigrams) are dropped, so the number of pairs stays linear in the input.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+# Records each one is compared with in sorted-name order
+DEFAULT_WINDOW = 5
+
+# Blocks with more records than this are skipped as uninformative
+DEFAULT_MAX_BLOCK_SIZE = 50
+
+# Character n-gram length and how many of each name's rarest n-grams it is blocked on
+NGRAM_SIZE = 3
+NGRAM_KEYS = 2
+
+# Shortest phone, in digits, used as a block key; longer ones keep their last 10
+_MIN_PHONE_DIGITS = 7
+
+# Legal suffixes and filler words that say nothing about which company it is
+_NAME_NOISE = (
+    r"\b(?:inc|llc|corp|corporation|ltd|limited|co|company|the|a|an|and|of|for|group|holdings)\b"
+)
+
+
+def _contact(record: Dict, field: str) -> str:
+    """A contact field from the record itself or its contact_json."""
+    value = record.get(field) or (record.get("contact_json") or {}).get(field)
+    return str(value) if value else ""
+
+
+def name_keys(records: List[Dict]) -> pd.Series:
+    """Lower-cased names without punctuation, legal suffixes or filler words."""
+    names = pd.Series([str(r.get("name") or "") for r in records], dtype=object)
+    return (
+        names.str.lower()
+        .str.replace(r"[\W_]+", " ", regex=True)
+        .str.replace(_NAME_NOISE, " ", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def _codes(keys: pd.Series) -> np.ndarray:
+    """Dense integer code per key; empty or missing keys get -1."""
+    keys = keys.where(keys.notna() & (keys != ""))
+    codes, _ = pd.factorize(keys)
+    return codes
+
+
+def _pairs_within_blocks(rows: np.ndarray, codes: np.ndarray, max_block_size: int, stats: Dict) -> np.ndarray:
+    """
+    All (i, j) pairs of rows sharing a code, for blocks of 2 to
+    `max_block_size` rows. Blocks of equal size are expanded together.
+    """
+    keep = codes >= 0
+    rows, codes = rows[keep], codes[keep]
+    order = np.argsort(codes, kind="stable")
+    rows, codes = rows[order], codes[order]
+
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.empty(0, dtype=np.int64)
+    sizes = np.diff(np.r_[starts, len(codes)])
+    stats["oversized_blocks"] += int(np.count_nonzero(sizes > max_block_size))
+
+    pairs = [np.empty((0, 2), dtype=np.int64)]
+    for size in np.unique(sizes[(sizes >= 2) & (sizes <= max_block_size)]):
+        members = rows[starts[sizes == size, None] + np.arange(size)]
+        left, right = np.triu_indices(size, k=1)
+        pairs.append(np.stack([members[:, left].ravel(), members[:, right].ravel()], axis=1))
+    return np.concatenate(pairs)
+
+
+class CandidateGenerator:
+    """
+    Produces the candidate pairs a fuzzy matcher should score.
+    `stats` counts pairs per strategy and the oversized blocks skipped.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW, max_block_size: int = DEFAULT_MAX_BLOCK_SIZE):
+        self.window = window
+        self.max_block_size = max_block_size
+        self.stats: Dict[str, int] = {}
+
+    def sorted_neighbourhood(self, keys: pd.Series) -> np.ndarray:
+        """Pairs of records within `window` positions in sorted-key order."""
+        present = np.flatnonzero((keys != "").to_numpy())
+        order = present[np.argsort(keys.to_numpy()[present], kind="stable")]
+        pairs = [np.empty((0, 2), dtype=np.int64)]
+        for distance in range(1, min(self.window, len(order))):
+            pairs.append(np.stack([order[:-distance], order[distance:]], axis=1))
+        return np.concatenate(pairs)
+
+    def ngram_blocks(self, keys: pd.Series) -> np.ndarray:
+        """
+        Pairs sharing one of their rarest name n-grams. Rare n-grams are
+        the discriminating ones; common ones would only produce blocks
+        that get dropped as oversized.
+        """
+        rows, grams = [], []
+        for row, key in enumerate(keys.tolist()):
+            key = key.replace(" ", "")
+            for gram in {key[i:i + NGRAM_SIZE] for i in range(len(key) - NGRAM_SIZE + 1)}:
+                rows.append(row)
+                grams.append(hash(gram))
+        if not rows:
+            return np.empty((0, 2), dtype=np.int64)
+
+        rows = np.asarray(rows, dtype=np.int64)
+        codes, counts = np.unique(np.asarray(grams, dtype=np.int64), return_inverse=True, return_counts=True)[1:]
+        frequency = counts[codes]
+
+        # Each row's NGRAM_KEYS rarest n-grams that at least one other row shares
+        useful = frequency >= 2
+        rows, codes, frequency = rows[useful], codes[useful], frequency[useful]
+        order = np.lexsort((frequency, rows))
+        rows, codes = rows[order], codes[order]
+        rank = np.arange(len(rows)) - np.searchsorted(rows, rows)
+        chosen = rank < NGRAM_KEYS
+        return _pairs_within_blocks(rows[chosen], codes[chosen], self.max_block_size, self.stats)
+
+    def exact_blocks(self, keys: pd.Series) -> np.ndarray:
+        """Pairs sharing an exact key (email domain, phone)."""
+        return _pairs_within_blocks(np.arange(len(keys)), _codes(keys), self.max_block_size, self.stats)
+
+    def candidate_pairs(self, records: List[Dict]) -> np.ndarray:
+        """
+        Unique candidate pairs as an (m, 2) int64 array of record
+        positions with i < j, sorted.
+        """
+        self.stats = {"oversized_blocks": 0}
+        names = name_keys(records)
+        emails = pd.Series([_contact(r, "email").lower() for r in records], dtype=object)
+        phones = pd.Series([_contact(r, "phone") for r in records], dtype=object).str.replace(r"\D", "", regex=True)
+
+        strategies = {
+            "sorted_neighbourhood": self.sorted_neighbourhood(names),
+            "ngram": self.ngram_blocks(names),
+            "email_domain": self.exact_blocks(emails.str.extract(r"@([^@\s]+)$", expand=False)),
+            "phone": self.exact_blocks(phones.where(phones.str.len() >= _MIN_PHONE_DIGITS).str[-10:]),
+        }
+        for strategy, found in strategies.items():
+            self.stats[strategy] = len(found)
+
+        pairs = np.concatenate(list(strategies.values()))
+        pairs.sort(axis=1)
+        pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+        packed = np.unique(pairs[:, 0] * len(records) + pairs[:, 1])
+        self.stats["pairs"] = len(packed)
+        return np.stack([packed // len(records), packed % len(records)], axis=1) if len(records) else pairs
@@ -4,78 +4,60 @@ Validates, deduplicates, and enriches supplier data.
 """
 
 import hashlib
-import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 import uuid
 
 from app.core.config import settings
+from app.services.validation.fingerprints import FingerprintStore, get_fingerprint_store
+from app.services.validation.normalize import strip_legal_suffix
+from app.services.validation.rules import SUPPLIER_FIELDS, get_rule_set
 
 
 class DataValidator:
     """
-    Validates and cleanses supplier data.
+    Validates and cleanses supplier data with the shared "suppliers"
+    rule set (see app.services.validation.rules).
     """
 
-    EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-    PHONE_PATTERN = re.compile(r"^\+?[\d\s\-\(\)]{7,20}$")
-    URL_PATTERN = re.compile(r"^https?://[\w\-\.]+(\.[\w\-\.]+)+(/[^\s]*)?$")
+    def __init__(self):
+        self.rules = get_rule_set("suppliers")
 
     def validate_email(self, email: Optional[str]) -> Optional[str]:
         """Validate and normalize email."""
-        if not email:
-            return None
-        email = email.strip().lower()
-        if self.EMAIL_PATTERN.match(email):
-            return email
-        return None
+        return self.rules.validate_value("email", email)
 
     def validate_phone(self, phone: Optional[str]) -> Optional[str]:
         """Validate and normalize phone number."""
-        if not phone:
-            return None
-        # Remove non-numeric except +
-        cleaned = re.sub(r"[^\d\+]", "", phone.strip())
-        if 7 <= len(cleaned) <= 15:
-            return cleaned
-        return None
+        return self.rules.validate_value("phone", phone)
 
     def validate_url(self, url: Optional[str]) -> Optional[str]:
         """Validate URL."""
-        if not url:
-            return None
-        url = url.strip()
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
-        if self.URL_PATTERN.match(url):
-            return url
-        return None
+        return self.rules.validate_value("url", url)
 
     def validate_score(self, score: Any) -> float:
         """Validate verification score (0.0 - 1.0)."""
-        try:
-            s = float(score)
-            return max(0.0, min(1.0, s))
-        except (TypeError, ValueError):
-            return 0.5
+        return self.rules.validate_value("score", score)
 
     def validate_supplier(self, data: Dict) -> Tuple[bool, Optional[Dict]]:
         """
         Validate a supplier record.
         Returns (is_valid, cleaned_data).
         """
+        values = self.rules.validate_record(data, SUPPLIER_FIELDS)
+
         # Check required fields
-        if not data.get("name") or len(data["name"].strip()) < 2:
+        if values["name"] is None:
             return False, None
 
         cleaned = {
-            "name": data["name"].strip(),
+            "name": values["name"],
             "contact_json": {
-                "email": self.validate_email(data.get("email")),
-                "phone": self.validate_phone(data.get("phone")),
-                "linkedin": self.validate_url(data.get("linkedin")),
+                "email": values["email"],
+                "phone": values["phone"],
+                "linkedin": values["linkedin"],
             },
-            "verification_score": self.validate_score(data.get("verification_score", 0.5)),
+            "verification_score": values["verification_score"],
             "source": data.get("source", "unknown"),
         }
 
@@ -88,34 +70,35 @@ class DataValidator:
 
 class Deduplicator:
     """
-    Detects and removes duplicate supplier records.
+    Detects and removes duplicate supplier records. With a fingerprint
+    store, records are also checked against suppliers from earlier runs.
     """
 
-    def __init__(self):
+    def __init__(self, store: Optional[FingerprintStore] = None):
         self.validator = DataValidator()
+        self.store = store
+
+    def _cleaned(self, records: List[Dict], validated: bool) -> List[Dict]:
+        """Records cleaned by DataValidator.validate_supplier, validating unless already done."""
+        if validated:
+            return records
+        return [cleaned for is_valid, cleaned in map(self.validator.validate_supplier, records) if is_valid]
 
     def generate_fingerprint(self, data: Dict) -> str:
         """Generate a fingerprint for deduplication."""
-        name = data.get("name", "").lower().strip()
-        email = data.get("contact_json", {}).get("email") or ""
-
         # Normalize name (remove common suffixes)
-        for suffix in ["inc", "llc", "corp", "corporation", "ltd", "co", "company"]:
-            name = re.sub(rf"\b{suffix}\b\.?$", "", name)
+        name = strip_legal_suffix(data.get("name") or "")
+        email = data.get("contact_json", {}).get("email") or ""
 
         # Create fingerprint
         fingerprint = f"{name.strip()}:{email.split('@')[0] if email else ''}"
         return hashlib.md5(fingerprint.encode()).hexdigest()
 
-    def find_duplicates(self, records: List[Dict]) -> List[List[Dict]]:
+    def find_duplicates(self, records: List[Dict], validated: bool = False) -> List[List[Dict]]:
         """Find groups of duplicate records."""
         fingerprints: Dict[str, List[Dict]] = {}
 
-        for record in records:
-            is_valid, cleaned = self.validator.validate_supplier(record)
-            if not is_valid:
-                continue
-
+        for cleaned in self._cleaned(records, validated):
             fp = self.generate_fingerprint(cleaned)
             if fp not in fingerprints:
                 fingerprints[fp] = []
@@ -124,18 +107,17 @@ class Deduplicator:
         # Return only groups with potential duplicates
         return [records for records in fingerprints.values() if len(records) > 1]
 
-    def deduplicate(self, records: List[Dict]) -> List[Dict]:
+    def deduplicate(self, records: List[Dict], validated: bool = False) -> List[Dict]:
         """
         Deduplicate records, keeping the best one.
-        Returns unique records with merge info.
+        Returns unique records with merge info; records matching a stored
+        supplier carry its ID as `duplicate_of`. The store is only read:
+        call remember() once the records have been written.
+        Pass validated=True for records already cleaned by DataValidator.
         """
         fingerprints: Dict[str, Dict] = {}
 
-        for record in records:
-            is_valid, cleaned = self.validator.validate_supplier(record)
-            if not is_valid:
-                continue
-
+        for cleaned in self._cleaned(records, validated):
             fp = self.generate_fingerprint(cleaned)
 
             # Keep record with highest verification score
@@ -151,8 +133,22 @@ class Deduplicator:
                     existing["verification_score"] = cleaned["verification_score"]
                     existing["source"] = f"{existing.get('source')}+{cleaned.get('source')}"
 
+        if self.store is not None:
+            for record, stored in zip(fingerprints.values(), self.store.get_many(list(fingerprints))):
+                if stored is not None and str(stored) != record.get("id"):
+                    record["duplicate_of"] = str(stored)
+
         return list(fingerprints.values())
 
+    def remember(self, records: List[Dict]) -> int:
+        """
+        Add suppliers to the fingerprint store once their write has been
+        committed (see FingerprintStore.remember). Returns the number added.
+        """
+        if self.store is None:
+            return 0
+        return self.store.remember(records, self.generate_fingerprint)
+
 
 class DataEnricher:
     """
@@ -214,6 +210,7 @@ class DataEnricher:
 async def process_data(raw_records: List[Dict]) -> List[Dict]:
     """
     Process raw data through validation and deduplication.
+    Pass the records to Deduplicator.remember once they have been written.
     """
     # Validate
     validator = DataValidator()
@@ -223,9 +220,9 @@ async def process_data(raw_records: List[Dict]) -> List[Dict]:
         if is_valid:
             valid_records.append(cleaned)
 
-    # Deduplicate
-    deduplicator = Deduplicator()
-    unique_records = deduplicator.deduplicate(valid_records)
+    # Deduplicate, against earlier runs too when a fingerprint store exists
+    deduplicator = Deduplicator(get_fingerprint_store())
+    unique_records = deduplicator.deduplicate(valid_records, validated=True)
 
     # Enrich
     enricher = DataEnricher()
@@ -0,0 +1,103 @@
+"""
+Duplicate clustering and survivorship.
+Matched pairs are joined transitively with a union-find, so A~B and B~C
+land in one cluster whatever order the records arrive in. Each cluster is
+then merged once by field-level survivorship rules that depend only on
+the records' contents and input positions, never on processing order.
+"""
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+MERGE_STRATEGIES = ("best_score", "most_complete", "newest")
+
+
+class UnionFind:
+    """Disjoint sets over 0..n-1 in flat parent/rank arrays."""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.rank = [0] * size
+
+    def find(self, item: int) -> int:
+        """Root of an item's set, compressing the path walked."""
+        parent = self.parent
+        root = item
+        while parent[root] != root:
+            root = parent[root]
+        while parent[item] != root:
+            parent[item], item = root, parent[item]
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        """Join two sets by rank; returns False if they were already one."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+        return True
+
+    def clusters(self) -> List[List[int]]:
+        """
+        All sets as sorted member lists, ordered by their smallest member,
+        so the result does not depend on the order unions were made in.
+        """
+        members: Dict[int, List[int]] = {}
+        for item in range(len(self.parent)):
+            members.setdefault(self.find(item), []).append(item)
+        return list(members.values())
+
+
+def cluster_pairs(size: int, pairs: Iterable[Tuple[int, int]]) -> List[List[int]]:
+    """Clusters of 0..size-1 connected by the given pairs."""
+    sets = UnionFind(size)
+    for a, b in pairs:
+        sets.union(a, b)
+    return sets.clusters()
+
+
+def _rank(records: Sequence[Dict], strategy: str) -> List[int]:
+    """
+    Positions in survivorship order: highest verification_score or latest
+    scraped_at first, earlier input first on ties.
+    """
+    positions = range(len(records))
+    if strategy == "best_score":
+        return sorted(positions, key=lambda i: (-(records[i].get("verification_score") or 0), i))
+    if strategy == "newest":
+        return sorted(positions, key=lambda i: (str(records[i].get("scraped_at") or ""), -i), reverse=True)
+    return list(positions)
+
+
+def merge_cluster(records: Sequence[Dict], strategy: str = "best_score") -> Dict:
+    """
+    One surviving record for a cluster. Every field is taken from the
+    highest-ranked record that has it; with 'most_complete' the longest
+    non-empty value wins instead. merged_sources lists every source seen.
+    """
+    if strategy not in MERGE_STRATEGIES:
+        raise ValueError(f"Unknown merge strategy: {strategy}")
+    if len(records) == 1:
+        return dict(records[0])
+
+    order = _rank(records, strategy)
+    merged: Dict = {}
+    for i in order:
+        for key, value in records[i].items():
+            if key not in merged:
+                merged[key] = value
+            elif strategy == "most_complete" and value and (
+                not merged[key] or len(str(value)) > len(str(merged[key]))
+            ):
+                merged[key] = value
+
+    sources = set()
+    for record in records:
+        if isinstance(record.get("source"), str):
+            sources.add(record["source"])
+        sources.update(record.get("merged_sources") or [])
+    merged["merged_sources"] = sorted(sources)
+    return merged
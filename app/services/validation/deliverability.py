@@ -0,0 +1,258 @@
+"""
+Email deliverability checks.
+Addresses are grouped by domain and each distinct domain is resolved at
+most once per batch: MX records first, then A/AAAA as the implicit MX
+(RFC 5321). Lookups run under a bounded semaphore, results are cached per
+domain with a TTL (shorter for negative answers), and disposable domains
+are rejected from a frozenset without touching DNS.
+
+DNS goes through a DomainResolver: SystemResolver uses dnspython when it
+is installed (getaddrinfo otherwise, which cannot see MX records), and
+StaticResolver answers from in-memory tables for local runs and tests.
+"""
+
+import asyncio
+import socket
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from app.core.config import settings
+
+try:
+    import dns.asyncresolver
+    import dns.exception
+    import dns.resolver
+    DNSPYTHON_AVAILABLE = True
+except ImportError:
+    DNSPYTHON_AVAILABLE = False
+
+# Bundled list of disposable providers
+DISPOSABLE_DOMAINS_FILE = Path(__file__).with_name("disposable_domains.txt")
+
+
+class DomainNotFound(LookupError):
+    """The domain does not exist (NXDOMAIN)."""
+
+
+@lru_cache(maxsize=1)
+def disposable_domains(extra_path: str = "") -> frozenset:
+    """Bundled disposable domains plus those in `extra_path` (one per line)."""
+    domains = set()
+    for path in filter(None, [DISPOSABLE_DOMAINS_FILE, extra_path]):
+        for line in Path(path).read_text().splitlines():
+            line = line.strip().lower()
+            if line and not line.startswith("#"):
+                domains.add(line)
+    return frozenset(domains)
+
+
+def is_disposable(domain: str, domains: Optional[frozenset] = None) -> bool:
+    """True for a listed domain or any subdomain of one."""
+    domains = domains if domains is not None else disposable_domains(settings.disposable_domains_path)
+    parts = domain.lower().split(".")
+    return any(".".join(parts[i:]) in domains for i in range(len(parts) - 1))
+
+
+class DomainResolver:
+    """MX and address lookups; both raise DomainNotFound for NXDOMAIN."""
+
+    async def mx(self, domain: str) -> List[str]:
+        raise NotImplementedError
+
+    async def addresses(self, domain: str) -> List[str]:
+        raise NotImplementedError
+
+
+class SystemResolver(DomainResolver):
+    """The host's DNS, through dnspython when available."""
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout or settings.email_dns_timeout
+        self._resolver = None
+        if DNSPYTHON_AVAILABLE:
+            self._resolver = dns.asyncresolver.Resolver()
+            self._resolver.lifetime = self.timeout
+
+    async def mx(self, domain: str) -> List[str]:
+        if self._resolver is None:
+            return []
+        try:
+            answer = await self._resolver.resolve(domain, "MX")
+        except dns.resolver.NXDOMAIN:
+            raise DomainNotFound(domain)
+        except (dns.resolver.NoAnswer, dns.resolver.NoNameservers):
+            return []
+        except dns.exception.Timeout:
+            raise asyncio.TimeoutError(domain)
+        return [str(record.exchange).rstrip(".") for record in sorted(answer, key=lambda r: r.preference)]
+
+    async def addresses(self, domain: str) -> List[str]:
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await loop.getaddrinfo(domain, None, type=socket.SOCK_STREAM)
+        except socket.gaierror as exc:
+            if exc.errno in (socket.EAI_NONAME, getattr(socket, "EAI_NODATA", socket.EAI_NONAME)):
+                raise DomainNotFound(domain)
+            raise
+        return sorted({info[4][0] for info in infos})
+
+
+class StaticResolver(DomainResolver):
+    """
+    Local resolver stand-in answering from tables. Domains in neither
+    table do not exist; `lookups` counts queries per domain.
+    """
+
+    def __init__(
+        self,
+        mx: Optional[Dict[str, List[str]]] = None,
+        addresses: Optional[Dict[str, List[str]]] = None,
+        delay: float = 0.0,
+    ):
+        self.mx_records = {k.lower(): v for k, v in (mx or {}).items()}
+        self.address_records = {k.lower(): v for k, v in (addresses or {}).items()}
+        self.delay = delay
+        self.lookups: Dict[str, int] = {}
+
+    def _exists(self, domain: str) -> bool:
+        return domain in self.mx_records or domain in self.address_records
+
+    async def mx(self, domain: str) -> List[str]:
+        self.lookups[domain] = self.lookups.get(domain, 0) + 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if not self._exists(domain):
+            raise DomainNotFound(domain)
+        return list(self.mx_records.get(domain, []))
+
+    async def addresses(self, domain: str) -> List[str]:
+        if not self._exists(domain):
+            raise DomainNotFound(domain)
+        return list(self.address_records.get(domain, []))
+
+
+@dataclass
+class DomainStatus:
+    """Deliverability of one domain; `deliverable` is None when DNS did not answer."""
+
+    domain: str
+    deliverable: Optional[bool]
+    reason: str  # mx, implicit_mx, no_mail_records, nxdomain, disposable, timeout, error
+    mx: List[str] = field(default_factory=list)
+    checked_at: float = 0.0
+
+
+class DeliverabilityChecker:
+    """
+    Batched, cached domain checks. Concurrent requests for one domain
+    share a single in-flight lookup.
+    """
+
+    def __init__(
+        self,
+        resolver: Optional[DomainResolver] = None,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        ttl: Optional[int] = None,
+        negative_ttl: Optional[int] = None,
+        cache_size: Optional[int] = None,
+    ):
+        self.resolver = resolver or SystemResolver(timeout)
+        self.timeout = timeout or settings.email_dns_timeout
+        self.ttl = ttl if ttl is not None else settings.email_dns_ttl
+        self.negative_ttl = negative_ttl if negative_ttl is not None else settings.email_dns_negative_ttl
+        self.cache_size = cache_size or settings.email_dns_cache_size
+        self._semaphore = asyncio.Semaphore(concurrency or settings.email_dns_concurrency)
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()  # domain -> (expires_at, DomainStatus)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {"cache_hits": 0, "lookups": 0}
+
+    def _cached(self, domain: str) -> Optional[DomainStatus]:
+        entry = self._cache.get(domain)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._cache[domain]
+            return None
+        self._cache.move_to_end(domain)
+        self.stats["cache_hits"] += 1
+        return entry[1]
+
+    def _store(self, status: DomainStatus) -> None:
+        if status.deliverable is None:
+            return  # Transient failures are retried next time
+        ttl = self.ttl if status.deliverable else self.negative_ttl
+        self._cache[status.domain] = (time.monotonic() + ttl, status)
+        self._cache.move_to_end(status.domain)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _lookup(self, domain: str) -> DomainStatus:
+        self.stats["lookups"] += 1
+        now = time.time()
+        async with self._semaphore:
+            try:
+                mx = await asyncio.wait_for(self.resolver.mx(domain), self.timeout)
+                if mx:
+                    return DomainStatus(domain, True, "mx", mx, now)
+                if await asyncio.wait_for(self.resolver.addresses(domain), self.timeout):
+                    return DomainStatus(domain, True, "implicit_mx", [], now)
+                return DomainStatus(domain, False, "no_mail_records", [], now)
+            except DomainNotFound:
+                return DomainStatus(domain, False, "nxdomain", [], now)
+            except asyncio.TimeoutError:
+                return DomainStatus(domain, None, "timeout", [], now)
+            except OSError:
+                return DomainStatus(domain, None, "error", [], now)
+
+    async def check_domain(self, domain: str) -> DomainStatus:
+        """Status of one domain, from cache, a shared in-flight lookup or DNS."""
+        domain = domain.lower().rstrip(".")
+        if is_disposable(domain):
+            return DomainStatus(domain, False, "disposable", [], time.time())
+        cached = self._cached(domain)
+        if cached is not None:
+            return cached
+
+        pending = self._inflight.get(domain)
+        if pending is None:
+            pending = asyncio.ensure_future(self._lookup(domain))
+            self._inflight[domain] = pending
+            pending.add_done_callback(self._finish)
+        # Shielded so one cancelled caller does not cancel the shared lookup
+        return await asyncio.shield(pending)
+
+    def _finish(self, lookup: asyncio.Future) -> None:
+        if lookup.cancelled() or lookup.exception() is not None:
+            self._inflight = {d: f for d, f in self._inflight.items() if f is not lookup}
+            return
+        status = lookup.result()
+        self._inflight.pop(status.domain, None)
+        self._store(status)
+
+    async def check_domains(self, domains: Iterable[str]) -> Dict[str, DomainStatus]:
+        """Status per distinct domain, resolved concurrently."""
+        unique = list(dict.fromkeys(d.lower().rstrip(".") for d in domains if d))
+        statuses = await asyncio.gather(*(self.check_domain(domain) for domain in unique))
+        return dict(zip(unique, statuses))
+
+    async def check_emails(self, emails: Sequence[Optional[str]]) -> List[Optional[DomainStatus]]:
+        """Status per address (None for blanks), with one lookup per distinct domain."""
+        domains = [email.rsplit("@", 1)[-1].lower() if email and "@" in email else None for email in emails]
+        statuses = await self.check_domains(d for d in domains if d)
+        return [statuses.get(domain) if domain else None for domain in domains]
+
+
+_default_checker: Optional[DeliverabilityChecker] = None
+
+
+def get_deliverability_checker() -> DeliverabilityChecker:
+    """Process-wide checker, so its domain cache outlives single pipelines."""
+    global _default_checker
+    if _default_checker is None:
+        _default_checker = DeliverabilityChecker()
+    return _default_checker
@@ -3,14 +3,44 @@ Enhanced Data Validation Service
 Advanced validation, deduplication, and data cleansing pipeline.
 """
 
+import asyncio
 import hashlib
 import json
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 import uuid
 
+import pandas as pd
+
+from app.core.config import settings
+from app.services.validation.blocking import (
+    DEFAULT_MAX_BLOCK_SIZE,
+    DEFAULT_WINDOW,
+    CandidateGenerator,
+)
+from app.services.validation.clustering import UnionFind, merge_cluster
+from app.services.validation.deliverability import (
+    DeliverabilityChecker,
+    disposable_domains,
+    get_deliverability_checker,
+    is_disposable,
+)
+from app.services.validation.fingerprints import FingerprintStore, get_fingerprint_store
+from app.services.validation.lsh import MinHashLSHIndex, get_catalog_index
+from app.services.validation.normalize import name_match_key, normalize_company_name
+from app.services.validation.phones import COUNTRY_RULES, normalize_phones, parse_phone
+from app.services.validation.similarity import levenshtein_similarity
+
+
+# Smaller phone batches are parsed one by one; a normalize_phones call costs about 1ms
+PHONE_BATCH_MIN = 256
+
 
 @dataclass
 class ValidationResult:
@@ -23,7 +53,10 @@ class ValidationResult:
 
 
 class EnhancedEmailValidator:
-    """Enhanced email validation with deliverability checks."""
+    """
+    Enhanced email validation. DNS deliverability is checked per batch
+    by DeliverabilityChecker (see process_batch(check_deliverability=True)).
+    """
 
     def __init__(self):
         # RFC 5322 inspired pattern
@@ -31,10 +64,7 @@ class EnhancedEmailValidator:
             r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}"
             r"[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)+$"
         )
-        self.disposable_domains = {
-            "mailinator.com", "temp-mail.org", "guerrillamail.com",
-            "10minutemail.com", "sharklasers.com", "throwawaymail.com",
-        }
+        self.disposable_domains = disposable_domains(settings.disposable_domains_path)
 
     def validate(self, email: Optional[str]) -> ValidationResult:
         """Validate email address."""
@@ -55,7 +85,7 @@ class EnhancedEmailValidator:
 
         domain = parts[1]
 
-        if domain in self.disposable_domains:
+        if is_disposable(domain, self.disposable_domains):
             return ValidationResult(
                 False, email, ["Disposable email detected"], [], 0.1
             )
@@ -70,47 +100,48 @@ class EnhancedEmailValidator:
 
 
 class EnhancedPhoneValidator:
-    """Enhanced phone number validation with format detection."""
+    """Phone validation and E.164 normalization against per-country rules."""
 
-    # Country code patterns
-    COUNTRY_PATTERNS = {
-        "US": r"^\+?1?\d{10,14}$",
-        "UK": r"^\+?44\d{10,13}$",
-        "EU": r"^\+?\d{10,15}$",
-    }
-
-    def validate(self, phone: Optional[str], country: str = "US") -> ValidationResult:
-        """Validate phone number."""
+    def validate(self, phone: Optional[str], country: Optional[str] = None) -> ValidationResult:
+        """Validate phone number; national numbers are read in `country` (settings default)."""
         if not phone:
             return ValidationResult(False, None, ["Phone is required"], [], 0.0)
 
-        phone = str(phone).strip()
-
-        # Remove all non-numeric except +
-        cleaned = re.sub(r"[^\d\+]", "", phone)
+        parsed = parse_phone(str(phone).strip(), country or settings.phone_default_country)
+        if parsed.reason == "unverified":
+            return ValidationResult(True, parsed.e164, [], ["Calling code not verified"], 0.7)
+        if parsed.valid:
+            return ValidationResult(True, parsed.e164, [], [], 0.9)
 
-        # Check length
-        if len(cleaned) < 7:
+        if parsed.reason == "too_short":
             return ValidationResult(False, None, ["Phone too short"], [], 0.1)
-
-        if len(cleaned) > 15:
+        if parsed.reason == "too_long":
             return ValidationResult(False, None, ["Phone too long"], [], 0.1)
+        calling_code = COUNTRY_RULES[parsed.country][0] if parsed.country else ""
+        return ValidationResult(
+            False, f"+{calling_code}{parsed.national}", ["Invalid phone format for region"], [], 0.3
+        )
 
-        # Add country code if missing
-        if not cleaned.startswith("+"):
-            if country == "US" and len(cleaned) == 10:
-                cleaned = "+1" + cleaned
+    def validate_many(self, phones: List[Optional[str]], country: Optional[str] = None) -> List[ValidationResult]:
+        """
+        validate() over a batch. Valid numbers come from one vectorized
+        normalize_phones pass; only invalid ones are re-parsed for their reason.
+        """
+        country = country or settings.phone_default_country
+        if len(phones) < PHONE_BATCH_MIN:
+            return [self.validate(phone, country) for phone in phones]
+
+        parsed = normalize_phones(pd.Series([str(p).strip() if p else None for p in phones], dtype=object), country)
+        results = []
+        columns = (parsed["e164"].tolist(), parsed["country"].tolist(), parsed["valid"].tolist())
+        for phone, e164, listed, valid in zip(phones, *columns):
+            if not valid:
+                results.append(self.validate(phone, country))
+            elif not isinstance(listed, str):
+                results.append(ValidationResult(True, e164, [], ["Calling code not verified"], 0.7))
             else:
-                cleaned = "+" + cleaned
-
-        # Validate format based on country
-        pattern = self.COUNTRY_PATTERNS.get(country, self.COUNTRY_PATTERNS["EU"])
-        if not re.match(pattern, cleaned):
-            return ValidationResult(
-                False, cleaned, ["Invalid phone format for region"], [], 0.3
-            )
-
-        return ValidationResult(True, cleaned, [], [], 0.9)
+                results.append(ValidationResult(True, e164, [], [], 0.9))
+        return results
 
 
 class AddressValidator:
@@ -148,35 +179,11 @@ class AddressValidator:
 
 
 class CompanyNameNormalizer:
-    """Normalize and standardize company names."""
-
-    # Common suffixes to remove/standardize
-    SUFFIXES = [
-        ("inc", "Inc."),
-        ("inc.", "Inc."),
-        ("llc", "LLC"),
-        ("llc.", "LLC"),
-        ("corp", "Corp."),
-        ("corp.", "Corp."),
-        ("corporation", "Corp."),
-        ("ltd", "Ltd."),
-        ("ltd.", "Ltd."),
-        ("co", "Co."),
-        ("co.", "Co."),
-        ("company", "Co."),
-        ("limited", "Ltd."),
-    ]
-
-    # Legal entity types
-    ENTITY_TYPES = {
-        "inc": "corporation",
-        "llc": "llc",
-        "corp": "corporation",
-        "ltd": "limited",
-        "lp": "limited_partnership",
-        "gp": "general_partnership",
-        "sole": "sole_proprietorship",
-    }
+    """
+    Normalize and standardize company names.
+    Suffix tables, matching and memoization live in
+    app.services.validation.normalize.
+    """
 
     def normalize(self, name: str) -> Tuple[str, str, float]:
         """
@@ -185,75 +192,53 @@ class CompanyNameNormalizer:
         """
         if not name:
             return "", "unknown", 0.0
-
-        name = str(name).strip()
-        original = name
-
-        # Convert to title case (preserving acronyms)
-        words = name.split()
-        normalized_words = []
-
-        for word in words:
-            if len(word) <= 2 and word.isupper():
-                normalized_words.append(word)
-            else:
-                normalized_words.append(word.capitalize())
-
-        name = " ".join(normalized_words)
-
-        # Replace suffixes
-        entity_type = "unknown"
-        for old_suffix, new_suffix in self.SUFFIXES:
-            pattern = r"\b" + re.escape(old_suffix) + r"\.?$"
-            if re.search(pattern, name, re.IGNORECASE):
-                name = re.sub(pattern, new_suffix, name, flags=re.IGNORECASE)
-                entity_type = self.ENTITY_TYPES.get(old_suffix, "other")
-                break
-
-        # Check for parenthetical terms
-        paren_match = re.search(r"\((.*?)\)", name)
-        if paren_match:
-            paren_content = paren_match.group(1)
-            if paren_content.lower() in ["formerly", "formerly known as"]:
-                name = re.sub(r"\s*\(.*?\)", "", name)
-
-        # Calculate confidence
-        confidence = 0.5
-        if name != original:
-            confidence += 0.2
-        if entity_type != "unknown":
-            confidence += 0.2
-        if len(name) >= 3:
-            confidence += 0.1
-
-        return name.strip(), entity_type, min(1.0, confidence)
+        return normalize_company_name(str(name))
 
 
 class EnhancedDeduplicator:
-    """Enhanced deduplication with fuzzy matching."""
+    """
+    Enhanced deduplication with fuzzy matching. With a fingerprint store,
+    merged records are also checked against suppliers from earlier runs.
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        window: int = DEFAULT_WINDOW,
+        max_block_size: int = DEFAULT_MAX_BLOCK_SIZE,
+        store: Optional[FingerprintStore] = None,
+    ):
         self.name_normalizer = CompanyNameNormalizer()
+        self.candidates = CandidateGenerator(window=window, max_block_size=max_block_size)
+        self.store = store
 
     def generate_fingerprint(self, data: Dict) -> str:
         """Generate fingerprint for deduplication."""
-        name = data.get("name", "").lower().strip()
-        normalized_name, _, _ = self.name_normalizer.normalize(name)
-
-        # Remove common words
-        stop_words = {"the", "a", "an", "of", "for", "and", "group", "holdings"}
-        words = normalized_name.lower().split()
-        words = [w for w in words if w not in stop_words]
+        name = name_match_key(data.get("name") or "")
 
         # Get email domain if available
-        email = data.get("email") or data.get("contact_json", {}).get("email", "")
+        email = data.get("email") or (data.get("contact_json") or {}).get("email") or ""
         domain = email.split("@")[-1] if "@" in email else ""
 
-        fingerprint = f"{' '.join(words)}:{domain}"
+        fingerprint = f"{name}:{domain}"
         return hashlib.md5(fingerprint.encode()).hexdigest()[:16]
 
-    def calculate_similarity(self, name1: str, name2: str) -> float:
-        """Calculate name similarity using Levenshtein distance."""
+    @staticmethod
+    def contact_keys(data: Dict) -> Tuple[str, str]:
+        """(email domain, phone) that tell companies apart; '' when missing."""
+        contact = data.get("contact_json") or {}
+        email = data.get("email") or contact.get("email") or ""
+        domain = email.rsplit("@", 1)[-1].lower() if "@" in email else ""
+        phone = str(data.get("phone") or contact.get("phone") or "")
+        if phone:
+            parsed = parse_phone(phone, settings.phone_default_country)
+            phone = parsed.e164 if parsed.valid else re.sub(r"\D", "", phone)
+        return domain, phone
+
+    def calculate_similarity(self, name1: str, name2: str, min_similarity: float = 0.0) -> float:
+        """
+        Calculate name similarity using Levenshtein distance.
+        Pairs that cannot reach `min_similarity` score 0.0 early.
+        """
         if not name1 or not name2:
             return 0.0
 
@@ -263,141 +248,114 @@ class EnhancedDeduplicator:
         if name1 == name2:
             return 1.0
 
-        # Simple character-based similarity
-        len1, len2 = len(name1), len(name2)
-
-        if len1 == 0 or len2 == 0:
+        if not name1 or not name2:
             return 0.0
 
-        # Levenshtein distance
-        matrix = [[0] * (len2 + 1) for _ in range(len1 + 1)]
-
-        for i in range(len1 + 1):
-            matrix[i][0] = i
-        for j in range(len2 + 1):
-            matrix[0][j] = j
-
-        for i in range(1, len1 + 1):
-            for j in range(1, len2 + 1):
-                cost = 0 if name1[i - 1] == name2[j - 1] else 1
-                matrix[i][j] = min(
-                    matrix[i - 1][j] + 1,
-                    matrix[i][j - 1] + 1,
-                    matrix[i - 1][j - 1] + cost,
-                )
+        return levenshtein_similarity(name1, name2, min_similarity)
+
+    def cluster(self, records: List[Dict], threshold: float = 0.85) -> List[List[int]]:
+        """
+        Duplicate clusters as lists of record positions, ordered by first
+        member. Records match on equal fingerprints or, for blocked
+        candidate pairs (see app.services.validation.blocking), on the
+        similarity of their name_match_key; matches are joined transitively.
+        A name match never joins two clusters that both have email domains
+        (or phones) and share none of them: those are different companies.
+        """
+        sets = UnionFind(len(records))
+        # Cluster root -> (email domains, phones) of its members
+        contacts = {
+            index: ({domain} - {""}, {phone} - {""})
+            for index, (domain, phone) in enumerate(map(self.contact_keys, records))
+        }
+
+        def join(a: int, b: int) -> None:
+            root_a, root_b = sets.find(a), sets.find(b)
+            if root_a != root_b:
+                domains_a, phones_a = contacts.pop(root_a)
+                domains_b, phones_b = contacts.pop(root_b)
+                sets.union(root_a, root_b)
+                contacts[sets.find(root_a)] = (domains_a | domains_b, phones_a | phones_b)
+
+        def conflict(a: int, b: int) -> bool:
+            (domains_a, phones_a), (domains_b, phones_b) = contacts[sets.find(a)], contacts[sets.find(b)]
+            return bool(
+                (domains_a and domains_b and domains_a.isdisjoint(domains_b))
+                or (phones_a and phones_b and phones_a.isdisjoint(phones_b))
+            )
 
-        distance = matrix[len1][len2]
-        max_len = max(len1, len2)
-        return 1.0 - (distance / max_len)
+        first_seen: Dict[str, int] = {}
+        for index, record in enumerate(records):
+            join(first_seen.setdefault(self.generate_fingerprint(record), index), index)
+
+        # Suffix-free keys, so "Inc" or "Corporation" do not inflate the score
+        keys = [name_match_key(record.get("name") or "") for record in records]
+        for i, j in self.candidates.candidate_pairs(records).tolist():
+            # Pairs already connected cannot change the clusters
+            if sets.find(i) != sets.find(j) and not conflict(i, j) and (
+                self.calculate_similarity(keys[i], keys[j], threshold) >= threshold
+            ):
+                join(i, j)
+
+        return sets.clusters()
 
     def find_duplicates(self, records: List[Dict], threshold: float = 0.85) -> List[List[Dict]]:
         """Find duplicate groups using fuzzy matching."""
-        groups: Dict[str, List[Dict]] = {}
-
-        for record in records:
-            fp = self.generate_fingerprint(record)
-
-            # Try to match with existing groups
-            matched = False
-            for group_fp, group_records in groups.items():
-                if fp == group_fp:
-                    groups[fp].append(record)
-                    matched = True
-                    break
-
-            if not matched:
-                # Check fuzzy similarity
-                for group_fp, group_records in groups.items():
-                    ref_record = group_records[0]
-                    sim = self.calculate_similarity(
-                        record.get("name", ""),
-                        ref_record.get("name", "")
-                    )
-                    if sim >= threshold:
-                        groups[group_fp].append(record)
-                        matched = True
-                        break
-
-            if not matched:
-                groups[fp] = [record]
-
-        # Return only groups with duplicates
-        return [records for records in groups.values() if len(records) > 1]
+        return [
+            [records[i] for i in members]
+            for members in self.cluster(records, threshold)
+            if len(members) > 1
+        ]
 
     def deduplicate(
-        self, records: List[Dict], merge_strategy: str = "best_score"
+        self, records: List[Dict], merge_strategy: str = "best_score", threshold: float = 0.85
     ) -> List[Dict]:
         """
         Deduplicate records with intelligent merging.
         merge_strategy: 'best_score', 'most_complete', 'newest'
+        Each duplicate cluster is merged once (see merge_cluster). Records
+        matching a stored supplier carry its ID as `duplicate_of`; the store
+        is only read, call remember() once the records have been written.
         """
-        fingerprints: Dict[str, Dict] = {}
-
-        for record in records:
-            fp = self.generate_fingerprint(record)
-
-            if fp not in fingerprints:
-                fingerprints[fp] = record
-            else:
-                existing = fingerprints[fp]
-                merged = self._merge_records(existing, record, merge_strategy)
-                fingerprints[fp] = merged
-
-        return list(fingerprints.values())
-
-    def _merge_records(
-        self, record1: Dict, record2: Dict, strategy: str
-    ) -> Dict:
-        """Merge two records based on strategy."""
-        merged = record1.copy()
-
-        for key, value in record2.items():
-            if key in merged:
-                # Choose which value to keep
-                if strategy == "best_score":
-                    score1 = record1.get("verification_score", 0)
-                    score2 = record2.get("verification_score", 0)
-                    if score2 > score1:
-                        merged[key] = value
-                elif strategy == "most_complete":
-                    if value and (not merged.get(key) or len(str(value)) > len(str(merged.get(key)))):
-                        merged[key] = value
-                elif strategy == "newest":
-                    date1 = record1.get("scraped_at", "")
-                    date2 = record2.get("scraped_at", "")
-                    if date2 > date1:
-                        merged[key] = value
-            else:
-                merged[key] = value
-
-        # Track merge history
-        if "merged_sources" not in merged:
-            sources = set()
-            if isinstance(merged.get("source"), str):
-                sources.add(merged["source"])
-            if isinstance(record1.get("source"), str):
-                sources.add(record1["source"])
-            if isinstance(record2.get("source"), str):
-                sources.add(record2["source"])
-            merged["merged_sources"] = list(sources)
-
-        return merged
+        unique = [
+            records[members[0]] if len(members) == 1
+            else merge_cluster([records[i] for i in members], merge_strategy)
+            for members in self.cluster(records, threshold)
+        ]
+        if self.store is not None:
+            stored_ids = self.store.get_many([self.generate_fingerprint(record) for record in unique])
+            for record, stored in zip(unique, stored_ids):
+                if stored is not None and str(stored) != record.get("id"):
+                    record["duplicate_of"] = str(stored)
+        return unique
+
+    def remember(self, records: List[Dict]) -> int:
+        """
+        Add suppliers to the fingerprint store once their write has been
+        committed (see FingerprintStore.remember). Returns the number added.
+        """
+        if self.store is None:
+            return 0
+        return self.store.remember(records, self.generate_fingerprint)
 
 
-class EnhancedValidationPipeline:
+class RecordValidator:
     """
-    Complete validation pipeline with all validators.
+    Stateless per-record validation, picklable so batches can be
+    validated in worker processes.
     """
 
     def __init__(self):
         self.email_validator = EnhancedEmailValidator()
         self.phone_validator = EnhancedPhoneValidator()
         self.address_validator = AddressValidator()
-        self.deduplicator = EnhancedDeduplicator()
 
-    def validate_record(self, record: Dict) -> Tuple[bool, Dict, List[str]]:
+    def validate_record(
+        self, record: Dict, phone_result: Optional[ValidationResult] = None
+    ) -> Tuple[bool, Dict, List[str]]:
         """
-        Validate a single record.
+        Validate a single record, reusing `phone_result` if its phone was
+        already validated with the rest of a batch.
         Returns (is_valid, cleaned_record, warnings).
         """
         warnings = []
@@ -417,7 +375,8 @@ class EnhancedValidationPipeline:
         cleaned["email"] = email_result.cleaned_value
 
         # Validate phone
-        phone_result = self.phone_validator.validate(record.get("phone"))
+        if phone_result is None:
+            phone_result = self.phone_validator.validate(record.get("phone"))
         if not phone_result.is_valid:
             warnings.extend(phone_result.errors)
         cleaned["phone"] = phone_result.cleaned_value
@@ -476,19 +435,161 @@ class EnhancedValidationPipeline:
 
         return min(1.0, score)
 
+    def validate_chunk(self, start: int, records: List[Dict]) -> List[Tuple[int, bool, Dict, List[str]]]:
+        """(index, is_valid, cleaned, warnings) for records numbered from `start`."""
+        phones = self.phone_validator.validate_many([record.get("phone") for record in records])
+        return [
+            (start + i, *self.validate_record(record, phone))
+            for i, (record, phone) in enumerate(zip(records, phones))
+        ]
+
+
+_worker_validator: Optional[RecordValidator] = None
+_validation_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _validate_in_worker(start: int, records: List[Dict]) -> List[Tuple[int, bool, Dict, List[str]]]:
+    """Pool entry point; each worker process builds its validator once."""
+    global _worker_validator
+    if _worker_validator is None:
+        _worker_validator = RecordValidator()
+    return _worker_validator.validate_chunk(start, records)
+
+
+def _validation_workers() -> int:
+    return settings.validation_workers or os.cpu_count() or 1
+
+
+def _validation_executor() -> ProcessPoolExecutor:
+    """Process-wide validation pool, created on first use (after any pre-fork)."""
+    global _validation_pool
+    if _validation_pool is None:
+        _validation_pool = ProcessPoolExecutor(
+            max_workers=_validation_workers(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _validation_pool
+
+
+class EnhancedValidationPipeline:
+    """
+    Complete validation pipeline with all validators.
+    Records are also checked against the catalog near-duplicate index
+    (settings.dedupe_index_path) and fingerprint store
+    (settings.dedupe_fingerprint_path) when they have been built; pass
+    records to remember() once they have been written.
+    """
+
+    def __init__(
+        self,
+        catalog_index: Optional[MinHashLSHIndex] = None,
+        deliverability: Optional[DeliverabilityChecker] = None,
+        fingerprint_store: Optional[FingerprintStore] = None,
+    ):
+        self.record_validator = RecordValidator()
+        self.deduplicator = EnhancedDeduplicator(
+            store=fingerprint_store if fingerprint_store is not None else get_fingerprint_store()
+        )
+        self.catalog_index = catalog_index if catalog_index is not None else get_catalog_index()
+        self._deliverability = deliverability
+
+    @property
+    def deliverability(self) -> DeliverabilityChecker:
+        """The given checker, else the shared one (so its domain cache persists)."""
+        if self._deliverability is None:
+            self._deliverability = get_deliverability_checker()
+        return self._deliverability
+
+    def validate_record(self, record: Dict) -> Tuple[bool, Dict, List[str]]:
+        """
+        Validate a single record.
+        Returns (is_valid, cleaned_record, warnings).
+        """
+        return self.record_validator.validate_record(record)
+
+    async def _validate_all(self, records: List[Dict]) -> List[Tuple[int, bool, Dict, List[str]]]:
+        """
+        Validate inline for small batches; larger ones are split into
+        chunks across the validation pool and awaited without blocking
+        the event loop.
+        """
+        if len(records) <= settings.validation_inline_max:
+            return self.record_validator.validate_chunk(0, records)
+
+        global _validation_pool
+        pool = _validation_executor()
+        # About four chunks per worker so stragglers even out
+        size = max(settings.validation_chunk_rows, -(-len(records) // (_validation_workers() * 4)))
+        loop = asyncio.get_running_loop()
+        try:
+            chunks = await asyncio.gather(*(
+                loop.run_in_executor(pool, _validate_in_worker, start, records[start:start + size])
+                for start in range(0, len(records), size)
+            ))
+        except BrokenProcessPool:
+            _validation_pool = None  # A broken pool cannot take new work
+            raise
+        return [result for chunk in chunks for result in chunk]
+
+    async def _check_deliverability(self, results: List[Tuple[int, bool, Dict, List[str]]]) -> None:
+        """
+        Resolve the email domains of valid records, one lookup per distinct
+        domain. Undeliverable emails are dropped like invalid ones.
+        """
+        checked = [(cleaned, warnings) for _, is_valid, cleaned, warnings in results if is_valid and cleaned.get("email")]
+        statuses = await self.deliverability.check_emails([cleaned["email"] for cleaned, _ in checked])
+        for (cleaned, warnings), status in zip(checked, statuses):
+            cleaned["email_deliverable"] = status.deliverable
+            if status.deliverable is False:
+                warnings.append(f"Email domain cannot receive mail ({status.reason})")
+                cleaned["email"] = cleaned["contact_json"]["email"] = None
+                cleaned["verification_score"] = self.record_validator._calculate_verification_score(cleaned)
+
+    def _deduplicate(self, valid_records: List[Dict], deduplicate: bool) -> Tuple[List[Dict], Dict]:
+        """Batch deduplication, then flags for near-duplicates of catalog suppliers."""
+        deduplication_info: Dict[str, Any] = {}
+        if deduplicate and valid_records:
+            unique_records = self.deduplicator.deduplicate(valid_records)
+            deduplication_info = {
+                "input_count": len(valid_records),
+                "output_count": len(unique_records),
+                "duplicates_removed": len(valid_records) - len(unique_records),
+            }
+            if self.deduplicator.store is not None:
+                deduplication_info["known_duplicates"] = sum("duplicate_of" in r for r in unique_records)
+        else:
+            unique_records = valid_records
+
+        # Flag records that near-duplicate suppliers already in the catalog
+        if self.catalog_index is not None and unique_records:
+            catalog_duplicates = 0
+            for record, match in zip(unique_records, self.catalog_index.query(unique_records)):
+                if match:
+                    record["catalog_duplicate_of"], record["catalog_similarity"] = match
+                    catalog_duplicates += 1
+            deduplication_info["catalog_duplicates"] = catalog_duplicates
+
+        return unique_records, deduplication_info
+
     async def process_batch(
-        self, records: List[Dict], deduplicate: bool = True
+        self, records: List[Dict], deduplicate: bool = True, check_deliverability: bool = False
     ) -> Dict:
         """
         Process a batch of records.
+        Validation of large batches runs in worker processes and
+        deduplication in a thread, so the event loop stays responsive.
+        With check_deliverability, email domains are resolved via DNS.
         """
         valid_records = []
         invalid_records = []
         all_warnings = []
 
         # Validate each record
-        for i, record in enumerate(records):
-            is_valid, cleaned, warnings = self.validate_record(record)
+        results = await self._validate_all(records)
+        if check_deliverability:
+            await self._check_deliverability(results)
+
+        for i, is_valid, cleaned, warnings in results:
             if is_valid:
                 cleaned["_original_index"] = i
                 valid_records.append(cleaned)
@@ -500,20 +601,16 @@ class EnhancedValidationPipeline:
             else:
                 invalid_records.append({
                     "index": i,
-                    "original": record,
+                    "original": records[i],
                 })
 
         # Deduplicate
-        deduplication_info = {}
-        if deduplicate and valid_records:
-            unique_records = self.deduplicator.deduplicate(valid_records)
-            deduplication_info = {
-                "input_count": len(valid_records),
-                "output_count": len(unique_records),
-                "duplicates_removed": len(valid_records) - len(unique_records),
-            }
+        if len(records) <= settings.validation_inline_max:
+            unique_records, deduplication_info = self._deduplicate(valid_records, deduplicate)
         else:
-            unique_records = valid_records
+            unique_records, deduplication_info = await asyncio.to_thread(
+                self._deduplicate, valid_records, deduplicate
+            )
 
         return {
             "valid_records": unique_records,
@@ -530,6 +627,10 @@ class EnhancedValidationPipeline:
             },
         }
 
+    def remember(self, records: List[Dict]) -> int:
+        """Add written suppliers to the fingerprint store (see EnhancedDeduplicator.remember)."""
+        return self.deduplicator.remember(records)
+
 
 # Convenience functions
 async def validate_and_clean(records: List[Dict]) -> Dict:
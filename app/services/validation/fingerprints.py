@@ -0,0 +1,238 @@
+"""
+Persistent fingerprint store for deduplication across runs.
+An open-addressing hash table of 16-byte fingerprint digests -> supplier
+UUIDs in a memory-mapped file: checks and inserts are O(1), and resident
+memory is whatever pages the OS keeps cached rather than the table size.
+The table doubles into a new file when it passes MAX_LOAD.
+Any number of processes may share a store: every operation holds an
+flock on `<path>.lock` (shared to read, exclusive to write) and remaps
+the table when another process has grown it into a new file.
+"""
+
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from app.core.config import settings
+
+_MAGIC = b"TMFPS001"
+# Header: magic, capacity (slots), count, padded to _HEADER_SIZE
+_HEADER = struct.Struct("<8sQQ")
+_HEADER_SIZE = 64
+# Slot layout: 16-byte fingerprint digest + 16-byte supplier UUID; a zero digest marks an empty slot
+_SLOT = struct.Struct("<16s16s")
+_EMPTY = bytes(16)
+
+# Largest share of slots in use before the table doubles
+MAX_LOAD = 0.7
+# Slots rehashed per read while growing
+_GROW_SLOTS = 65536
+
+
+def fingerprint_digest(fingerprint: str) -> bytes:
+    """16-byte, never-zero digest of a fingerprint string."""
+    digest = hashlib.blake2b(fingerprint.encode(), digest_size=16).digest()
+    return digest if digest != _EMPTY else b"\x01" + digest[1:]
+
+
+def _probe(buffer: mmap.mmap, mask: int, digest: bytes) -> tuple:
+    """(byte offset, stored UUID bytes or None) for a digest."""
+    slot = int.from_bytes(digest[:8], "little") & mask
+    while True:
+        offset = _HEADER_SIZE + slot * _SLOT.size
+        stored = buffer[offset:offset + 16]
+        if stored == digest:
+            return offset, buffer[offset + 16:offset + 32]
+        if stored == _EMPTY:
+            return offset, None
+        slot = (slot + 1) & mask
+
+
+class FingerprintStore:
+    """
+    Fingerprint -> supplier ID table persisted at `path`. A missing file
+    is created with `capacity` slots (rounded up to a power of two).
+    Only suppliers that have been written to the database belong in the
+    store (see Deduplicator.remember); deduplication only reads it.
+    """
+
+    def __init__(self, path: str, capacity: Optional[int] = None):
+        self.path = path
+        self._capacity_hint = capacity or settings.dedupe_fingerprint_capacity
+        self._lock = threading.Lock()
+        self._lock_file = None
+        self._file = None
+        self._buffer = None
+        self._open()
+
+    @staticmethod
+    def _create(path: str, capacity: int) -> None:
+        capacity = 1 << max(4, (capacity - 1).bit_length())
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, capacity, 0).ljust(_HEADER_SIZE, b"\0"))
+            f.truncate(_HEADER_SIZE + capacity * _SLOT.size)  # Sparse where the filesystem allows
+
+    def _open(self) -> None:
+        """Open the lock file, creating the table under it if needed, and map the table."""
+        self._pid = os.getpid()
+        self._lock_file = open(f"{self.path}.lock", "a+b")
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+        try:
+            if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+                self._create(self.path, self._capacity_hint)
+            self._map()
+        except Exception:
+            self.close()
+            raise
+        fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _map(self) -> None:
+        """(Re)map the current table file; caller must hold the file lock."""
+        self._unmap()
+        self._file = open(self.path, "r+b")
+        self._inode = os.fstat(self._file.fileno()).st_ino
+        self._buffer = mmap.mmap(self._file.fileno(), 0)
+        magic, self.capacity, _ = _HEADER.unpack_from(self._buffer, 0)
+        if magic != _MAGIC:
+            self._unmap()
+            raise ValueError(f"{self.path} is not a fingerprint store")
+        self._mask = self.capacity - 1
+
+    def _unmap(self) -> None:
+        if self._buffer is not None and not self._buffer.closed:
+            self._buffer.flush()
+            self._buffer.close()
+        if self._file is not None:
+            self._file.close()
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """Hold the thread and file locks, remapping if another process grew the table."""
+        with self._lock:
+            if self._pid != os.getpid():
+                # A forked child shares the parent's lock file description; take its own
+                self._lock_file.close()
+                self._unmap()
+                self._open()
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                if os.stat(self.path).st_ino != self._inode:
+                    self._map()
+                yield
+            finally:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _count(self) -> int:
+        return _HEADER.unpack_from(self._buffer, 0)[2]
+
+    def __len__(self) -> int:
+        with self._locked(exclusive=False):
+            return self._count()
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return self.get(fingerprint) is not None
+
+    def __enter__(self) -> "FingerprintStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def get(self, fingerprint: str) -> Optional[uuid.UUID]:
+        """Supplier ID stored for a fingerprint."""
+        return self.get_many([fingerprint])[0]
+
+    def get_many(self, fingerprints: List[str]) -> List[Optional[uuid.UUID]]:
+        """Supplier IDs stored for several fingerprints, under one lock."""
+        digests = [fingerprint_digest(fingerprint) for fingerprint in fingerprints]
+        with self._locked(exclusive=False):
+            stored = [_probe(self._buffer, self._mask, digest)[1] for digest in digests]
+        return [uuid.UUID(bytes=value) if value is not None else None for value in stored]
+
+    def setdefault(self, fingerprint: str, supplier_id: Union[str, uuid.UUID]) -> uuid.UUID:
+        """Store a supplier ID for a new fingerprint; returns the stored ID."""
+        return self.add_many([(fingerprint, supplier_id)])[0]
+
+    def add_many(self, entries: Iterable[Tuple[str, Union[str, uuid.UUID]]]) -> List[uuid.UUID]:
+        """setdefault for several (fingerprint, supplier ID) pairs, under one lock."""
+        entries = [(fingerprint_digest(fingerprint), uuid.UUID(str(supplier_id))) for fingerprint, supplier_id in entries]
+        result = []
+        with self._locked(exclusive=True):
+            count = self._count()
+            for digest, supplier_id in entries:
+                offset, stored = _probe(self._buffer, self._mask, digest)
+                if stored is not None:
+                    result.append(uuid.UUID(bytes=stored))
+                    continue
+                _SLOT.pack_into(self._buffer, offset, digest, supplier_id.bytes)
+                count += 1
+                _HEADER.pack_into(self._buffer, 0, _MAGIC, self.capacity, count)
+                if count > self.capacity * MAX_LOAD:
+                    self._grow(count)
+                result.append(supplier_id)
+        return result
+
+    def remember(self, records: Iterable[Dict], fingerprint: Callable[[Dict], str]) -> int:
+        """
+        Add suppliers after their write has been committed, keyed by
+        `fingerprint(record)`; records without an `id` or marked
+        `duplicate_of` are skipped. Returns the number of records added.
+        """
+        entries = [
+            (fingerprint(record), record["id"])
+            for record in records
+            if record.get("id") and not record.get("duplicate_of")
+        ]
+        if entries:
+            self.add_many(entries)
+            self.flush()
+        return len(entries)
+
+    def _grow(self, count: int) -> None:
+        """Rehash into a table twice the size; caller must hold the exclusive lock."""
+        tmp_path = f"{self.path}.tmp"
+        self._create(tmp_path, self.capacity * 2)
+        with open(tmp_path, "r+b") as f, mmap.mmap(f.fileno(), 0) as target:
+            mask = self.capacity * 2 - 1
+            for start in range(0, self.capacity, _GROW_SLOTS):
+                begin = _HEADER_SIZE + start * _SLOT.size
+                end = _HEADER_SIZE + min(start + _GROW_SLOTS, self.capacity) * _SLOT.size
+                for digest, value in _SLOT.iter_unpack(self._buffer[begin:end]):
+                    if digest != _EMPTY:
+                        offset, _ = _probe(target, mask, digest)
+                        _SLOT.pack_into(target, offset, digest, value)
+            _HEADER.pack_into(target, 0, _MAGIC, self.capacity * 2, count)
+            target.flush()
+        os.replace(tmp_path, self.path)
+        self._map()
+
+    def flush(self) -> None:
+        """Write dirty pages to disk."""
+        with self._locked(exclusive=False):
+            self._buffer.flush()
+
+    def close(self) -> None:
+        self._unmap()
+        if self._lock_file is not None:
+            self._lock_file.close()
+
+
+_fingerprint_store: Optional[FingerprintStore] = None
+
+
+def get_fingerprint_store(path: Optional[str] = None) -> Optional[FingerprintStore]:
+    """
+    The process-wide fingerprint store, opened once from
+    settings.dedupe_fingerprint_path; None if no store has been built.
+    """
+    global _fingerprint_store
+    path = path or settings.dedupe_fingerprint_path
+    if _fingerprint_store is None and os.path.exists(path):
+        _fingerprint_store = FingerprintStore(path)
+    return _fingerprint_store
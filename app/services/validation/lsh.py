@@ -0,0 +1,338 @@
+"""
+MinHash-LSH near-duplicate index for catalog suppliers.
+Each record's normalized text is cut into byte shingles, summarized as a
+MinHash signature and split into bands; records sharing any band are
+candidates, confirmed by the share of equal signature slots (an estimate
+of shingle Jaccard similarity).
+
+Band buckets live in a NumPy open-addressing table whose slots point at
+the newest entry for a band key, entries chaining to older ones, so a
+lookup is O(1) expected per band. The index is a directory of .npy
+files, memory-mapped on load so every worker process reads the same
+page-cache pages; add() grows a loaded index privately (copy-on-write).
+"""
+
+import os
+import shutil
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.validation.blocking import name_keys
+
+DEFAULT_NUM_PERM = 100
+DEFAULT_BANDS = 20  # 5 rows per band: candidates from ~0.55 Jaccard
+
+# Estimated Jaccard similarity a candidate must reach to count as a match
+DEFAULT_THRESHOLD = 0.6
+
+# Entries followed per band bucket; larger buckets are generic names
+DEFAULT_MAX_BUCKET = 50
+
+# Names hashed per vectorized signature batch (bounds temporary memory)
+_SIGNATURE_BATCH = 2048
+
+_MAX_LOAD = 0.5
+_EMPTY_SIG = np.iinfo(np.uint32).max
+_SEED = 1_000_003
+
+
+def shingle_codes(texts: Sequence[str], size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Byte n-grams of each text packed into uint64 codes, vectorized over a
+    padded byte matrix. Returns (codes, row) with one entry per shingle;
+    texts shorter than `size` contribute their whole text as one shingle.
+    """
+    encoded = [text.encode("utf-8") for text in texts]
+    width = max([len(b) for b in encoded] + [size])
+    lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+    raw = np.array(encoded, dtype=f"S{width}").view(np.uint8).reshape(len(encoded), width)
+
+    codes = np.zeros((len(encoded), width - size + 1), dtype=np.uint64)
+    for offset in range(size):
+        codes |= raw[:, offset:offset + codes.shape[1]].astype(np.uint64) << np.uint64(8 * offset)
+
+    positions = np.arange(codes.shape[1])
+    valid = (positions < (lengths - size + 1)[:, None]) | ((positions == 0) & (lengths > 0)[:, None])
+    row = np.broadcast_to(np.arange(len(encoded))[:, None], codes.shape)
+    return codes[valid], row[valid]
+
+
+class MinHashLSHIndex:
+    """
+    Persistent MinHash-LSH index from catalog ids to signatures of one text
+    field (`name` by default, `description` with longer shingles).
+    """
+
+    def __init__(
+        self,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        field: str = "name",
+        shingle_size: int = 3,
+        max_bucket: int = DEFAULT_MAX_BUCKET,
+        capacity: int = 1024,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        if not 1 <= shingle_size <= 8:
+            raise ValueError("shingle_size must be between 1 and 8 bytes")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.field = field
+        self.shingle_size = shingle_size
+        self.max_bucket = max_bucket
+
+        rng = np.random.default_rng(_SEED)
+        self._mul = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._add = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+        self._band_mul = rng.integers(1, 2**63, size=num_perm // bands, dtype=np.uint64) | np.uint64(1)
+
+        self.ids: Sequence[str] = []  # A mapped array once loaded; a list again after add()
+        self.signatures = np.empty((0, num_perm), dtype=np.uint32)
+        self._next = np.empty(0, dtype=np.int64)  # entry (record * bands + band) -> older entry
+        self._slot_keys = np.zeros(capacity, dtype=np.uint64)  # 0 marks an empty slot
+        self._slot_heads = np.full(capacity, -1, dtype=np.int64)
+        self._used = 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # Signatures
+
+    def _texts(self, records: Sequence[Dict]) -> List[str]:
+        if self.field == "name":
+            return [key.replace(" ", "") for key in name_keys(list(records)).tolist()]
+        return [" ".join(str(r.get(self.field) or "").lower().split()) for r in records]
+
+    def signatures_for(self, records: Sequence[Dict]) -> np.ndarray:
+        """MinHash signatures, (n, num_perm) uint32; empty texts get all-max rows."""
+        texts = self._texts(records)
+        out = np.full((len(texts), self.num_perm), _EMPTY_SIG, dtype=np.uint32)
+        for start in range(0, len(texts), _SIGNATURE_BATCH):
+            codes, row = shingle_codes(texts[start:start + _SIGNATURE_BATCH], self.shingle_size)
+            if not len(codes):
+                continue
+            # Multiply-shift hashing: one odd multiplier per permutation
+            hashed = ((codes[:, None] * self._mul + self._add) >> np.uint64(32)).astype(np.uint32)
+            starts = np.flatnonzero(np.r_[True, row[1:] != row[:-1]])
+            out[start + row[starts]] = np.minimum.reduceat(hashed, starts, axis=0)
+        return out
+
+    def _band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """(n, bands) uint64 bucket keys; the band number is mixed in so bands never collide."""
+        rows = signatures.reshape(len(signatures), self.bands, -1).astype(np.uint64)
+        keys = (rows * self._band_mul).sum(axis=2) + np.arange(1, self.bands + 1, dtype=np.uint64)
+        keys ^= keys >> np.uint64(29)
+        keys[keys == 0] = 1
+        return keys
+
+    # Open-addressing table
+
+    def _probe(self, keys: np.ndarray, claim: bool) -> np.ndarray:
+        """
+        Slot of each (unique) key, linear probing in lock step. Missing
+        keys claim an empty slot when `claim`, otherwise map to -1.
+        """
+        capacity = len(self._slot_keys)
+        slots = (keys % np.uint64(capacity)).astype(np.int64)
+        result = np.full(len(keys), -1, dtype=np.int64)
+        pending = np.arange(len(keys))
+        while len(pending):
+            stored = self._slot_keys[slots[pending]]
+            found = stored == keys[pending]
+            result[pending[found]] = slots[pending[found]]
+
+            empty = stored == 0
+            if claim and empty.any():
+                # One key wins each contested empty slot; the rest probe on
+                contenders = pending[empty]
+                _, first = np.unique(slots[contenders], return_index=True)
+                winners = contenders[first]
+                self._slot_keys[slots[winners]] = keys[winners]
+                result[winners] = slots[winners]
+                self._used += len(winners)
+
+            resolved = result[pending] >= 0 if claim else found | empty
+            pending = pending[~resolved]
+            slots[pending] = (slots[pending] + 1) % capacity
+        return result
+
+    def _grow(self, needed: int) -> None:
+        """Rehash into a larger table once the load factor would pass _MAX_LOAD."""
+        capacity = len(self._slot_keys)
+        if self._used + needed <= capacity * _MAX_LOAD:
+            return
+        while self._used + needed > capacity * _MAX_LOAD:
+            capacity *= 2
+        occupied = self._slot_keys != 0
+        keys, heads = self._slot_keys[occupied], self._slot_heads[occupied]
+        self._slot_keys = np.zeros(capacity, dtype=np.uint64)
+        self._slot_heads = np.full(capacity, -1, dtype=np.int64)
+        self._used = 0
+        self._slot_heads[self._probe(keys, claim=True)] = heads
+
+    # Public API
+
+    def add(self, ids: Sequence[str], records: Sequence[Dict]) -> int:
+        """Index catalog records under their ids; returns how many had text to index."""
+        signatures = self.signatures_for(records)
+        indexed = (signatures != _EMPTY_SIG).any(axis=1)
+        ids = [str(i) for i, keep in zip(ids, indexed) if keep]
+        signatures = signatures[indexed]
+        if not len(ids):
+            return 0
+
+        first = len(self.ids)
+        if not isinstance(self.ids, list):
+            self.ids = self.ids.tolist()
+        self.ids.extend(ids)
+        self.signatures = np.concatenate([self.signatures, signatures])
+        self._next = np.concatenate([self._next, np.full(len(ids) * self.bands, -1, dtype=np.int64)])
+
+        keys = self._band_keys(signatures).ravel()
+        entries = np.arange(first * self.bands, (first + len(ids)) * self.bands)
+        unique, inverse = np.unique(keys, return_inverse=True)
+        self._grow(len(unique))
+        slots = self._probe(unique, claim=True)
+
+        # Chain entries of one key in insertion order, oldest onto the previous head
+        order = np.lexsort((entries, inverse))
+        entries, inverse = entries[order], inverse[order]
+        group_start = np.r_[True, inverse[1:] != inverse[:-1]]
+        older = np.r_[-1, entries[:-1]]
+        older[group_start] = self._slot_heads[slots[inverse[group_start]]]
+        self._next[entries] = older
+        group_end = np.r_[group_start[1:], True]
+        self._slot_heads[slots[inverse[group_end]]] = entries[group_end]
+        return len(ids)
+
+    def query(
+        self, records: Sequence[Dict], threshold: float = DEFAULT_THRESHOLD
+    ) -> List[Optional[Tuple[str, float]]]:
+        """
+        Best catalog match per record as (catalog_id, estimated_jaccard),
+        or None when no indexed record reaches `threshold`.
+        """
+        results: List[Optional[Tuple[str, float]]] = [None] * len(records)
+        if not len(records) or not len(self.ids):
+            return results
+        signatures = self.signatures_for(records)
+        keys = self._band_keys(signatures)
+
+        unique, inverse = np.unique(keys.ravel(), return_inverse=True)
+        slots = self._probe(unique, claim=False)[inverse]
+        present = (slots >= 0) & np.repeat((signatures != _EMPTY_SIG).any(axis=1), self.bands)
+        query_rows = np.repeat(np.arange(len(records)), self.bands)[present]
+        cursor = self._slot_heads[slots[present]]
+
+        # Walk every bucket chain in lock step, max_bucket entries deep
+        hits_q, hits_c = [], []
+        for _ in range(self.max_bucket):
+            live = cursor >= 0
+            if not live.any():
+                break
+            query_rows, cursor = query_rows[live], cursor[live]
+            hits_q.append(query_rows)
+            hits_c.append(cursor // self.bands)
+            cursor = self._next[cursor]
+        if not hits_q:
+            return results
+
+        pairs = np.unique(np.stack([np.concatenate(hits_q), np.concatenate(hits_c)], axis=1), axis=0)
+        scores = (signatures[pairs[:, 0]] == self.signatures[pairs[:, 1]]).mean(axis=1)
+        keep = scores >= threshold
+        pairs, scores = pairs[keep], scores[keep]
+
+        # Highest score per query row
+        order = np.lexsort((-scores, pairs[:, 0]))
+        pairs, scores = pairs[order], scores[order]
+        best = np.r_[True, pairs[1:, 0] != pairs[:-1, 0]]
+        for row, match, score in zip(pairs[best, 0].tolist(), pairs[best, 1].tolist(), scores[best].tolist()):
+            results[row] = (str(self.ids[match]), round(score, 3))
+        return results
+
+    # Persistence
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        return {
+            "params": np.array([self.num_perm, self.bands, self.shingle_size, self.max_bucket, self._used]),
+            "field": np.array(self.field),
+            "ids": np.array(self.ids, dtype=str),
+            "signatures": self.signatures,
+            "next": self._next,
+            "slot_keys": self._slot_keys,
+            "slot_heads": self._slot_heads,
+        }
+
+    def save(self, path: str) -> None:
+        """
+        Write the index as a directory of .npy files, swapped in by rename.
+        Processes that mapped the previous files keep reading them.
+        """
+        tmp_path, old_path = f"{path}.tmp", f"{path}.old"
+        for stale in (tmp_path, old_path):
+            _remove(stale)
+        os.makedirs(tmp_path)
+        for name, array in self._arrays().items():
+            np.save(os.path.join(tmp_path, f"{name}.npy"), array)
+        if os.path.exists(path):
+            os.replace(path, old_path)
+        os.replace(tmp_path, path)
+        _remove(old_path)
+
+    @classmethod
+    def load(cls, path: str) -> "MinHashLSHIndex":
+        """
+        Read an index written by save(). Arrays are mapped copy-on-write
+        rather than read, so a loaded index costs no private memory until
+        add() writes to it. A single .npz file (the previous format) is
+        read into memory.
+        """
+        if os.path.isfile(path):
+            with np.load(path) as data:
+                return cls._from_arrays({name: data[name] for name in data.files})
+        return cls._from_arrays({
+            name[:-len(".npy")]: np.load(os.path.join(path, name), mmap_mode="c")
+            for name in os.listdir(path)
+            if name.endswith(".npy")
+        })
+
+    @classmethod
+    def _from_arrays(cls, data: Dict[str, np.ndarray]) -> "MinHashLSHIndex":
+        num_perm, bands, shingle_size, max_bucket, used = np.asarray(data["params"]).tolist()
+        index = cls(
+            num_perm=num_perm, bands=bands, field=str(data["field"]),
+            shingle_size=shingle_size, max_bucket=max_bucket,
+        )
+        index.ids = data["ids"]
+        index.signatures = data["signatures"]
+        index._next = data["next"]
+        index._slot_keys = data["slot_keys"]
+        index._slot_heads = data["slot_heads"]
+        index._used = used
+        return index
+
+
+def _remove(path: str) -> None:
+    """Delete a saved index, either format, if present."""
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+_catalog_index: Optional[MinHashLSHIndex] = None
+
+
+def get_catalog_index(path: Optional[str] = None) -> Optional[MinHashLSHIndex]:
+    """
+    The process-wide catalog name index, loaded once from
+    settings.dedupe_index_path; None if no index has been built.
+    """
+    global _catalog_index
+    path = path or settings.dedupe_index_path
+    if _catalog_index is None and os.path.exists(path):
+        _catalog_index = MinHashLSHIndex.load(path)
+    return _catalog_index
@@ -0,0 +1,126 @@
+"""
+Company name normalization engine.
+Legal suffixes are matched by one compiled alternation instead of a
+regex per suffix, stopwords by a frozenset lookup per word, text is
+case-folded and transliterated to ASCII for matching, and results are
+memoized in bounded LRU caches since scraped batches repeat the same
+names many times.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+# Distinct names remembered by each memoized function
+CACHE_SIZE = 65536
+
+# Letters NFKD does not decompose into ASCII plus combining marks
+_TRANSLITERATION = str.maketrans({
+    "ß": "ss", "æ": "ae", "œ": "oe", "ø": "o", "đ": "d", "ð": "d",
+    "þ": "th", "ł": "l", "ı": "i", "ħ": "h", "ŧ": "t",
+})
+
+# Legal suffix (undotted, lower case) -> (canonical form, entity type)
+LEGAL_SUFFIXES: Dict[str, Tuple[str, str]] = {
+    "inc": ("Inc.", "corporation"),
+    "llc": ("LLC", "llc"),
+    "corp": ("Corp.", "corporation"),
+    "corporation": ("Corp.", "other"),
+    "ltd": ("Ltd.", "limited"),
+    "co": ("Co.", "other"),
+    "company": ("Co.", "other"),
+    "limited": ("Ltd.", "other"),
+}
+
+STOPWORDS = frozenset({"the", "a", "an", "of", "for", "and", "group", "holdings"})
+
+
+def alternation(words: Iterable[str]) -> str:
+    """Regex alternation of literal words, longest first so prefixes never shadow them."""
+    return "|".join(re.escape(word) for word in sorted(set(words), key=lambda w: (-len(w), w)))
+
+
+SUFFIX_PATTERN = re.compile(rf"\b({alternation(LEGAL_SUFFIXES)})\.?$", re.IGNORECASE)
+_PARENTHETICAL = re.compile(r"\((.*?)\)")
+_PARENTHETICAL_STRIP = re.compile(r"\s*\(.*?\)")
+
+
+def fold(text: str) -> str:
+    """Case-folded text with accents removed and special letters transliterated."""
+    if text.isascii():
+        return text.lower()
+    text = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in text if not unicodedata.combining(char)).translate(_TRANSLITERATION)
+
+
+def split_legal_suffix(name: str) -> Tuple[str, Optional[str]]:
+    """(name without its trailing legal suffix, the suffix in lower case or None)."""
+    match = SUFFIX_PATTERN.search(name)
+    if not match:
+        return name, None
+    return name[:match.start()].rstrip(), match.group(1).lower()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_company_name(name: str) -> Tuple[str, str, float]:
+    """
+    Title-cased name with a canonical legal suffix.
+    Returns (normalized_name, entity_type, confidence).
+    """
+    name = name.strip()
+    original = name
+
+    # Title case, preserving short acronyms
+    name = " ".join(
+        word if len(word) <= 2 and word.isupper() else word.capitalize()
+        for word in name.split()
+    )
+
+    entity_type = "unknown"
+    match = SUFFIX_PATTERN.search(name)
+    if match:
+        canonical, entity_type = LEGAL_SUFFIXES[match.group(1).lower()]
+        name = name[:match.start()] + canonical
+
+    paren_match = _PARENTHETICAL.search(name)
+    if paren_match and paren_match.group(1).lower() in ("formerly", "formerly known as"):
+        name = _PARENTHETICAL_STRIP.sub("", name)
+
+    confidence = 0.5
+    if name != original:
+        confidence += 0.2
+    if entity_type != "unknown":
+        confidence += 0.2
+    if len(name) >= 3:
+        confidence += 0.1
+
+    return name.strip(), entity_type, min(1.0, confidence)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def name_match_key(name: str) -> str:
+    """
+    Folded name with its suffix canonicalized and stopwords removed, the
+    name part of EnhancedDeduplicator fingerprints.
+    """
+    normalized, _, _ = normalize_company_name(fold(name).strip())
+    return " ".join(word for word in fold(normalized).split() if word not in STOPWORDS)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def strip_legal_suffix(name: str) -> str:
+    """Folded name without a trailing legal suffix."""
+    return split_legal_suffix(fold(name).strip())[0]
+
+
+def cache_info() -> Dict[str, Tuple[int, int]]:
+    """(hits, misses) per memoized function."""
+    functions: Sequence = (normalize_company_name, name_match_key, strip_legal_suffix)
+    return {f.__name__: (f.cache_info().hits, f.cache_info().misses) for f in functions}
+
+
+def clear_caches() -> None:
+    """Forget memoized names (benchmarks, tests)."""
+    for function in (normalize_company_name, name_match_key, strip_legal_suffix):
+        function.cache_clear()
@@ -0,0 +1,298 @@
+"""
+Phone number normalization to E.164.
+Per-country calling codes, national number lengths and trunk prefixes
+live in one table that is compiled at import into dict lookups and
+length bitmasks. Single numbers go through a memoized parser; whole
+columns are normalized with vectorized pandas string operations over
+their distinct values. International numbers whose calling code is not
+in the table pass as plain E.164 (8-15 digits), flagged "unverified".
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# ISO country -> (calling code, national significant number lengths, trunk prefix)
+COUNTRY_RULES: Dict[str, Tuple[str, Tuple[int, ...], Optional[str]]] = {
+    "US": ("1", (10,), None),
+    "CA": ("1", (10,), None),
+    "GB": ("44", (9, 10), "0"),
+    "IE": ("353", (7, 8, 9), "0"),
+    "DE": ("49", tuple(range(6, 14)), "0"),
+    "FR": ("33", (9,), "0"),
+    "IT": ("39", tuple(range(6, 12)), None),  # Leading 0 is part of the number
+    "ES": ("34", (9,), None),
+    "PT": ("351", (9,), None),
+    "NL": ("31", (9,), "0"),
+    "BE": ("32", (8, 9), "0"),
+    "LU": ("352", tuple(range(4, 12)), None),
+    "CH": ("41", (9,), "0"),
+    "AT": ("43", tuple(range(4, 14)), "0"),
+    "DK": ("45", (8,), None),
+    "NO": ("47", (8,), None),
+    "SE": ("46", tuple(range(7, 11)), "0"),
+    "FI": ("358", tuple(range(5, 13)), "0"),
+    "PL": ("48", (9,), None),
+    "CZ": ("420", (9,), None),
+    "GR": ("30", (10,), None),
+    "TR": ("90", (10,), "0"),
+    "RU": ("7", (10,), "8"),
+    "IL": ("972", (8, 9), "0"),
+    "AE": ("971", (8, 9), "0"),
+    "ZA": ("27", (9,), "0"),
+    "IN": ("91", (10,), "0"),
+    "CN": ("86", (10, 11), "0"),
+    "HK": ("852", (8,), None),
+    "TW": ("886", (8, 9), "0"),
+    "JP": ("81", (9, 10), "0"),
+    "KR": ("82", tuple(range(8, 11)), "0"),
+    "SG": ("65", (8,), None),
+    "MY": ("60", tuple(range(8, 11)), "0"),
+    "TH": ("66", (8, 9), "0"),
+    "VN": ("84", (9, 10), "0"),
+    "PH": ("63", (8, 9, 10), "0"),
+    "ID": ("62", tuple(range(8, 13)), "0"),
+    "AU": ("61", (9,), "0"),
+    "NZ": ("64", tuple(range(8, 11)), "0"),
+    "MX": ("52", (10,), None),
+    "BR": ("55", (10, 11), "0"),
+    "AR": ("54", (10,), "0"),
+    "CL": ("56", (9,), None),
+    "CO": ("57", (10,), None),
+}
+
+# Region names used elsewhere in the codebase
+COUNTRY_ALIASES = {"UK": "GB"}
+_REGIONS = {**{country: country for country in COUNTRY_RULES}, **COUNTRY_ALIASES}
+
+# North American Numbering Plan countries: area code and exchange start with 2-9
+_NANP = frozenset(country for country, rule in COUNTRY_RULES.items() if rule[0] == "1")
+
+# E.164 allows at most 15 digits after the '+'
+MAX_E164_DIGITS = 15
+# Fewest digits accepted after the '+' for calling codes not in COUNTRY_RULES
+MIN_E164_DIGITS = 8
+
+# Calling code -> first listed country using it (calling codes are prefix-free)
+CALLING_CODES: Dict[str, str] = {}
+for _country, (_code, _, _) in COUNTRY_RULES.items():
+    CALLING_CODES.setdefault(_code, _country)
+
+# Allowed national lengths as one bitmask per country (bit n = length n)
+_LENGTH_MASKS = {country: sum(1 << n for n in lengths) for country, (_, lengths, _) in COUNTRY_RULES.items()}
+_TRUNKS = {country: trunk for country, (_, _, trunk) in COUNTRY_RULES.items() if trunk}
+
+# Per-country lookup arrays; index -1 (no country) reads the trailing blank entry
+_COUNTRY_INDEX = {country: i for i, country in enumerate(COUNTRY_RULES)}
+_COUNTRY_NAMES = np.array(list(COUNTRY_RULES) + [None], dtype=object)
+_MASKS = np.array([_LENGTH_MASKS[c] for c in COUNTRY_RULES] + [0], dtype=np.int64)
+_TRUNK_DIGITS = np.array([int(_TRUNKS.get(c, -1)) for c in COUNTRY_RULES] + [-1], dtype=np.int64)
+_IS_NANP = np.array([c in _NANP for c in COUNTRY_RULES] + [False])
+_CALLING_LENGTHS = np.array([len(rule[0]) for rule in COUNTRY_RULES.values()] + [0], dtype=np.int64)
+_CALLING_DIGITS = np.zeros((len(COUNTRY_RULES) + 1, 3), dtype=np.uint32)
+for _i, (_code, _, _) in enumerate(COUNTRY_RULES.values()):
+    _CALLING_DIGITS[_i, :len(_code)] = [ord(char) for char in _code]
+
+# Calling code value -> country index, one table per code length
+_CODE_TABLE = {size: np.full(10 ** size, -1, dtype=np.int64) for size in (1, 2, 3)}
+for _code, _country in CALLING_CODES.items():
+    _CODE_TABLE[len(_code)][int(_code)] = _COUNTRY_INDEX[_country]
+
+# Everything from the first letter or '#' on is an extension or vanity text;
+# one pass drops it along with every other non-digit
+_NON_NUMBER = re.compile(r"[A-Za-z#].*|[^0-9]", re.DOTALL)
+
+# Raw strings wider than this take the scalar path in normalize_phones
+_WIDTH = 32
+_E164_WIDTH = 1 + MAX_E164_DIGITS + 2
+# Distinct values per vectorized block, bounding the code-point matrices
+BLOCK_ROWS = 65536
+
+# Distinct raw strings remembered by parse_phone
+CACHE_SIZE = 131072
+
+
+@dataclass(slots=True)
+class PhoneNumber:
+    """
+    A parsed phone number; `e164` is set only when `valid`. Valid numbers
+    with an unlisted calling code have no country and reason "unverified".
+    """
+
+    e164: Optional[str]
+    country: Optional[str]
+    national: str
+    valid: bool
+    reason: str = ""  # unverified, too_short, too_long, unknown_country, invalid_length, invalid_area_code
+
+
+def _region(country: Optional[str]) -> Optional[str]:
+    return _REGIONS.get(country) or _REGIONS.get((country or "").upper())
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_phone(raw: str, default_country: Optional[str] = "US") -> PhoneNumber:
+    """
+    Parse a raw phone string. Numbers written with '+', '00' or (in
+    North America) '011' are international; others are read as national
+    numbers of `default_country`.
+    """
+    digits = _NON_NUMBER.sub("", raw)
+    region = _region(default_country)
+
+    # A leading '+' always precedes the extension, so the raw string can be checked
+    international = raw.lstrip().startswith("+")
+    if not international and digits.startswith("011") and region in _NANP:
+        digits, international = digits[3:], True
+    elif not international and digits.startswith("00"):
+        digits, international = digits[2:], True
+
+    if len(digits) < 4:
+        return PhoneNumber(None, None, digits, False, "too_short")
+    if len(digits) > MAX_E164_DIGITS + 1:
+        return PhoneNumber(None, None, digits, False, "too_long")
+
+    if international:
+        for size in (1, 2, 3):
+            country = CALLING_CODES.get(digits[:size])
+            if country:
+                national = digits[size:]
+                break
+        else:
+            if MIN_E164_DIGITS <= len(digits) <= MAX_E164_DIGITS:
+                return PhoneNumber(f"+{digits}", None, digits, True, "unverified")
+            return PhoneNumber(None, None, digits, False, "unknown_country")
+    elif region is None:
+        return PhoneNumber(None, None, digits, False, "unknown_country")
+    else:
+        country, national = region, digits
+        if country in _NANP and len(national) == 11 and national.startswith("1"):
+            national = national[1:]
+
+    # Trunk prefix: always dialled nationally, sometimes kept as "+44 (0)20 ..."
+    mask = _LENGTH_MASKS[country]
+    trunk = _TRUNKS.get(country)
+    if trunk and national.startswith(trunk):
+        if not international or not (mask >> len(national)) & 1:
+            national = national[len(trunk):]
+
+    if not national:
+        return PhoneNumber(None, country, national, False, "too_short")
+    if not (mask >> len(national)) & 1:
+        return PhoneNumber(None, country, national, False, "invalid_length")
+    if country in _NANP and (national[0] in "01" or national[3] in "01"):
+        return PhoneNumber(None, country, national, False, "invalid_area_code")
+    return PhoneNumber(f"+{COUNTRY_RULES[country][0]}{national}", country, national, True)
+
+
+def _phone_block(values: list, region: Optional[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """parse_phone over short strings as code-point matrices: (e164, country index, valid)."""
+    rows = np.arange(len(values))
+    chars = np.array(values, dtype=f"U{_WIDTH}").view(np.uint32).reshape(len(values), _WIDTH)
+    columns = np.arange(_WIDTH)
+
+    # Extensions and vanity letters end the number; '+' must lead it
+    lower = chars | 32
+    stop = ((lower >= 97) & (lower <= 122)) | (chars == ord("#"))
+    cut = np.where(stop.any(axis=1), stop.argmax(axis=1), _WIDTH)
+    visible = (chars > 32) & (columns < cut[:, None])
+    international = visible.any(axis=1) & (chars[rows, visible.argmax(axis=1)] == ord("+"))
+
+    # Digits packed to the left of each row
+    digit = (chars >= 48) & (chars <= 57) & (columns < cut[:, None])
+    packed = np.zeros((len(values), _WIDTH), dtype=np.int64)
+    position = np.cumsum(digit, axis=1) - 1
+    packed[np.nonzero(digit)[0], position[digit]] = chars[digit] - 48
+    count = digit.sum(axis=1)
+
+    def at(offset: np.ndarray) -> np.ndarray:
+        return packed[rows, np.minimum(offset, _WIDTH - 1)]
+
+    start = np.zeros(len(values), dtype=np.int64)
+    for prefix in ((0, 1, 1), (0, 0)) if region in _NANP else ((0, 0),):
+        dialled = ~international & (count >= len(prefix))
+        for i, value in enumerate(prefix):
+            dialled &= packed[:, i] == value
+        start[dialled] = len(prefix)
+        international |= dialled
+    dialled_length = count - start
+
+    # Calling code of international numbers, trying 1-3 digit prefixes
+    country = np.full(len(values), _COUNTRY_INDEX.get(region, -1), dtype=np.int64)
+    national = start.copy()
+    found = np.zeros(len(values), dtype=bool)
+    code = np.zeros(len(values), dtype=np.int64)
+    for size in (1, 2, 3):
+        code = code * 10 + at(start + size - 1)
+        match = np.where(start + size <= count, _CODE_TABLE[size][code], -1)
+        hit = international & ~found & (match >= 0)
+        country[hit] = match[hit]
+        national[hit] = start[hit] + size
+        found |= hit
+    country[international & ~found] = -1
+    # Unlisted calling codes pass as plain E.164: no country rules, no code to prepend
+    unverified = international & ~found & (dialled_length >= MIN_E164_DIGITS) & (dialled_length <= MAX_E164_DIGITS)
+
+    if region in _NANP:
+        national += ~international & (count == 11) & (packed[:, 0] == 1)
+    length = count - national
+    masks = _MASKS[country]
+    trunk = _TRUNK_DIGITS[country]
+    length_ok = ((masks >> np.minimum(length, 62)) & 1) == 1
+    strip = (trunk >= 0) & (length > 0) & (at(national) == trunk) & (~international | ~length_ok)
+    national += strip
+    length -= strip
+
+    valid = (country >= 0) & (((masks >> np.minimum(length, 62)) & 1) == 1)
+    valid &= (dialled_length >= 4) & (dialled_length <= MAX_E164_DIGITS + 1)
+    valid &= ~_IS_NANP[country] | ((at(national) >= 2) & (at(national + 3) >= 2))
+    valid |= unverified
+
+    # '+', calling code and national number as one code-point row per number
+    calling = _CALLING_DIGITS[country]
+    calling_length = _CALLING_LENGTHS[country]
+    out = np.zeros((len(values), _E164_WIDTH), dtype=np.uint32)
+    out[:, 0] = ord("+")
+    for j in range(_E164_WIDTH - 1):
+        k = j - calling_length
+        from_code = calling[:, min(j, 2)]
+        from_national = np.where((k >= 0) & (k < length), at(national + k) + 48, 0)
+        out[:, j + 1] = np.where(j < calling_length, from_code, from_national)
+    e164 = out.view(f"U{_E164_WIDTH}").ravel().astype(object)
+    e164[~valid] = None
+    return e164, np.where(valid, country, -1), valid
+
+
+def normalize_phones(phones: pd.Series, default_country: Optional[str] = "US") -> pd.DataFrame:
+    """
+    Vectorized parse_phone for a column. Returns a frame with `e164`
+    (None unless valid), `country` (None unless valid and listed) and
+    `valid`, aligned with the input.
+    Each distinct raw value is parsed once, in blocks of BLOCK_ROWS.
+    """
+    codes, uniques = pd.factorize(phones, use_na_sentinel=True)
+    values = [value if type(value) is str else str(value) for value in np.asarray(uniques, dtype=object).tolist()]
+    region = _region(default_country)
+    e164 = np.empty(len(values) + 1, dtype=object)  # Last slot answers NA rows (code -1)
+    country = np.full(len(values) + 1, -1, dtype=np.int64)
+    valid = np.zeros(len(values) + 1, dtype=bool)
+
+    long_rows = np.flatnonzero(np.fromiter(map(len, values), dtype=np.int64, count=len(values)) > _WIDTH)
+    for i in long_rows:
+        values[i] = ""
+    for begin in range(0, len(values), BLOCK_ROWS):
+        block = slice(begin, min(begin + BLOCK_ROWS, len(values)))
+        e164[block], country[block], valid[block] = _phone_block(values[block], region)
+    for i in long_rows:  # Rare enough for the scalar parser
+        parsed = parse_phone(str(uniques[i]), default_country)
+        e164[i], valid[i] = parsed.e164, parsed.valid
+        country[i] = _COUNTRY_INDEX.get(parsed.country, -1) if parsed.valid else -1
+
+    return pd.DataFrame(
+        {"e164": e164[codes], "country": _COUNTRY_NAMES[country[codes]], "valid": valid[codes]},
+        index=phones.index,
+    )
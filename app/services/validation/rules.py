@@ -0,0 +1,296 @@
+"""
+Declarative validation rules.
+Every field check used by DataValidator, EnhancedBaseScraper,
+DataQualityMetrics and DataCleaner is registered here once, with a
+scalar and a whole-column implementation. Rule sets are compiled once
+into per-field pipelines that run row-wise (records) or column-wise
+(DataFrames) and count, per rule, the values checked, the values
+rejected and the cumulative time spent.
+"""
+
+import math
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Union
+
+import pandas as pd
+
+from app.core.config import settings
+from app.models.schemas import EMAIL_PATTERN
+from app.services.columnar import STRING_DTYPE
+from app.services.validation.phones import normalize_phones, parse_phone
+
+URL_PATTERN = r"^https?://[\w\-\.]+(\.[\w\-\.]+)+(/[^\s]*)?$"
+
+_EMAIL = re.compile(EMAIL_PATTERN)
+_URL = re.compile(URL_PATTERN)
+_NON_PHONE = re.compile(r"[^\d+]")
+_SCHEMES = ("http://", "https://")
+
+# Score given to values that are missing or not numbers
+DEFAULT_SCORE = 0.5
+
+
+class RuleError(ValueError):
+    """A rule set is malformed."""
+
+
+@dataclass
+class Rule:
+    """
+    One step of a field pipeline. `scalar` maps a value to its normalized
+    form or None when it fails; `column` does the same for a Series, NA
+    marking failures.
+    """
+
+    name: str
+    scalar: Callable[[Any], Any]
+    column: Callable[[pd.Series], pd.Series]
+
+
+@dataclass
+class RuleStats:
+    """Per-rule counters: non-null values checked, values rejected, seconds spent."""
+
+    calls: int = 0
+    hits: int = 0
+    seconds: float = 0.0
+
+
+# ============ RULES ============
+
+def _strip_value(value: Any) -> Optional[str]:
+    return None if value is None else (str(value).strip() or None)
+
+
+def _strip_column(values: pd.Series) -> pd.Series:
+    values = values.astype(STRING_DTYPE).str.strip()
+    return values.mask(values == "")
+
+
+def _matching(name: str, pattern: "re.Pattern") -> Rule:
+    return Rule(
+        name,
+        lambda value: value if value is not None and pattern.fullmatch(value) else None,
+        lambda values: values.where(values.str.fullmatch(pattern).fillna(False).astype(bool)),
+    )
+
+
+def _phone_digits_value(value: Optional[str]) -> Optional[str]:
+    return None if value is None else (_NON_PHONE.sub("", value) or None)
+
+
+def _phone_digits_column(values: pd.Series) -> pd.Series:
+    values = values.str.replace(_NON_PHONE, "", regex=True)
+    return values.mask(values == "")
+
+
+def _phone_e164_value(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    parsed = parse_phone(value, settings.phone_default_country)
+    return parsed.e164 if parsed.valid else value
+
+
+def _phone_e164_column(values: pd.Series) -> pd.Series:
+    parsed = normalize_phones(values, settings.phone_default_country)
+    return values.mask(parsed["valid"], parsed["e164"].astype(STRING_DTYPE))
+
+
+def _score_value(value: Any) -> float:
+    try:
+        score = float(value)
+    except (TypeError, ValueError):
+        return DEFAULT_SCORE
+    return DEFAULT_SCORE if math.isnan(score) else max(0.0, min(1.0, score))
+
+
+def _score_column(values: pd.Series) -> pd.Series:
+    if isinstance(values.dtype, pd.StringDtype) or values.dtype == object:
+        values = values.astype(object)
+    return pd.to_numeric(values, errors="coerce").astype("float64").clip(0.0, 1.0).fillna(DEFAULT_SCORE)
+
+
+def _length(args: List[Optional[int]]) -> Rule:
+    low, high = args
+    high = high if high is not None else math.inf
+
+    def column(values: pd.Series) -> pd.Series:
+        lengths = values.str.len()
+        return values.where(((lengths >= low) & (lengths <= high)).fillna(False).astype(bool))
+
+    return Rule(
+        f"length({low}, {args[1]})",
+        lambda value: value if value is not None and low <= len(value) <= high else None,
+        column,
+    )
+
+
+_SIMPLE_RULES: Dict[str, Rule] = {
+    "strip": Rule("strip", _strip_value, _strip_column),
+    "lower": Rule("lower", lambda value: value.lower() if value is not None else None, lambda values: values.str.lower()),
+    "email": _matching("email", _EMAIL),
+    "url": _matching("url", _URL),
+    "url_scheme": Rule(
+        "url_scheme",
+        lambda value: value if value is None or value.startswith(_SCHEMES) else "https://" + value,
+        lambda values: values.where(values.str.startswith(_SCHEMES[0]) | values.str.startswith(_SCHEMES[1]), "https://" + values),
+    ),
+    "phone_digits": Rule("phone_digits", _phone_digits_value, _phone_digits_column),
+    "phone_e164": Rule("phone_e164", _phone_e164_value, _phone_e164_column),
+    "score": Rule("score", _score_value, _score_column),
+}
+
+_RULES: Dict[str, Callable[[Any], Rule]] = {
+    "length": _length,
+}
+
+
+def _compile_rule(spec: Union[str, Dict[str, Any]]) -> Rule:
+    if isinstance(spec, str):
+        if spec not in _SIMPLE_RULES:
+            raise RuleError(f"Unknown rule: {spec}")
+        return _SIMPLE_RULES[spec]
+    if not isinstance(spec, dict) or len(spec) != 1:
+        raise RuleError(f"Rule must be a name or a single-key mapping: {spec!r}")
+    (name, args), = spec.items()
+    if name not in _RULES:
+        raise RuleError(f"Unknown rule: {name}")
+    try:
+        return _RULES[name](args)
+    except (TypeError, ValueError) as e:
+        raise RuleError(f"Bad arguments for {name}: {e}") from e
+
+
+# ============ RULE SETS ============
+
+class RuleSet:
+    """
+    Compiled per-field pipelines. Rules run in order and a field stops
+    at the first rule that rejects it. `stats` accumulates per
+    "field.rule" across calls (unsynchronized, so approximate when
+    threads share a rule set).
+    """
+
+    def __init__(self, name: str, pipelines: Dict[str, List[Rule]]):
+        self.name = name
+        self.pipelines = {
+            field: [(rule, RuleStats()) for rule in rules] for field, rules in pipelines.items()
+        }
+
+    @property
+    def stats(self) -> Dict[str, RuleStats]:
+        return {
+            f"{field}.{rule.name}": stats
+            for field, steps in self.pipelines.items()
+            for rule, stats in steps
+        }
+
+    def validate_value(self, field: str, value: Any) -> Any:
+        """Normalized value for one field, None if a rule rejects it."""
+        for rule, stats in self.pipelines[field]:
+            start = time.perf_counter()
+            result = rule.scalar(value)
+            stats.seconds += time.perf_counter() - start
+            if value is not None:
+                stats.calls += 1
+                if result is None:
+                    stats.hits += 1
+            value = result
+            if value is None:
+                return None
+        return value
+
+    def validate_record(self, record: Mapping, fields: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
+        """
+        Row-wise: normalized value per record key. `fields` maps record
+        keys to pipelines (default: every pipeline, by its own name).
+        """
+        fields = fields or {field: field for field in self.pipelines}
+        return {key: self.validate_value(field, record.get(key)) for key, field in fields.items()}
+
+    def validate_frame(self, df: pd.DataFrame, fields: Optional[Mapping[str, str]] = None) -> pd.DataFrame:
+        """Column-wise validate_record: one whole-column operation per rule, NA for rejected cells."""
+        fields = fields or {field: field for field in self.pipelines}
+        out = {}
+        for key, field in fields.items():
+            values = df[key] if key in df.columns else pd.Series(pd.NA, index=df.index, dtype=STRING_DTYPE)
+            for rule, stats in self.pipelines[field]:
+                present = values.notna()
+                start = time.perf_counter()
+                values = rule.column(values)
+                stats.seconds += time.perf_counter() - start
+                stats.calls += int(present.sum())
+                stats.hits += int((present & values.isna()).sum())
+            out[key] = values
+        return pd.DataFrame(out, index=df.index)
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Per-rule counters, most expensive first."""
+        rows = [
+            {
+                "rule": key,
+                "calls": stats.calls,
+                "hits": stats.hits,
+                "hit_rate": stats.hits / stats.calls if stats.calls else 0.0,
+                "seconds": stats.seconds,
+                "us_per_call": 1e6 * stats.seconds / stats.calls if stats.calls else 0.0,
+            }
+            for key, stats in self.stats.items()
+        ]
+        return sorted(rows, key=lambda row: row["seconds"], reverse=True)
+
+    def reset_stats(self) -> None:
+        for steps in self.pipelines.values():
+            for _, stats in steps:
+                stats.calls, stats.hits, stats.seconds = 0, 0, 0.0
+
+
+def compile_rules(spec: Dict[str, List[Union[str, Dict[str, Any]]]], name: str = "rules") -> RuleSet:
+    """
+    Compile field -> rule list mappings:
+
+        {"email": ["strip", "lower", "email"],
+         "name": ["strip", {"length": [2, 255]}]}
+    """
+    if not spec:
+        raise RuleError(f"Rule set {name} has no fields")
+    return RuleSet(name, {field: [_compile_rule(rule) for rule in rules] for field, rules in spec.items()})
+
+
+# Shared rule sets: "suppliers" validates (rejecting bad values), "cleaning" only normalizes
+RULE_SETS: Dict[str, Dict[str, List[Union[str, Dict[str, Any]]]]] = {
+    "suppliers": {
+        "name": ["strip", {"length": [2, None]}],
+        "email": ["strip", "lower", "email"],
+        "phone": ["strip", "phone_digits", {"length": [7, 15]}],
+        "url": ["strip", "url_scheme", "url"],
+        "score": ["score"],
+    },
+    "cleaning": {
+        "email": ["strip", "lower"],
+        "phone": ["strip", "phone_e164", "phone_digits"],
+        "url": ["strip", "url_scheme"],
+    },
+}
+
+# Supplier record keys -> "suppliers" pipelines
+SUPPLIER_FIELDS = {
+    "name": "name",
+    "email": "email",
+    "phone": "phone",
+    "linkedin": "url",
+    "verification_score": "score",
+}
+
+_rule_sets: Dict[str, RuleSet] = {}
+
+
+def get_rule_set(name: str) -> RuleSet:
+    """Process-wide compiled rule set from RULE_SETS, so counters span all callers."""
+    if name not in _rule_sets:
+        if name not in RULE_SETS:
+            raise RuleError(f"Unknown rule set: {name}")
+        _rule_sets[name] = compile_rules(RULE_SETS[name], name)
+    return _rule_sets[name]
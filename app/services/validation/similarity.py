@@ -0,0 +1,195 @@
+"""
+String similarity kernels for fuzzy matching.
+Levenshtein distance uses Myers' bit-parallel algorithm in Hyyrö's
+formulation: one column of the edit-distance matrix is held as bit
+vectors of vertical +1/-1 deltas, so each character of the text costs a
+handful of integer operations instead of a row of the matrix. Patterns
+up to 64 characters fit one machine word, which the batched NumPy API
+relies on; the scalar functions take any length through Python ints.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Longest pattern the batched API handles as one uint64 word
+WORD_BITS = 64
+
+# Prefix length and scale of the Winkler bonus
+_WINKLER_PREFIX = 4
+_WINKLER_SCALE = 0.1
+
+
+@lru_cache(maxsize=4096)
+def _peq(pattern: str) -> Dict[str, int]:
+    """Bit mask of the positions of each character in the pattern."""
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def bag_distance(a: str, b: str) -> int:
+    """
+    Characters one string has that the other lacks, counted with
+    multiplicity; a cheap lower bound on the Levenshtein distance.
+    """
+    surplus_a = sum(max(0, a.count(char) - b.count(char)) for char in set(a))
+    # Surpluses differ by exactly the length difference
+    return max(surplus_a, surplus_a - len(a) + len(b))
+
+
+def bounded_levenshtein(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """
+    Levenshtein distance between a and b. With `max_distance`, stops as
+    soon as the distance is known to exceed it and returns max_distance + 1:
+    first on the length difference and bag distance, then while scanning.
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    m, n = len(a), len(b)
+    if max_distance is not None and (n - m > max_distance or bag_distance(a, b) > max_distance):
+        return max_distance + 1
+    if m == 0:
+        return n
+
+    peq = _peq(a)
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv, score = mask, 0, m
+    for j, char in enumerate(b, 1):
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        # The bottom cell moves by at most one per remaining column
+        if max_distance is not None and score - (n - j) > max_distance:
+            return max_distance + 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+    return score
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Levenshtein distance between a and b."""
+    return bounded_levenshtein(a, b)
+
+
+def levenshtein_similarity(a: str, b: str, min_similarity: float = 0.0) -> float:
+    """
+    1 - distance / longer length. Pairs that cannot reach
+    `min_similarity` score 0.0 without computing the full distance.
+    """
+    longest = max(len(a), len(b))
+    if longest == 0:
+        return 1.0
+    budget = int((1.0 - min_similarity) * longest + 1e-9)
+    distance = bounded_levenshtein(a, b, budget)
+    return 0.0 if distance > budget else 1.0 - distance / longest
+
+
+def jaro_winkler(a: str, b: str) -> float:
+    """Jaro-Winkler similarity, favouring strings with a common prefix."""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+
+    window = max(len(a), len(b)) // 2 - 1
+    matched_b = [False] * len(b)
+    a_matches: List[str] = []
+    for i, char in enumerate(a):
+        for j in range(max(0, i - window), min(len(b), i + window + 1)):
+            if not matched_b[j] and b[j] == char:
+                matched_b[j] = True
+                a_matches.append(char)
+                break
+    if not a_matches:
+        return 0.0
+
+    b_matches = [char for char, hit in zip(b, matched_b) if hit]
+    transpositions = sum(x != y for x, y in zip(a_matches, b_matches)) // 2
+    matches = len(a_matches)
+    jaro = (matches / len(a) + matches / len(b) + (matches - transpositions) / matches) / 3
+
+    prefix = 0
+    for x, y in zip(a[:_WINKLER_PREFIX], b[:_WINKLER_PREFIX]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * _WINKLER_SCALE * (1.0 - jaro)
+
+
+def token_set_ratio(a: str, b: str) -> float:
+    """
+    Similarity of the word sets, insensitive to word order and repeated
+    words: the shared words are compared with each side's full sorted
+    words and the best Levenshtein similarity wins.
+    """
+    tokens_a, tokens_b = set(a.split()), set(b.split())
+    if not tokens_a or not tokens_b:
+        return 0.0
+    common = " ".join(sorted(tokens_a & tokens_b))
+    left = " ".join(filter(None, [common, " ".join(sorted(tokens_a - tokens_b))]))
+    right = " ".join(filter(None, [common, " ".join(sorted(tokens_b - tokens_a))]))
+    scores = [levenshtein_similarity(left, right)]
+    if common:
+        scores += [levenshtein_similarity(common, left), levenshtein_similarity(common, right)]
+    return max(scores)
+
+
+def levenshtein_many(query: str, candidates: Sequence[str]) -> np.ndarray:
+    """
+    Distances from one query to many candidates, int64 array. For queries
+    up to WORD_BITS characters all candidates advance one character per
+    step as a uint64 vector; longer queries fall back to the scalar kernel.
+    """
+    m = len(query)
+    if m == 0 or m > WORD_BITS or not candidates:
+        return np.array([bounded_levenshtein(query, c) for c in candidates], dtype=np.int64)
+
+    # Candidate characters as indexes into the query's alphabet (0 = absent)
+    alphabet = {char: code for code, char in enumerate(dict.fromkeys(query), 1)}
+    lengths = np.fromiter((len(c) for c in candidates), dtype=np.int64, count=len(candidates))
+    codes = np.zeros((len(candidates), max(int(lengths.max()), 1)), dtype=np.int64)
+    for row, candidate in enumerate(candidates):
+        codes[row, :len(candidate)] = [alphabet.get(char, 0) for char in candidate]
+
+    peq = np.zeros(len(alphabet) + 1, dtype=np.uint64)
+    for char, bits in _peq(query).items():
+        peq[alphabet[char]] = bits
+
+    one = np.uint64(1)
+    mask = np.uint64((1 << m) - 1)
+    high = np.uint64(1 << (m - 1))
+    pv = np.full(len(candidates), mask, dtype=np.uint64)
+    mv = np.zeros(len(candidates), dtype=np.uint64)
+    score = np.full(len(candidates), m, dtype=np.int64)
+    for j in range(codes.shape[1]):
+        live = lengths > j
+        eq = peq[codes[:, j]]
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        score += np.where(live, (ph & high).astype(bool).astype(np.int64) - (mh & high).astype(bool).astype(np.int64), 0)
+        ph = ((ph << one) | one) & mask
+        mh = (mh << one) & mask
+        pv = np.where(live, mh | (~(xv | ph) & mask), pv)
+        mv = np.where(live, ph & xv, mv)
+    return score
+
+
+def similarity_many(query: str, candidates: Sequence[str]) -> np.ndarray:
+    """1 - distance / longer length for one query against many candidates."""
+    distances = levenshtein_many(query, candidates)
+    longest = np.maximum(len(query), np.fromiter((len(c) for c in candidates), dtype=np.int64, count=len(candidates)))
+    return np.where(longest > 0, 1.0 - distances / np.maximum(longest, 1), 1.0)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Fuzzy Deduplication Benchmark for TensorMarketData.
+Compares the all-pairs find_duplicates scan with blocked candidate
+generation on synthetic suppliers with injected near-duplicates.
+Usage: python scripts/bench_dedupe.py [--rows 1000000] [--baseline-rows 1000] [--max-block-size 50]
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.validation.enhanced_cleaner import EnhancedDeduplicator
+
+WORDS = [
+    "acme", "global", "pacific", "northern", "summit", "precision", "united", "apex",
+    "delta", "harbor", "pioneer", "vertex", "atlas", "metro", "crown", "eagle",
+    "silver", "granite", "nova", "orion", "titan", "cedar", "falcon", "liberty",
+]
+INDUSTRIES = ["Industries", "Supply", "Logistics", "Components", "Tools", "Plastics", "Metals", "Foods"]
+SUFFIXES = ["Inc", "Inc.", "LLC", "Corp", "Ltd", "Co.", ""]
+FREE_MAIL = ["gmail.com", "yahoo.com", "outlook.com"]
+
+
+def _typo(name: str, rng: random.Random) -> str:
+    """One random character deletion, substitution or transposition."""
+    i = rng.randrange(1, len(name) - 1)
+    edit = rng.randrange(3)
+    if edit == 0:
+        return name[:i] + name[i + 1:]
+    if edit == 1:
+        return name[:i] + rng.choice(string.ascii_lowercase) + name[i + 1:]
+    return name[:i - 1] + name[i] + name[i - 1] + name[i + 1:]
+
+
+def make_suppliers(rows: int, dup_ratio: float, seed: int = 42) -> Tuple[List[Dict], List[Tuple[int, int]]]:
+    """Suppliers plus the (original, duplicate) index pairs that were injected."""
+    rng = random.Random(seed)
+    records: List[Dict] = []
+    injected: List[Tuple[int, int]] = []
+    for i in range(rows):
+        if records and rng.random() < dup_ratio:
+            source = rng.randrange(len(records))
+            original = records[source]
+            injected.append((source, i))
+            records.append({
+                "name": _typo(original["name"], rng),
+                "email": original["email"] if rng.random() < 0.5 else "",
+                "phone": original["phone"] if rng.random() < 0.5 else "",
+            })
+            continue
+
+        name = f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()} {i:x} {rng.choice(INDUSTRIES)}"
+        slug = name.lower().replace(" ", "")
+        domain = rng.choice(FREE_MAIL) if rng.random() < 0.2 else f"{slug}.com"
+        records.append({
+            "name": f"{name} {rng.choice(SUFFIXES)}".strip(),
+            "email": f"sales{i}@{domain}",
+            "phone": f"+1 555 {rng.randrange(10**7):07d}",
+        })
+    return records, injected
+
+
+def all_pairs_find_duplicates(dedup: EnhancedDeduplicator, records: List[Dict], threshold: float = 0.85):
+    """Previous path: every record scored against the first record of every group."""
+    groups: Dict[str, List[Dict]] = {}
+    for record in records:
+        fp = dedup.generate_fingerprint(record)
+        if fp not in groups:
+            for group_fp, group_records in groups.items():
+                if dedup.calculate_similarity(record.get("name", ""), group_records[0].get("name", "")) >= threshold:
+                    fp = group_fp
+                    break
+        groups.setdefault(fp, []).append(record)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def recall(groups: List[List[Dict]], records: List[Dict], injected: List[Tuple[int, int]]) -> float:
+    """Share of injected duplicates that landed in their original's group."""
+    group_of = {id(record): g for g, group in enumerate(groups) for record in group}
+    found = sum(
+        1 for a, b in injected
+        if id(records[a]) in group_of and group_of.get(id(records[a])) == group_of.get(id(records[b]))
+    )
+    return found / len(injected) if injected else 1.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark fuzzy deduplication")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Suppliers in the synthetic batch")
+    parser.add_argument("--baseline-rows", type=int, default=1_000,
+                        help="Rows timed on the all-pairs path (extrapolated quadratically to --rows)")
+    parser.add_argument("--dup-ratio", type=float, default=0.1, help="Share of rows that are near-duplicates")
+    parser.add_argument("--window", type=int, default=5, help="Sorted-neighbourhood window")
+    parser.add_argument("--max-block-size", type=int, default=50, help="Largest block whose pairs are scored")
+    args = parser.parse_args()
+
+    print(f"📝 Generating {args.rows:,} suppliers ({args.dup_ratio:.0%} near-duplicates)...")
+    records, injected = make_suppliers(args.rows, args.dup_ratio)
+    dedup = EnhancedDeduplicator(window=args.window, max_block_size=args.max_block_size)
+
+    baseline_rows = min(args.baseline_rows, args.rows)
+    sample = records[:baseline_rows]
+    print(f"🐢 All-pairs path on {baseline_rows:,} rows...")
+    start = time.perf_counter()
+    all_pairs_find_duplicates(dedup, sample)
+    slow_seconds = time.perf_counter() - start
+    slow_total = slow_seconds * (args.rows / baseline_rows) ** 2
+
+    print(f"⚡ Blocked path on {args.rows:,} rows...")
+    start = time.perf_counter()
+    dedup.candidates.candidate_pairs(records)
+    blocking_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    groups = dedup.find_duplicates(records)
+    fast_seconds = time.perf_counter() - start
+    stats = dedup.candidates.stats
+
+    print(f"\n📊 Results ({args.rows:,} rows):")
+    print(f"  All-pairs: {slow_total:10.1f} s" + (" (extrapolated)" if baseline_rows < args.rows else ""))
+    print(f"  Blocked:   {fast_seconds:10.1f} s ({args.rows / fast_seconds:,.0f} records/s, "
+          f"{blocking_seconds:.1f} s generating candidates)")
+    print(f"  Speedup:   {slow_total / fast_seconds:10.1f}x")
+    print(f"  Candidate pairs: {stats['pairs']:,} "
+          f"(sorted neighbourhood {stats['sorted_neighbourhood']:,}, n-gram {stats['ngram']:,}, "
+          f"email domain {stats['email_domain']:,}, phone {stats['phone']:,}; "
+          f"{stats['oversized_blocks']:,} oversized blocks skipped)")
+    print(f"  Duplicate groups: {len(groups):,}  Recall of injected duplicates: {recall(groups, records, injected):.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Fingerprint Store Benchmark for TensorMarketData.
+Times inserts and lookups in the persistent FingerprintStore, one at a
+time and batched, pre-sized and grown from a small table, and compares the store's mapped file
+with the Python heap an in-memory dict of the same entries needs.
+Usage: python scripts/bench_fingerprints.py [--fingerprints 2000000] [--path /tmp/bench_fingerprints.bin]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.validation.fingerprints import FingerprintStore, fingerprint_digest
+
+# Fingerprints per add_many / get_many call (one lock round trip each)
+BATCH = 10_000
+
+
+def timed(label: str, count: int, function) -> float:
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    print(f"  {label:<30} {seconds:7.2f}s {count / seconds:12,.0f} ops/s")
+    return seconds
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the persistent fingerprint store")
+    parser.add_argument("--fingerprints", type=int, default=2_000_000, help="Fingerprints inserted")
+    parser.add_argument("--path", default="/tmp/bench_fingerprints.bin", help="Scratch store file")
+    args = parser.parse_args()
+
+    count = args.fingerprints
+    keys = [f"{i:016x}" for i in range(count)]
+    supplier = uuid.uuid4()
+    print(f"📝 {count:,} fingerprints\n")
+
+    print("📊 FingerprintStore:")
+    for label, capacity in (("insert, pre-sized", int(count / 0.6)), ("insert, growing from 64k", 65536)):
+        if os.path.exists(args.path):
+            os.remove(args.path)
+        with FingerprintStore(args.path, capacity=capacity) as store:
+            timed(label, count, lambda: [store.setdefault(key, supplier) for key in keys])
+    os.remove(args.path)
+    with FingerprintStore(args.path, capacity=int(count / 0.6)) as store:
+        timed("insert, batches of 10k", count, lambda: [
+            store.add_many((key, supplier) for key in keys[i:i + BATCH]) for i in range(0, count, BATCH)
+        ])
+
+    with FingerprintStore(args.path) as store:
+        timed("lookup, present", count, lambda: [store.get(key) for key in keys])
+        timed("lookup, absent", count, lambda: [store.get(key + "x") for key in keys])
+        timed("lookup, batches of 10k", count, lambda: [store.get_many(keys[i:i + BATCH]) for i in range(0, count, BATCH)])
+        size = os.path.getsize(args.path)
+        print(f"\n💾 Store file {size / 2**20:,.0f} MiB for {len(store):,} fingerprints "
+              f"({store.capacity:,} slots), paged in by the OS on demand")
+    os.remove(args.path)
+
+    tracemalloc.start()
+    table = {fingerprint_digest(key): uuid.UUID(int=i) for i, key in enumerate(keys)}
+    heap = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"🧠 dict of digest -> UUID: {heap / 2**20:,.0f} MiB of Python heap for {len(table):,} entries, "
+          f"rebuilt every run")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Ingestion Validation Benchmark for TensorMarketData.
+Compares the per-row iterrows + Pydantic path with the columnar validator
+on a synthetic suppliers CSV.
+Usage: python scripts/bench_ingestion.py [--rows 1000000] [--baseline-rows 20000]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.ingestion import IngestionService
+
+
+def write_suppliers_csv(path: Path, rows: int, invalid_ratio: float, seed: int = 42) -> None:
+    """Write a suppliers CSV with a share of deliberately broken rows."""
+    rng = random.Random(seed)
+    names, emails, phones, linkedins, scores = [], [], [], [], []
+    for i in range(rows):
+        broken = rng.random() < invalid_ratio
+        names.append("" if broken and i % 3 == 0 else f"Supplier {i} Industries")
+        emails.append(f"not-an-email-{i}" if broken and i % 3 == 1 else f"sales{i}@supplier{i % 997}.com")
+        phones.append(f"+1 (555) {i % 1000:03d}-{i % 10000:04d}")
+        linkedins.append(f"https://linkedin.com/company/supplier-{i}" if i % 4 else "")
+        scores.append("n/a" if broken and i % 3 == 2 else f"{rng.random() * 1.2:.3f}")
+
+    pd.DataFrame({
+        "name": names,
+        "email": emails,
+        "phone": phones,
+        "linkedin": linkedins,
+        "verification_score": scores,
+    }).to_csv(path, index=False)
+
+
+def baseline(path: Path, rows: int) -> tuple[float, int]:
+    """Previous path: read_csv + iterrows + Pydantic per row."""
+    service = IngestionService()
+    start = time.perf_counter()
+    df = pd.read_csv(path, nrows=rows)
+    valid = 0
+    for _, row in df.iterrows():
+        if service.validate_supplier(row.to_dict()):
+            valid += 1
+    return time.perf_counter() - start, valid
+
+
+def columnar(path: Path) -> tuple[float, dict]:
+    """Current path: process_csv with columnar validation."""
+    service = IngestionService()
+    start = time.perf_counter()
+    stats = asyncio.run(service.process_csv(str(path), {}))
+    return time.perf_counter() - start, stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark CSV validation")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows in the synthetic file")
+    parser.add_argument("--baseline-rows", type=int, default=20_000,
+                        help="Rows timed on the per-row path (extrapolated to --rows)")
+    parser.add_argument("--invalid-ratio", type=float, default=0.05)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "suppliers.csv"
+        print(f"📝 Writing {args.rows:,} supplier rows...")
+        write_suppliers_csv(path, args.rows, args.invalid_ratio)
+
+        baseline_rows = min(args.baseline_rows, args.rows)
+        print(f"🐢 Per-row path on {baseline_rows:,} rows...")
+        slow_seconds, _ = baseline(path, baseline_rows)
+        slow_total = slow_seconds * args.rows / baseline_rows
+
+        print(f"⚡ Columnar path on {args.rows:,} rows...")
+        fast_seconds, stats = columnar(path)
+
+    print(f"\n📊 Results ({args.rows:,} rows):")
+    print(f"  Per-row:  {slow_total:8.2f} s" + (" (extrapolated)" if baseline_rows < args.rows else ""))
+    print(f"  Columnar: {fast_seconds:8.2f} s ({args.rows / fast_seconds:,.0f} rows/s)")
+    print(f"  Speedup:  {slow_total / fast_seconds:8.1f}x")
+    print(f"  Valid: {stats['valid']:,}  Invalid: {stats['invalid']:,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
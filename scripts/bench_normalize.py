@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Company Name Normalization Benchmark for TensorMarketData.
+Compares the per-suffix regex loop previously used by
+CompanyNameNormalizer.normalize and EnhancedDeduplicator.generate_fingerprint
+with the compiled, memoized engine in app.services.validation.normalize.
+Usage: python scripts/bench_normalize.py [--names 500000] [--unique-ratio 0.2]
+"""
+
+import argparse
+import hashlib
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.validation import normalize
+from app.services.validation.enhanced_cleaner import EnhancedDeduplicator
+from bench_dedupe import make_suppliers
+
+OLD_SUFFIXES = [
+    ("inc", "Inc."), ("inc.", "Inc."), ("llc", "LLC"), ("llc.", "LLC"), ("corp", "Corp."),
+    ("corp.", "Corp."), ("corporation", "Corp."), ("ltd", "Ltd."), ("ltd.", "Ltd."),
+    ("co", "Co."), ("co.", "Co."), ("company", "Co."), ("limited", "Ltd."),
+]
+OLD_ENTITY_TYPES = {"inc": "corporation", "llc": "llc", "corp": "corporation", "ltd": "limited"}
+
+
+def old_normalize(name: str):
+    """Previous CompanyNameNormalizer.normalize: one regex per suffix per call."""
+    name = str(name).strip()
+    original = name
+    name = " ".join(w if len(w) <= 2 and w.isupper() else w.capitalize() for w in name.split())
+    entity_type = "unknown"
+    for old_suffix, new_suffix in OLD_SUFFIXES:
+        pattern = r"\b" + re.escape(old_suffix) + r"\.?$"
+        if re.search(pattern, name, re.IGNORECASE):
+            name = re.sub(pattern, new_suffix, name, flags=re.IGNORECASE)
+            entity_type = OLD_ENTITY_TYPES.get(old_suffix, "other")
+            break
+    paren_match = re.search(r"\((.*?)\)", name)
+    if paren_match and paren_match.group(1).lower() in ["formerly", "formerly known as"]:
+        name = re.sub(r"\s*\(.*?\)", "", name)
+    confidence = 0.5 + 0.2 * (name != original) + 0.2 * (entity_type != "unknown") + 0.1 * (len(name) >= 3)
+    return name.strip(), entity_type, min(1.0, confidence)
+
+
+def old_fingerprint(data: dict) -> str:
+    """Previous EnhancedDeduplicator.generate_fingerprint."""
+    normalized_name, _, _ = old_normalize(data.get("name", "").lower().strip())
+    stop_words = {"the", "a", "an", "of", "for", "and", "group", "holdings"}
+    words = [w for w in normalized_name.lower().split() if w not in stop_words]
+    email = data.get("email") or data.get("contact_json", {}).get("email", "")
+    domain = email.split("@")[-1] if "@" in email else ""
+    return hashlib.md5(f"{' '.join(words)}:{domain}".encode()).hexdigest()[:16]
+
+
+def make_names(count: int, unique_ratio: float, seed: int = 11) -> List[dict]:
+    """Records drawn with repetition from a pool of distinct suppliers, as scrapes are."""
+    rng = random.Random(seed)
+    pool = make_suppliers(max(1, int(count * unique_ratio)), 0.0, seed)[0]
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def rate(label: str, items: list, function: Callable, baseline: float = 0.0) -> float:
+    start = time.perf_counter()
+    for item in items:
+        function(item)
+    seconds = time.perf_counter() - start
+    speedup = f"  {baseline / seconds:6.1f}x" if baseline else ""
+    print(f"  {label:<30} {len(items) / seconds:12,.0f} names/s{speedup}")
+    return seconds
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark company name normalization")
+    parser.add_argument("--names", type=int, default=500_000, help="Names normalized per run")
+    parser.add_argument("--unique-ratio", type=float, default=0.2, help="Share of distinct names in the batch")
+    args = parser.parse_args()
+
+    records = make_names(args.names, args.unique_ratio)
+    names = [record["name"] for record in records]
+    dedup = EnhancedDeduplicator()
+    print(f"📝 {len(names):,} names, {len(set(names)):,} distinct\n")
+
+    print("📊 CompanyNameNormalizer.normalize:")
+    baseline = rate("per-suffix regex (previous)", names, old_normalize)
+    normalize.clear_caches()
+    rate("compiled, all distinct", list(dict.fromkeys(names)), dedup.name_normalizer.normalize, baseline * len(set(names)) / len(names))
+    normalize.clear_caches()
+    rate("compiled + LRU memo", names, dedup.name_normalizer.normalize, baseline)
+
+    print("\n📊 EnhancedDeduplicator.generate_fingerprint:")
+    baseline = rate("per-suffix regex (previous)", records, old_fingerprint)
+    normalize.clear_caches()
+    rate("compiled + LRU memo", records, dedup.generate_fingerprint, baseline)
+
+    print("\n🧠 Cache (hits, misses): " + ", ".join(f"{k} {v}" for k, v in normalize.cache_info().items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Phone Normalization Benchmark for TensorMarketData.
+Compares the regex-per-call EnhancedPhoneValidator previously used for
+every record with the scalar parse_phone and the vectorized
+normalize_phones column path in app.services.validation.phones, then
+EnhancedPhoneValidator one record at a time against validate_many.
+parse_phone checks per-country lengths, trunk prefixes and area codes,
+so on distinct numbers it is slower than the bare regex it replaced;
+batches are meant to go through the column path.
+Usage: python scripts/bench_phones.py [--phones 1000000] [--unique-ratio 1.0]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.validation.enhanced_cleaner import EnhancedPhoneValidator
+from app.services.validation.phones import normalize_phones, parse_phone
+
+OLD_PATTERNS = {"US": r"^\+?1?\d{10,14}$", "UK": r"^\+?44\d{10,13}$", "EU": r"^\+?\d{10,15}$"}
+
+
+def old_validate(phone: str, country: str = "US"):
+    """Previous EnhancedPhoneValidator.validate: digits and '+' plus a regional regex."""
+    cleaned = re.sub(r"[^\d\+]", "", str(phone).strip())
+    if len(cleaned) < 7 or len(cleaned) > 15:
+        return None
+    if not cleaned.startswith("+"):
+        cleaned = ("+1" if country == "US" and len(cleaned) == 10 else "+") + cleaned
+    return cleaned if re.match(OLD_PATTERNS.get(country, OLD_PATTERNS["EU"]), cleaned) else None
+
+
+def make_phones(count: int, unique_ratio: float, seed: int = 5) -> List[str]:
+    """Phones in the formats scraped listings use, drawn with repetition from a pool."""
+    rng = random.Random(seed)
+
+    def one() -> str:
+        area, exchange, line = rng.randint(200, 999), rng.randint(200, 999), rng.randint(0, 9999)
+        style = rng.random()
+        if style < 0.30:
+            return f"({area}) {exchange}-{line:04d}"
+        if style < 0.45:
+            return f"+1 {area} {exchange} {line:04d}"
+        if style < 0.55:
+            return f"{area}.{exchange}.{line:04d} x{rng.randint(1, 999)}"
+        if style < 0.70:
+            return f"+44 (0)20 {exchange}{line:04d}"[:20]
+        if style < 0.80:
+            return f"0049 30 {exchange}{line:04d}"
+        if style < 0.90:
+            return f"+33 1 {exchange // 10} {line:04d} {rng.randint(10, 99)}"
+        return f"{area}-{exchange}-{line:04d}"
+
+    pool = [one() for _ in range(max(1, int(count * unique_ratio)))]
+    return pool if len(pool) == count else [rng.choice(pool) for _ in range(count)]
+
+
+def timed(label: str, count: int, function, baseline: float = 0.0) -> float:
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    speedup = f"  {baseline / seconds:6.1f}x {'faster' if seconds < baseline else 'slower'}" if baseline else ""
+    print(f"  {label:<28} {seconds:7.2f}s {count / seconds:12,.0f} phones/s{speedup}")
+    return seconds
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark phone normalization")
+    parser.add_argument("--phones", type=int, default=1_000_000, help="Phones normalized per run")
+    parser.add_argument("--unique-ratio", type=float, default=1.0, help="Share of distinct phones in the batch")
+    parser.add_argument("--country", default="US", help="Region for phones without a country code")
+    args = parser.parse_args()
+
+    phones = make_phones(args.phones, args.unique_ratio)
+    column = pd.Series(phones)
+    print(f"📝 {len(phones):,} phones, {column.nunique():,} distinct\n")
+
+    print("📊 Normalization (vs the previous regex):")
+    baseline = timed("regex per call (previous)", len(phones), lambda: [old_validate(p, args.country) for p in phones])
+    parse_phone.cache_clear()
+    timed("parse_phone (scalar)", len(phones), lambda: [parse_phone(p, args.country) for p in phones], baseline)
+    timed("normalize_phones (column)", len(phones), lambda: normalize_phones(column, args.country), baseline)
+
+    print("\n📊 Record validation (vs one record at a time):")
+    validator = EnhancedPhoneValidator()
+    parse_phone.cache_clear()
+    per_record = timed(
+        "validate per record", len(phones), lambda: [validator.validate(p, args.country) for p in phones]
+    )
+    timed("validate_many (batch)", len(phones), lambda: validator.validate_many(phones, args.country), per_record)
+
+    parsed = normalize_phones(column, args.country)
+    print(f"\n✅ {parsed['valid'].mean():.1%} valid E.164, by country: "
+          + ", ".join(f"{k} {v:,}" for k, v in parsed["country"].value_counts().items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
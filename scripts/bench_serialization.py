@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Serialization Benchmark for TensorMarketData.
+Compares the Pydantic response_model path with the pre-serialized fast path.
+Usage: python scripts/bench_serialization.py [--suppliers 10] [--products 200]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.api.v1.serializers import json_response, supplier_projection, product_projection
+from app.models.schemas import SearchResponse, SearchResult, SupplierResponse, ProductResponse
+
+
+def make_rows(n_suppliers: int, n_products: int) -> list[tuple[dict, list[dict]]]:
+    """Build fake Supabase rows."""
+    now = datetime.utcnow().isoformat()
+    rows = []
+    for i in range(n_suppliers):
+        supplier = {
+            "id": str(uuid4()),
+            "name": f"Supplier {i}",
+            "industry_vector": None,
+            "contact_json": {"email": f"sales{i}@example.com", "phone": "+15550100", "linkedin": None},
+            "verification_score": 0.8,
+            "last_verified_at": now,
+            "created_at": now,
+            "updated_at": now,
+        }
+        products = [
+            {
+                "id": str(uuid4()),
+                "supplier_id": supplier["id"],
+                "sku_data": {"sku": f"SKU-{i}-{j}", "name": f"Part {j}", "category": "parts"},
+                "price_range": {"min": 1.5, "max": 9.99, "currency": "USD"},
+                "created_at": now,
+                "updated_at": now,
+            }
+            for j in range(n_products)
+        ]
+        rows.append((supplier, products))
+    return rows
+
+
+async def pydantic_path(rows, field) -> bytes:
+    """Current path: build models, re-validate against response_model, encode."""
+    results = [
+        SearchResult(
+            supplier=SupplierResponse(
+                id=s["id"],
+                name=s["name"],
+                industry_vector=s.get("industry_vector"),
+                contact=s.get("contact_json", {}),
+                verification_score=s.get("verification_score", 0.0),
+                last_verified_at=s.get("last_verified_at"),
+                created_at=s["created_at"],
+                updated_at=s["updated_at"],
+            ),
+            score=0.9,
+            products=[
+                ProductResponse(
+                    id=p["id"],
+                    supplier_id=p["supplier_id"],
+                    sku=p["sku_data"],
+                    price_range=p["price_range"],
+                    created_at=p["created_at"],
+                    updated_at=p["updated_at"],
+                )
+                for p in products
+            ],
+        )
+        for s, products in rows
+    ]
+    response = SearchResponse(
+        query="bench",
+        total_results=len(results),
+        results=results,
+        credits_used=1,
+        credits_remaining=99,
+    )
+    content = await serialize_response(field=field, response_content=response)
+    return JSONResponse(content).body
+
+
+def fast_path(rows) -> bytes:
+    """Fast path: project trusted rows and encode directly."""
+    results = [
+        {
+            "supplier": supplier_projection(s),
+            "score": 0.9,
+            "products": [product_projection(p) for p in products],
+        }
+        for s, products in rows
+    ]
+    return json_response({
+        "query": "bench",
+        "total_results": len(results),
+        "results": results,
+        "credits_used": 1,
+        "credits_remaining": 99,
+    }).body
+
+
+def main():
+    import asyncio
+
+    parser = argparse.ArgumentParser(description="Benchmark search response serialization")
+    parser.add_argument("--suppliers", type=int, default=10)
+    parser.add_argument("--products", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = make_rows(args.suppliers, args.products)
+    field = create_response_field(name="bench_response", type_=SearchResponse)
+
+    loop = asyncio.new_event_loop()
+
+    start = time.perf_counter()
+    for _ in range(args.iterations):
+        slow_body = loop.run_until_complete(pydantic_path(rows, field))
+    slow = (time.perf_counter() - start) / args.iterations
+
+    start = time.perf_counter()
+    for _ in range(args.iterations):
+        fast_body = fast_path(rows)
+    fast = (time.perf_counter() - start) / args.iterations
+
+    loop.close()
+
+    print(f"📊 {args.suppliers} suppliers x {args.products} products")
+    print(f"  Pydantic path: {slow * 1000:8.2f} ms/response ({len(slow_body)} bytes)")
+    print(f"  Fast path:     {fast * 1000:8.2f} ms/response ({len(fast_body)} bytes)")
+    print(f"  Speedup:       {slow / fast:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
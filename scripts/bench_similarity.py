@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Name Similarity Benchmark for TensorMarketData.
+Compares the list-of-lists Levenshtein matrix previously used by
+EnhancedDeduplicator.calculate_similarity with the bit-parallel kernels in
+app.services.validation.similarity on synthetic supplier name pairs.
+Usage: python scripts/bench_similarity.py [--pairs 20000] [--candidates 200] [--threshold 0.85]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.validation.similarity import (
+    jaro_winkler,
+    levenshtein_similarity,
+    similarity_many,
+    token_set_ratio,
+)
+from bench_dedupe import _typo, make_suppliers
+
+
+def matrix_similarity(name1: str, name2: str) -> float:
+    """Previous implementation: full (len1+1) x (len2+1) matrix per pair."""
+    len1, len2 = len(name1), len(name2)
+    matrix = [[0] * (len2 + 1) for _ in range(len1 + 1)]
+    for i in range(len1 + 1):
+        matrix[i][0] = i
+    for j in range(len2 + 1):
+        matrix[0][j] = j
+    for i in range(1, len1 + 1):
+        for j in range(1, len2 + 1):
+            cost = 0 if name1[i - 1] == name2[j - 1] else 1
+            matrix[i][j] = min(matrix[i - 1][j] + 1, matrix[i][j - 1] + 1, matrix[i - 1][j - 1] + cost)
+    return 1.0 - matrix[len1][len2] / max(len1, len2)
+
+
+def make_pairs(count: int, seed: int = 7) -> List[Tuple[str, str]]:
+    """Half near-duplicate pairs (one typo), half unrelated names."""
+    rng = random.Random(seed)
+    names = [r["name"].lower() for r in make_suppliers(count, 0.0, seed)[0]]
+    pairs = []
+    for i, name in enumerate(names):
+        other = _typo(name, rng) if i % 2 else rng.choice(names)
+        pairs.append((name, other))
+    return pairs
+
+
+def time_pairs(label: str, pairs: List[Tuple[str, str]], score: Callable[[str, str], float], baseline: float = 0.0) -> float:
+    start = time.perf_counter()
+    for a, b in pairs:
+        score(a, b)
+    seconds = time.perf_counter() - start
+    speedup = f"  {baseline / seconds:6.1f}x" if baseline else ""
+    print(f"  {label:<34} {len(pairs) / seconds:12,.0f} pairs/s{speedup}")
+    return seconds
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark name similarity kernels")
+    parser.add_argument("--pairs", type=int, default=20000, help="Name pairs scored per kernel")
+    parser.add_argument("--candidates", type=int, default=200, help="Candidates per query for the batched API")
+    parser.add_argument("--threshold", type=float, default=0.85, help="Similarity threshold for the bounded kernel")
+    args = parser.parse_args()
+
+    pairs = make_pairs(args.pairs)
+    mismatches = sum(
+        1 for a, b in pairs[:2000] if abs(matrix_similarity(a, b) - levenshtein_similarity(a, b)) > 1e-9
+    )
+    print(f"📝 {len(pairs):,} name pairs (checked 2,000 against the matrix: {mismatches} mismatches)\n")
+
+    print("📊 Pairwise:")
+    baseline = time_pairs("matrix Levenshtein (previous)", pairs, matrix_similarity)
+    time_pairs("bit-parallel Levenshtein", pairs, levenshtein_similarity, baseline)
+    time_pairs(f"bounded Levenshtein (>= {args.threshold})", pairs,
+               lambda a, b: levenshtein_similarity(a, b, args.threshold), baseline)
+    time_pairs("Jaro-Winkler", pairs, jaro_winkler, baseline)
+    time_pairs("token set ratio", pairs, token_set_ratio, baseline)
+
+    print(f"\n📊 One query against {args.candidates} candidates:")
+    queries = [a for a, _ in pairs[: max(1, len(pairs) // args.candidates)]]
+    candidates = [b for _, b in pairs[: args.candidates]]
+    start = time.perf_counter()
+    for query in queries:
+        [matrix_similarity(query, candidate) for candidate in candidates]
+    slow = time.perf_counter() - start
+    start = time.perf_counter()
+    for query in queries:
+        similarity_many(query, candidates)
+    fast = time.perf_counter() - start
+    scored = len(queries) * len(candidates)
+    print(f"  {'matrix Levenshtein (previous)':<34} {scored / slow:12,.0f} pairs/s")
+    print(f"  {'similarity_many (NumPy)':<34} {scored / fast:12,.0f} pairs/s  {slow / fast:6.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Batch Validation Scaling Benchmark for TensorMarketData.
+Times the validation stage of EnhancedValidationPipeline.process_batch
+inline and across 1..N pool workers, and how often the event loop got to
+run while a batch was in flight.
+Usage: python scripts/bench_validation.py [--rows 200000] [--max-workers 8]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.core.config import settings
+from app.services.validation import enhanced_cleaner
+from app.services.validation.enhanced_cleaner import EnhancedValidationPipeline
+from bench_dedupe import make_suppliers
+
+# Event-loop heartbeat interval while a batch is validating
+TICK_SECONDS = 0.01
+
+
+async def timed_validation(pipeline: EnhancedValidationPipeline, records: list) -> tuple:
+    """(seconds, share of expected heartbeats the loop managed) for one batch."""
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(TICK_SECONDS)
+            ticks += 1
+
+    beat = asyncio.create_task(heartbeat())
+    start = time.perf_counter()
+    await pipeline._validate_all(records)
+    seconds = time.perf_counter() - start
+    beat.cancel()
+    return seconds, min(1.0, ticks * TICK_SECONDS / seconds)
+
+
+async def run(args) -> None:
+    records = make_suppliers(args.rows, 0.1)[0]
+    pipeline = EnhancedValidationPipeline()
+    print(f"📝 {len(records):,} records, {os.cpu_count()} CPUs\n")
+
+    settings.validation_inline_max = len(records)
+    inline, responsive = await timed_validation(pipeline, records)
+    print(f"  {'inline':<12} {len(records) / inline:10,.0f} records/s  loop ran {responsive:4.0%} of the time")
+
+    settings.validation_inline_max = 0
+    for workers in range(1, args.max_workers + 1):
+        settings.validation_workers = workers
+        enhanced_cleaner._validation_pool = None
+        await pipeline._validate_all(records[:workers * settings.validation_chunk_rows])  # Start the workers
+        seconds, responsive = await timed_validation(pipeline, records)
+        enhanced_cleaner._validation_executor().shutdown()
+        print(f"  {workers:>2} workers   {len(records) / seconds:10,.0f} records/s  "
+              f"{inline / seconds:5.1f}x inline  loop ran {responsive:4.0%} of the time")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark parallel batch validation")
+    parser.add_argument("--rows", type=int, default=200_000, help="Records per batch")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="Largest pool size tried")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Catalog Near-Duplicate Index Builder for TensorMarketData.
+Adds stored suppliers to the MinHash-LSH index that
+EnhancedValidationPipeline.process_batch checks new records against.
+Suppliers already in the index are skipped, so re-runs only add new rows.
+Usage: python scripts/build_dedupe_index.py [--index .supplier_lsh] [--batch-rows 50000] [--rebuild]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.core.config import settings
+from app.services.validation.lsh import MinHashLSHIndex
+
+# Keyset pagination over supplier ids, compared as uuid so the primary key index serves it
+_PAGE = text("SELECT id::text AS id, name FROM suppliers WHERE id > CAST(:after AS uuid) ORDER BY id LIMIT :limit")
+# Sorts below every generated (uuid4) supplier id
+_FIRST = "00000000-0000-0000-0000-000000000000"
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the catalog near-duplicate index")
+    parser.add_argument("--index", type=str, default=settings.dedupe_index_path, help="Index directory (.npy files)")
+    parser.add_argument("--batch-rows", type=int, default=50000, help="Suppliers fetched and indexed per batch")
+    parser.add_argument("--rebuild", action="store_true", help="Start a new index instead of extending the existing one")
+    parser.add_argument(
+        "--database-url",
+        type=str,
+        default=settings.database_url,
+        help="Database connection URL",
+    )
+    args = parser.parse_args()
+
+    if os.path.exists(args.index) and not args.rebuild:
+        index = MinHashLSHIndex.load(args.index)
+        print(f"📂 Extending {args.index} ({len(index):,} suppliers indexed)")
+    else:
+        index = MinHashLSHIndex()
+        print(f"🆕 Building {args.index}")
+    known = set(index.ids)
+
+    engine = create_async_engine(args.database_url, echo=False)
+    start = time.perf_counter()
+    scanned = added = 0
+    after = _FIRST
+    try:
+        async with engine.connect() as conn:
+            while True:
+                rows = (await conn.execute(_PAGE, {"after": after, "limit": args.batch_rows})).mappings().all()
+                if not rows:
+                    break
+                after = rows[-1]["id"]
+                scanned += len(rows)
+                new = [dict(row) for row in rows if row["id"] not in known]
+                added += index.add([row["id"] for row in new], new)
+                print(f"  {scanned:,} scanned, {added:,} added")
+    finally:
+        await engine.dispose()
+
+    index.save(args.index)
+    seconds = time.perf_counter() - start
+    print(f"\n✅ {len(index):,} suppliers indexed ({added:,} new) in {seconds:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Fingerprint Store Builder for TensorMarketData.
+Adds stored suppliers to the persistent fingerprint store that
+Deduplicator (process_data) and EnhancedDeduplicator
+(EnhancedValidationPipeline.process_batch) check new records against.
+Both deduplicators' fingerprints are stored; existing entries are kept,
+so re-runs only add new suppliers.
+Usage: python scripts/build_fingerprint_store.py [--store .supplier_fingerprints.bin] [--batch-rows 50000] [--rebuild]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.core.config import settings
+from app.services.validation.cleaner import Deduplicator
+from app.services.validation.enhanced_cleaner import EnhancedDeduplicator
+from app.services.validation.fingerprints import FingerprintStore
+
+# Keyset pagination over supplier ids, compared as uuid so the primary key index serves it
+_PAGE = text(
+    "SELECT id::text AS id, name, contact_json FROM suppliers "
+    "WHERE id > CAST(:after AS uuid) ORDER BY id LIMIT :limit"
+)
+# Sorts below every generated (uuid4) supplier id
+_FIRST = "00000000-0000-0000-0000-000000000000"
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the persistent deduplication fingerprint store")
+    parser.add_argument("--store", type=str, default=settings.dedupe_fingerprint_path, help="Store file")
+    parser.add_argument("--capacity", type=int, default=settings.dedupe_fingerprint_capacity, help="Slots in a new store")
+    parser.add_argument("--batch-rows", type=int, default=50000, help="Suppliers fetched per batch")
+    parser.add_argument("--rebuild", action="store_true", help="Start a new store instead of extending the existing one")
+    parser.add_argument(
+        "--database-url",
+        type=str,
+        default=settings.database_url,
+        help="Database connection URL",
+    )
+    args = parser.parse_args()
+
+    if os.path.exists(args.store) and args.rebuild:
+        os.remove(args.store)
+    store = FingerprintStore(args.store, capacity=args.capacity)
+    print(f"📂 {args.store}: {len(store):,} fingerprints, {store.capacity:,} slots")
+    fingerprinters = [Deduplicator(store), EnhancedDeduplicator(store=store)]
+
+    engine = create_async_engine(args.database_url, echo=False)
+    start = time.perf_counter()
+    scanned = 0
+    before = len(store)
+    after = _FIRST
+    try:
+        async with engine.connect() as conn:
+            while True:
+                rows = (await conn.execute(_PAGE, {"after": after, "limit": args.batch_rows})).mappings().all()
+                if not rows:
+                    break
+                after = rows[-1]["id"]
+                scanned += len(rows)
+                records = [
+                    {
+                        "id": row["id"],
+                        "name": row["name"],
+                        "contact_json": json.loads(row["contact_json"]) if isinstance(row["contact_json"], str)
+                        else row["contact_json"] or {},
+                    }
+                    for row in rows
+                ]
+                for deduplicator in fingerprinters:
+                    deduplicator.remember(records)
+                print(f"  {scanned:,} scanned, {len(store) - before:,} fingerprints added")
+    finally:
+        await engine.dispose()
+        store.close()
+
+    seconds = time.perf_counter() - start
+    print(f"\n✅ {scanned:,} suppliers, {len(store) - before:,} new fingerprints in {seconds:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
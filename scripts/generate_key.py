@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Generate API Key Script for TensorMarketData.
-Usage: python scripts/generate_key.py [--credits 100] [--expires-days 30]
+Usage: python scripts/generate_key.py create [--credits 100] [--expires-days 30] [--scopes provider]
 """
 
 import argparse
@@ -43,9 +43,11 @@ async def create_api_key(
     engine,
     credits: int = 100,
     expires_days: int | None = None,
+    scopes: str = "",
 ) -> dict:
     """
-    Create a new API key in the database.
+    Create a new API key in the database, with comma-separated `scopes`
+    (e.g. "provider" to allow POST /v1/ingest).
     """
     async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
@@ -57,8 +59,8 @@ async def create_api_key(
     async with async_session() as session:
         await session.execute(
             text("""
-                INSERT INTO api_keys (id, key_hash, key_prefix, credits_remaining, is_active, expires_at)
-                VALUES (:id, :hash, :prefix, :credits, 1, :expires)
+                INSERT INTO api_keys (id, key_hash, key_prefix, credits_remaining, is_active, expires_at, scopes)
+                VALUES (:id, :hash, :prefix, :credits, 1, :expires, :scopes)
             """),
             {
                 "id": str(uuid4()),
@@ -66,6 +68,7 @@ async def create_api_key(
                 "prefix": key_prefix,
                 "credits": credits,
                 "expires": expires_at,
+                "scopes": scopes,
             },
         )
         await session.commit()
@@ -75,6 +78,7 @@ async def create_api_key(
         "key_prefix": key_prefix,
         "credits": credits,
         "expires_at": expires_at.isoformat() if expires_at else None,
+        "scopes": scopes,
     }
 
 
@@ -140,6 +144,7 @@ async def main():
     create_parser = subparsers.add_parser("create", help="Create a new API key")
     create_parser.add_argument("--credits", type=int, default=100, help="Initial credits")
     create_parser.add_argument("--expires-days", type=int, default=None, help="Days until expiration")
+    create_parser.add_argument("--scopes", type=str, default="", help="Comma-separated scopes, e.g. provider or admin")
 
     # Revoke command
     revoke_parser = subparsers.add_parser("revoke", help="Revoke an API key")
@@ -169,6 +174,7 @@ async def main():
                 engine,
                 credits=args.credits,
                 expires_days=args.expires_days,
+                scopes=args.scopes,
             )
             print("\n🔑 NEW API KEY CREATED")
             print("=" * 50)
@@ -176,6 +182,7 @@ async def main():
             print(f"Prefix:   {key_info['key_prefix']}")
             print(f"Credits:  {key_info['credits']}")
             print(f"Expires:  {key_info['expires_at'] or 'Never'}")
+            print(f"Scopes:   {key_info['scopes'] or 'none'}")
             print("=" * 50)
             print("⚠️  Store this key securely - it won't be shown again!")
 
@@ -183,6 +190,7 @@ async def main():
             success = await revoke_api_key(engine, args.prefix)
             if success:
                 print(f"✅ Key with prefix '{args.prefix}' has been revoked")
+                print(f"   Running API workers drop it within {settings.api_key_cache_ttl:g}s (api_key_cache_ttl)")
             else:
                 print(f"❌ No active key found with prefix '{args.prefix}'")
 
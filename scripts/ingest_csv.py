@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 """
 CSV Ingestion Script for TensorMarketData.
-Usage: python scripts/ingest_csv.py --file path/to/data.csv
+Usage: python scripts/ingest_csv.py --suppliers suppliers.csv [--products products.csv] [--chunk-rows 50000] [--resume]
+       python scripts/ingest_csv.py --suppliers feed.parquet [--spill-dir clean/] [--reject-dir rejects/]
+       python scripts/ingest_csv.py --products vendor.csv --profile vendor.yaml
+       python scripts/ingest_csv.py --status
+       python scripts/ingest_csv.py --input drops/2024-01/ "vendor_*.csv" [--workers 8] [--writers 2]
 """
 
 import argparse
@@ -9,10 +13,11 @@ import asyncio
 import csv
 import hashlib
 import sys
+import time
 from pathlib import Path
+from typing import Optional
 from uuid import uuid4
 
-import pandas as pd
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
@@ -22,8 +27,13 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from app.core.config import settings
-from app.models.domain import Supplier, Product
 from app.models.schemas import ContactData, PriceRange, SKUData
+from app.services.bulk_loader import BulkLoader
+from app.services.columnar import read_columns
+from app.services.ingest_jobs import JobStore, file_fingerprint
+from app.services.ingestion import IngestionService, detect_kind
+from app.services.orchestrator import IngestOrchestrator
+from app.services.profiles import ProfilePlan, load_profile
 
 
 async def generate_key(prefix: str = "tmd") -> tuple[str, str, str]:
@@ -35,123 +45,201 @@ async def generate_key(prefix: str = "tmd") -> tuple[str, str, str]:
     return raw_key, key_hash, key_prefix
 
 
-async def ingest_suppliers(
+def _report(kind: str, stats: dict, loader: BulkLoader, seconds: float) -> None:
+    """Print load counters and throughput."""
+    print(f"\n✅ {kind}: {int(loader.stats['inserted'])} inserted, "
+          f"{int(loader.stats['unchanged'])} unchanged, "
+          f"{int(loader.stats['existing'])} already present, "
+          f"{stats['invalid']} invalid, {stats['duplicates']} duplicate rows")
+    if loader.stats["unknown_supplier"]:
+        print(f"  ⚠️  Skipped {int(loader.stats['unknown_supplier'])} rows for unknown suppliers")
+    _report_errors(stats["errors"])
+    print(f"  ⏱️  {stats['processed'] / seconds:,.0f} rows/s overall, "
+          f"{loader.rows_per_second:,.0f} rows/s into the database")
+    if "timings" in stats:
+        print("  ⏱️  " + ", ".join(f"{stage} {secs:.2f}s" for stage, secs in stats["timings"].items()))
+
+
+def _check_kind(kind: str, file_path: str, profile: Optional[ProfilePlan] = None) -> None:
+    """Refuse a file whose columns (or profile) describe another kind than `kind`."""
+    if profile is not None:
+        detected, source = profile.kind, f"profile {profile.name} is for"
+    else:
+        detected, source = detect_kind(read_columns(file_path)), "its columns look like"
+    if detected is None:
+        raise ValueError(f"{file_path} has neither supplier (email/phone) nor product (sku/price_min) columns")
+    if detected != kind:
+        raise ValueError(f"{file_path} was given as --{kind} but {source} {detected}; use --{detected}")
+
+
+def _report_errors(errors: dict) -> None:
+    """Print rejected-row counts per error code with one example each."""
+    for code, count in sorted(errors["by_code"].items(), key=lambda item: -item[1]):
+        samples = errors["samples"].get(code) or [{}]
+        print(f"  ❌ {code}: {count} rows (e.g. row {samples[0].get('row')}: {samples[0].get('values')})")
+    if errors["reject_file"] and errors["rejected"]:
+        print(f"  📝 Rejected rows written to {errors['reject_file']}")
+
+
+async def _ingest_file(
     engine,
+    kind: str,
     file_path: str,
-) -> dict[str, uuid4]:
+    chunk_rows: int,
+    resume: bool,
+    **options,
+) -> int:
     """
-    Ingest suppliers from CSV file.
-    Returns mapping of supplier names to IDs.
+    Load one file as a checkpointed job. Each chunk is committed to the
+    database before its checkpoint, so a crash replays at most one chunk;
+    replayed rows match on natural key and content hash and are skipped.
+    `options` (spill_path, reject_path, profile) are passed to process_file.
+    Raises ValueError before any job is created if the file is not `kind`.
     """
-    print(f"📂 Loading suppliers from: {file_path}")
-
-    df = pd.read_csv(file_path)
-    supplier_map = {}
-
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-    async with async_session() as session:
-        for _, row in df.iterrows():
-            name = row.get("name", "").strip()
-            if not name:
-                continue
-
-            # Check if supplier exists
-            result = await session.execute(
-                text("SELECT id FROM suppliers WHERE LOWER(name) = LOWER(:name)"),
-                {"name": name},
+    _check_kind(kind, file_path, options.get("profile"))
+
+    store = JobStore()
+    job = store.find_resumable(file_path) if resume else None
+    if job is not None:
+        if job.fingerprint != file_fingerprint(file_path):
+            store.close()
+            raise ValueError(f"{file_path} changed since job {job.id} started; rerun without --resume")
+        if job.chunk_rows != chunk_rows or job.kind != kind:
+            store.close()
+            raise ValueError(f"Job {job.id} used {job.kind} with --chunk-rows {job.chunk_rows}; resume with the same")
+        if job.chunks_committed and options.get("spill_path"):
+            store.close()
+            raise ValueError(
+                f"Job {job.id} cannot resume into a spill file; rerun without --resume to rebuild "
+                f"{options['spill_path']}, or without --spill-dir"
             )
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                supplier_map[name] = existing
-                print(f"  ↳ Found: {name}")
-                continue
-
-            # Create new supplier
-            contact = {
-                "email": row.get("email"),
-                "phone": row.get("phone"),
-                "linkedin": row.get("linkedin"),
-            }
-
-            supplier = Supplier(
-                id=uuid4(),
-                name=name,
-                contact_json=contact,
-                verification_score=float(row.get("verification_score", 0.0)),
+        print(f"↩️  Resuming job {job.id} at chunk {job.chunks_committed} "
+              f"({job.rows_committed} rows already committed)")
+    else:
+        job = store.create(file_path, kind, chunk_rows)
+
+    started = time.perf_counter()
+    try:
+        async with BulkLoader(engine) as loader:
+            writer = loader.write_suppliers if kind == "suppliers" else loader.write_products
+            stats = await IngestionService().process_file(
+                file_path,
+                None,
+                writer=writer,
+                chunk_rows=chunk_rows,
+                start_chunk=job.chunks_committed,
+                on_chunk=lambda cs: store.checkpoint(job, cs.index, cs.rows, cs.written),
+                **options,
             )
-            session.add(supplier)
-            await session.flush()
-            supplier_map[name] = supplier.id
-            print(f"  ➕ Created: {name}")
+        store.finish(job)
+    except BaseException as e:
+        store.finish(job, error=str(e) or type(e).__name__)
+        print(f"💾 Job {job.id} stopped after chunk {job.chunks_committed}; rerun with --resume")
+        raise
+    finally:
+        store.close()
 
-        await session.commit()
+    _report(kind.capitalize(), stats, loader, time.perf_counter() - started)
+    return int(loader.stats["inserted"])
 
-    print(f"\n✅ Processed {len(supplier_map)} suppliers")
-    return supplier_map
+
+async def ingest_suppliers(
+    engine,
+    file_path: str,
+    chunk_rows: int = settings.ingest_chunk_rows,
+    resume: bool = False,
+    **options,
+) -> int:
+    """
+    Bulk-load suppliers from a CSV, Parquet, Arrow or NDJSON file.
+    Returns the number of suppliers inserted.
+    """
+    print(f"📂 Loading suppliers from: {file_path}")
+    return await _ingest_file(engine, "suppliers", file_path, chunk_rows, resume, **options)
 
 
 async def ingest_products(
     engine,
     file_path: str,
-    supplier_map: dict[str, uuid4],
+    chunk_rows: int = settings.ingest_chunk_rows,
+    resume: bool = False,
+    **options,
 ) -> int:
     """
-    Ingest products from CSV file.
+    Bulk-load products from a CSV, Parquet, Arrow or NDJSON file.
+    Suppliers are matched by name against the suppliers table.
+    Returns the number of products inserted.
     """
     print(f"\n📂 Loading products from: {file_path}")
+    return await _ingest_file(engine, "products", file_path, chunk_rows, resume, **options)
 
-    df = pd.read_csv(file_path)
-    count = 0
 
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+def artifact_path(directory: Optional[str], file_path: str, suffix: str) -> Optional[str]:
+    """Path for a per-input artifact (spill, rejects) under `directory`, if given."""
+    if not directory:
+        return None
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    return str(Path(directory) / f"{Path(file_path).stem}{suffix}")
 
-    async with async_session() as session:
-        for _, row in df.iterrows():
-            supplier_name = row.get("supplier_name")
-            if not supplier_name or supplier_name not in supplier_map:
-                print(f"  ⚠️  Skipping: unknown supplier '{supplier_name}'")
-                continue
-
-            supplier_id = supplier_map[supplier_name]
-
-            # Check if product exists
-            sku = row.get("sku", "").strip()
-            result = await session.execute(
-                text("SELECT id FROM products WHERE supplier_id = :supplier_id AND sku_data->>'sku' = :sku"),
-                {"supplier_id": str(supplier_id), "sku": sku},
-            )
-            if result.scalar_one_or_found():
-                print(f"  ↳ Found: {sku}")
-                continue
-
-            price_range = {
-                "min": float(row.get("price_min", 0)),
-                "max": float(row.get("price_max", 0)),
-                "currency": row.get("currency", "USD"),
-            }
-
-            sku_data = {
-                "sku": sku,
-                "name": row.get("product_name"),
-                "category": row.get("category"),
-            }
-
-            product = Product(
-                id=uuid4(),
-                supplier_id=supplier_id,
-                sku_data=sku_data,
-                price_range=price_range,
-            )
-            session.add(product)
-            count += 1
-            print(f"  ➕ Created: {sku}")
 
-        await session.commit()
+def file_options(args, file_path: str, profile: Optional[ProfilePlan] = None) -> dict:
+    """process_file options for one input from the command line."""
+    return {
+        "spill_path": artifact_path(args.spill_dir, file_path, ".clean.parquet"),
+        "reject_path": artifact_path(args.reject_dir, file_path, ".rejects.csv"),
+        "profile": profile,
+    }
+
+
+def print_jobs(limit: int = 20) -> None:
+    """Print recent ingestion jobs and their checkpoints."""
+    store = JobStore()
+    jobs = store.list(limit)
+    store.close()
 
-    print(f"\n✅ Created {count} products")
-    return count
+    if not jobs:
+        print("No ingestion jobs recorded")
+        return
+    print(f"{'JOB':36}  {'KIND':9}  {'STATUS':9}  {'CHUNKS':>6}  {'ROWS':>10}  {'COMMITTED':>10}  FILE")
+    for job in jobs:
+        print(f"{job.id:36}  {job.kind:9}  {job.status:9}  {job.chunks_committed:>6}  "
+              f"{job.rows_processed:>10}  {job.rows_committed:>10}  {job.file_path}")
+        if job.error:
+            print(f"  ❌ {job.error}")
+
+
+async def ingest_inputs(
+    engine,
+    patterns: list[str],
+    workers: int,
+    writers: int,
+    shard_mb: int,
+) -> None:
+    """
+    Ingest many files (or one large file in byte-range shards) with a
+    process pool for parsing and validation.
+    """
+    print(f"\n📂 Loading inputs: {' '.join(patterns)}")
+
+    orchestrator = IngestOrchestrator(
+        engine,
+        workers=workers or None,
+        writers=writers,
+        shard_bytes=shard_mb * 1024 * 1024,
+    )
+    report = await orchestrator.run(patterns)
+
+    print(f"\n✅ {report.files} files, {report.shards} shards "
+          f"({orchestrator.workers} workers, {orchestrator.writers} writers)")
+    for kind, counts in report.by_kind.items():
+        print(f"  {kind}: {counts['processed']} rows, {counts['inserted']} inserted, "
+              f"{counts['invalid']} invalid, {counts['duplicates']} duplicates")
+    if report.unknown_supplier:
+        print(f"  ⚠️  Skipped {report.unknown_supplier} rows for unknown suppliers")
+    summary = report.to_dict()
+    _report_errors(summary["errors"])
+    print(f"  ⏱️  {summary['rows_per_second']:,} rows/s overall")
+    print("  ⏱️  " + ", ".join(f"{stage} {secs:.2f}s" for stage, secs in summary["timings"].items()))
 
 
 async def create_demo_api_key(engine) -> str:
@@ -180,9 +268,50 @@ async def create_demo_api_key(engine) -> str:
 
 async def main():
     parser = argparse.ArgumentParser(description="Ingest CSV data into TensorMarketData")
-    parser.add_argument("--suppliers", type=str, help="Path to suppliers CSV file")
-    parser.add_argument("--products", type=str, help="Path to products CSV file")
+    parser.add_argument("--suppliers", type=str, help="Path to suppliers file (.csv, .parquet, .arrow, .ndjson)")
+    parser.add_argument("--products", type=str, help="Path to products file (.csv, .parquet, .arrow, .ndjson)")
+    parser.add_argument(
+        "--input",
+        nargs="+",
+        metavar="PATH",
+        help="Files, directories or glob patterns to ingest in parallel",
+    )
+    parser.add_argument("--workers", type=int, default=0, help="Parse/validate processes for --input (0 = one per CPU)")
+    parser.add_argument("--writers", type=int, default=2, help="Concurrent database writers for --input")
+    parser.add_argument(
+        "--shard-mb",
+        type=int,
+        default=settings.ingest_shard_bytes // (1024 * 1024),
+        help="Split --input files into byte ranges of about this size",
+    )
     parser.add_argument("--demo-key", action="store_true", help="Create demo API key")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted --suppliers/--products load from its last committed chunk",
+    )
+    parser.add_argument("--status", action="store_true", help="Show recent ingestion jobs and exit")
+    parser.add_argument(
+        "--spill-dir",
+        type=str,
+        help="Also write cleaned rows to <dir>/<name>.clean.parquet for later re-runs",
+    )
+    parser.add_argument(
+        "--reject-dir",
+        type=str,
+        help="Write every rejected row with its error codes to <dir>/<name>.rejects.csv",
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        help="YAML/JSON ingestion profile mapping the file's columns to --suppliers or --products fields",
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=settings.ingest_chunk_rows,
+        help="Rows per streamed chunk",
+    )
     parser.add_argument(
         "--database-url",
         type=str,
@@ -192,11 +321,25 @@ async def main():
 
     args = parser.parse_args()
 
-    if not any([args.suppliers, args.products, args.demo_key]):
+    if args.status:
+        print_jobs()
+        return 0
+
+    if not any([args.suppliers, args.products, args.input, args.demo_key]):
         parser.print_help()
-        print("\n❌ Error: Must specify --suppliers, --products, or --demo-key")
+        print("\n❌ Error: Must specify --suppliers, --products, --input, or --demo-key")
         return 1
 
+    profiles = {}
+    if args.profile:
+        try:
+            profile = load_profile(args.profile)
+        except (ImportError, OSError, ValueError) as e:
+            print(f"\n❌ Error: Could not load profile {args.profile}: {e}")
+            return 1
+        profiles[profile.kind] = profile
+        print(f"🧭 Using {profile.kind} profile '{profile.name}' ({len(profile.fields)} fields)")
+
     # Connect to database
     print("🔌 Connecting to database...")
     engine = create_async_engine(args.database_url, echo=False)
@@ -206,15 +349,21 @@ async def main():
         async with engine.begin() as conn:
             await conn.run_sync(__import__("app.core.database", fromlist=["Base"]).Base.metadata.create_all)
 
-        supplier_map = {}
-
         # Ingest suppliers
         if args.suppliers:
-            supplier_map = await ingest_suppliers(engine, args.suppliers)
+            await ingest_suppliers(
+                engine, args.suppliers, args.chunk_rows, args.resume, **file_options(args, args.suppliers, profiles.get("suppliers"))
+            )
 
         # Ingest products
         if args.products:
-            await ingest_products(engine, args.products, supplier_map)
+            await ingest_products(
+                engine, args.products, args.chunk_rows, args.resume, **file_options(args, args.products, profiles.get("products"))
+            )
+
+        # Ingest directories / globs in parallel
+        if args.input:
+            await ingest_inputs(engine, args.input, args.workers, args.writers, args.shard_mb)
 
         # Create demo key
         if args.demo_key:
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Import-time Profiler for TensorMarketData.
+Runs `python -X importtime` in a fresh interpreter, prints a per-module
+breakdown and fails when cold startup exceeds the configured budget.
+Usage: python scripts/profile_imports.py [--module app.main] [--budget-ms 2000] [--top 25]
+"""
+
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.core.config import settings
+
+
+def run_importtime(module: str) -> list[tuple[str, int, int, int]]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+    Returns (name, self_us, cumulative_us, depth) per imported module.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Profile cold import time")
+    parser.add_argument("--module", default="app.main", help="Module to import")
+    parser.add_argument("--budget-ms", type=int, default=settings.import_budget_ms, help="Fail above this total")
+    parser.add_argument("--top", type=int, default=25, help="Number of modules to list")
+    parser.add_argument("--runs", type=int, default=3, help="Take the best of N runs")
+    args = parser.parse_args()
+
+    # Best of N smooths out disk cache noise
+    best = None
+    for _ in range(args.runs):
+        entries = run_importtime(args.module)
+        total = next(cum for name, _, cum, _ in entries if name == args.module)
+        if best is None or total < best[0]:
+            best = (total, entries)
+
+    total_us, entries = best
+
+    print(f"📦 Import profile for {args.module} (best of {args.runs})")
+    print(f"\n  Top {args.top} modules by self time:")
+    print(f"  {'self ms':>9} {'cumul ms':>9}  module")
+    for name, self_us, cumulative_us, _ in sorted(entries, key=lambda e: -e[1])[:args.top]:
+        print(f"  {self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}  {name}")
+
+    packages: dict[str, int] = defaultdict(int)
+    for name, self_us, _, _ in entries:
+        packages[name.split(".")[0]] += self_us
+
+    print("\n  Self time by top-level package:")
+    for package, self_us in sorted(packages.items(), key=lambda p: -p[1])[:args.top]:
+        print(f"  {self_us / 1000:9.1f}  {package}")
+
+    total_ms = total_us / 1000
+    print(f"\n  Total: {total_ms:.1f} ms ({len(entries)} modules), budget {args.budget_ms} ms")
+
+    if total_ms > args.budget_ms:
+        print(f"\n❌ Startup import budget exceeded by {total_ms - args.budget_ms:.1f} ms")
+        return 1
+
+    print("\n✅ Within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Validation Rule Profiler for TensorMarketData.
+Runs a compiled rule set over a dataset row-wise (validate_record) and
+column-wise (validate_frame) and prints, per rule, values checked,
+rejection rate and time spent, most expensive first.
+Usage: python scripts/profile_rules.py [--rows 200000] [--input suppliers.csv] [--rule-set suppliers]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.validation.rules import RULE_SETS, SUPPLIER_FIELDS, RuleSet, get_rule_set
+from bench_dedupe import make_suppliers
+
+
+def print_report(rules: RuleSet, label: str, seconds: float, rows: int) -> None:
+    print(f"\n📊 {label}: {seconds:.2f}s, {rows / seconds:,.0f} rows/s")
+    print(f"  {'rule':<28} {'calls':>10} {'rejected':>9} {'seconds':>9} {'us/call':>8}")
+    for row in rules.report():
+        print(f"  {row['rule']:<28} {row['calls']:>10,} {row['hit_rate']:>9.1%} "
+              f"{row['seconds']:>9.3f} {row['us_per_call']:>8.2f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Profile per-rule validation cost")
+    parser.add_argument("--rows", type=int, default=200_000, help="Synthetic suppliers when no --input is given")
+    parser.add_argument("--input", type=str, help="CSV of supplier records")
+    parser.add_argument("--rule-set", choices=sorted(RULE_SETS), default="suppliers", help="Rule set to profile")
+    args = parser.parse_args()
+
+    if args.input:
+        df = pd.read_csv(args.input, dtype=str, keep_default_na=False)
+    else:
+        df = pd.DataFrame(make_suppliers(args.rows, 0.1)[0])
+    rules = get_rule_set(args.rule_set)
+    fields = SUPPLIER_FIELDS if args.rule_set == "suppliers" else None
+    fields = {key: field for key, field in (fields or {f: f for f in rules.pipelines}).items() if key in df.columns}
+    if not fields:
+        print(f"❌ No columns of {list(df.columns)} match the {args.rule_set} rule set")
+        return 1
+    print(f"📝 {len(df):,} rows, fields: {', '.join(fields)}")
+
+    records = df[list(fields)].to_dict("records")
+    rules.reset_stats()
+    start = time.perf_counter()
+    for record in records:
+        rules.validate_record(record, fields)
+    print_report(rules, "row-wise", time.perf_counter() - start, len(df))
+
+    rules.reset_stats()
+    start = time.perf_counter()
+    rules.validate_frame(df, fields)
+    print_report(rules, "column-wise", time.perf_counter() - start, len(df))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
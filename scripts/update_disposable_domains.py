@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Disposable Domain List Updater for TensorMarketData.
+Merges the disposable-email-domains blocklist into the bundled
+app/services/validation/disposable_domains.txt. Domains already in the
+bundled file are kept, so local additions survive an update; pass
+--replace to start from the blocklist alone.
+Usage: python scripts/update_disposable_domains.py [--source URL_OR_FILE] [--replace]
+"""
+
+import argparse
+import sys
+import urllib.request
+from datetime import date
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.validation.deliverability import DISPOSABLE_DOMAINS_FILE
+
+UPSTREAM = (
+    "https://raw.githubusercontent.com/disposable-email-domains/"
+    "disposable-email-domains/main/disposable_email_blocklist.conf"
+)
+
+HEADER = """\
+# Disposable / temporary email providers, one domain per line.
+# Subdomains of a listed domain are also treated as disposable.
+# Extend with settings.disposable_domains_path for a larger list.
+#
+# Generated by scripts/update_disposable_domains.py from the
+# disposable-email-domains blocklist
+# (https://github.com/disposable-email-domains/disposable-email-domains,
+# {source}) merged with the domains listed here before.
+# That list is distributed under the MIT License:
+#
+# Copyright (c) 2016 Dustin Ingram
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+
+
+def read_domains(text: str) -> set:
+    """Lower-cased domains of a one-per-line list, skipping comments and blanks."""
+    domains = set()
+    for line in text.splitlines():
+        line = line.strip().lower()
+        if line and not line.startswith("#"):
+            domains.add(line)
+    return domains
+
+
+def fetch(source: str) -> str:
+    """Text of a URL or local file."""
+    if source.startswith(("http://", "https://")):
+        with urllib.request.urlopen(source, timeout=30) as response:
+            return response.read().decode("utf-8")
+    return Path(source).read_text()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Update the bundled disposable email domain list")
+    parser.add_argument("--source", default=UPSTREAM, help="Blocklist URL or file, one domain per line")
+    parser.add_argument("--replace", action="store_true", help="Drop bundled domains missing from the source")
+    parser.add_argument("--output", default=str(DISPOSABLE_DOMAINS_FILE), help="List file to write")
+    args = parser.parse_args()
+
+    try:
+        upstream = read_domains(fetch(args.source))
+    except OSError as e:
+        print(f"❌ Could not read {args.source}: {e}")
+        return 1
+    if not upstream:
+        print(f"❌ {args.source} lists no domains; keeping {args.output}")
+        return 1
+
+    output = Path(args.output)
+    bundled = read_domains(output.read_text()) if output.exists() and not args.replace else set()
+    domains = sorted(upstream | bundled)
+    source = f"fetched {date.today().isoformat()}"
+    output.write_text(HEADER.format(source=source) + "\n".join(domains) + "\n")
+
+    print(f"✅ {len(domains):,} domains written to {output} "
+          f"({len(upstream - bundled):,} new, {len(bundled - upstream):,} kept from the bundled list)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
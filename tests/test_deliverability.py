@@ -0,0 +1,145 @@
+"""
+DeliverabilityChecker against StaticResolver: no network, lookups
+counted per domain.
+"""
+
+import asyncio
+
+from app.services.validation import deliverability
+from app.services.validation.deliverability import DeliverabilityChecker, StaticResolver
+
+
+def make_checker(resolver, **kwargs) -> DeliverabilityChecker:
+    kwargs.setdefault("timeout", 1.0)
+    return DeliverabilityChecker(resolver, concurrency=4, ttl=3600, negative_ttl=300, cache_size=100, **kwargs)
+
+
+class SlowResolver(StaticResolver):
+    """Never answers MX queries for `slow`, so they time out."""
+
+    def __init__(self, slow, **kwargs):
+        super().__init__(**kwargs)
+        self.slow = slow
+
+    async def mx(self, domain):
+        if domain == self.slow:
+            self.lookups[domain] = self.lookups.get(domain, 0) + 1
+            await asyncio.sleep(10)
+        return await super().mx(domain)
+
+
+def test_one_lookup_per_domain():
+    resolver = StaticResolver(mx={"example.com": ["mx1.example.com"], "acme.io": ["mail.acme.io"]})
+    checker = make_checker(resolver)
+    emails = ["a@example.com", "B@Example.COM", None, "", "c@acme.io", "d@example.com", "e@acme.io"]
+
+    statuses = asyncio.run(checker.check_emails(emails))
+
+    assert resolver.lookups == {"example.com": 1, "acme.io": 1}
+    assert checker.stats["lookups"] == 2
+    assert statuses[2] is None and statuses[3] is None
+    assert statuses[0] is statuses[1]
+    assert [s.domain for s in statuses if s] == ["example.com", "example.com", "acme.io", "example.com", "acme.io"]
+
+
+def test_mx_then_implicit_mx_then_nxdomain():
+    resolver = StaticResolver(
+        mx={"mail.com": ["mx2.mail.com", "mx1.mail.com"], "bare.com": []},
+        addresses={"webonly.com": ["192.0.2.10"], "bare.com": []},
+    )
+    checker = make_checker(resolver)
+
+    statuses = asyncio.run(checker.check_domains(["mail.com", "webonly.com", "bare.com", "missing.com"]))
+
+    assert (statuses["mail.com"].deliverable, statuses["mail.com"].reason) == (True, "mx")
+    assert statuses["mail.com"].mx == ["mx2.mail.com", "mx1.mail.com"]
+    assert (statuses["webonly.com"].deliverable, statuses["webonly.com"].reason) == (True, "implicit_mx")
+    assert (statuses["bare.com"].deliverable, statuses["bare.com"].reason) == (False, "no_mail_records")
+    assert (statuses["missing.com"].deliverable, statuses["missing.com"].reason) == (False, "nxdomain")
+
+
+def test_negative_answers_expire_before_positive(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(deliverability.time, "monotonic", lambda: clock[0])
+    resolver = StaticResolver(mx={"good.com": ["mx.good.com"]})
+    checker = make_checker(resolver)
+
+    asyncio.run(checker.check_domains(["good.com", "gone.com"]))
+    clock[0] += 299
+    asyncio.run(checker.check_domains(["good.com", "gone.com"]))
+    assert resolver.lookups == {"good.com": 1, "gone.com": 1}
+
+    clock[0] += 2  # Past the negative TTL only
+    asyncio.run(checker.check_domains(["good.com", "gone.com"]))
+    assert resolver.lookups == {"good.com": 1, "gone.com": 2}
+    assert checker.stats["cache_hits"] == 3
+
+
+def test_timeouts_are_not_cached():
+    resolver = SlowResolver("slow.com", mx={"slow.com": ["mx.slow.com"]})
+    checker = make_checker(resolver, timeout=0.05)
+
+    first = asyncio.run(checker.check_domain("slow.com"))
+    second = asyncio.run(checker.check_domain("slow.com"))
+
+    assert (first.deliverable, first.reason) == (None, "timeout")
+    assert second.reason == "timeout"
+    assert resolver.lookups["slow.com"] == 2
+    assert checker.stats["cache_hits"] == 0
+
+    resolver.slow = None
+    assert asyncio.run(checker.check_domain("slow.com")).reason == "mx"
+
+
+def test_concurrent_checks_share_one_lookup():
+    resolver = StaticResolver(mx={"shared.com": ["mx.shared.com"]}, delay=0.05)
+    checker = make_checker(resolver)
+
+    async def run():
+        return await asyncio.gather(*(checker.check_domain("Shared.com.") for _ in range(20)))
+
+    statuses = asyncio.run(run())
+
+    assert resolver.lookups == {"shared.com": 1}
+    assert checker.stats["lookups"] == 1
+    assert all(status is statuses[0] for status in statuses)
+    assert checker._inflight == {}
+
+
+def test_cancelled_caller_does_not_cancel_shared_lookup():
+    resolver = StaticResolver(mx={"shared.com": ["mx.shared.com"]}, delay=0.05)
+    checker = make_checker(resolver)
+
+    async def run():
+        first = asyncio.ensure_future(checker.check_domain("shared.com"))
+        second = asyncio.ensure_future(checker.check_domain("shared.com"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()).reason == "mx"
+    assert resolver.lookups == {"shared.com": 1}
+
+
+def test_disposable_domains_and_subdomains_skip_dns():
+    resolver = StaticResolver(mx={"mailinator.com": ["mx.mailinator.com"], "xmailinator.com": ["mx.example"]})
+    checker = make_checker(resolver)
+
+    statuses = asyncio.run(checker.check_emails([
+        "x@mailinator.com",
+        "x@inbox.MAILINATOR.com",
+        "x@a.b.guerrillamail.com",
+        "x@xmailinator.com",
+    ]))
+
+    assert [(s.deliverable, s.reason) for s in statuses[:3]] == [(False, "disposable")] * 3
+    assert statuses[3].reason == "mx"
+    assert resolver.lookups == {"xmailinator.com": 1}
+
+
+def test_is_disposable_matches_whole_labels():
+    domains = frozenset({"tempmail.dev"})
+    assert deliverability.is_disposable("tempmail.dev", domains)
+    assert deliverability.is_disposable("x.y.TempMail.dev", domains)
+    assert not deliverability.is_disposable("mytempmail.dev", domains)
+    assert not deliverability.is_disposable("dev", domains)